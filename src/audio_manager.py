@@ -1,9 +1,14 @@
 # Copyright (c) 2025. All rights reserved.
 """Audio device management and playback functionality."""
 
+import functools
+import os
+import queue
+import re
+import threading
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 import numpy as np
 import sounddevice as sd
@@ -17,7 +22,7 @@ from rich.progress import (
 )
 from rich.table import Table
 
-from .cache import CachedAudio, LRUAudioCache
+from .cache import CachedAudio, DecodedAudioStore, LRUAudioCache, file_mtime_ns
 from .exceptions import (
     AudioFileCorruptedError,
     DeviceDisconnectedError,
@@ -25,21 +30,65 @@ from .exceptions import (
     DeviceNotFoundError,
 )
 from .logging_config import get_logger
-from .validators import validate_device
+from .validators import WavLayout, read_wav_layout, validate_device
 
 logger = get_logger(__name__)
 
+# Substrings identifying virtual audio cable devices (matched case-insensitively)
+VIRTUAL_CABLE_KEYWORDS = ("cable", "virtual", "vb-audio", "voicemeeter")
+_VIRTUAL_CABLE_PATTERN = re.compile("|".join(re.escape(keyword) for keyword in VIRTUAL_CABLE_KEYWORDS))
+
+
+_devices_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _enumerate_devices() -> tuple[tuple[Any, ...], tuple[str, ...]]:
+    """Enumerate audio devices, memoized until AudioManager.refresh_devices().
+
+    Returns:
+        Tuple of (device info dicts indexed by device ID, lowercased device names).
+
+    """
+    devices = tuple(sd.query_devices())  # pyright: ignore[reportArgumentType]
+    # Lowercase names once per enumeration rather than on every scan
+    return devices, tuple(str(device["name"]).lower() for device in devices)
+
+
+def _cached_devices() -> tuple[tuple[Any, ...], tuple[str, ...]]:
+    """Enumerate audio devices once per process.
+
+    lru_cache alone lets concurrent first calls each enumerate, so callers are
+    serialized: one racing the CLI's background prewarm waits for its result.
+
+    Returns:
+        Tuple of (device info dicts indexed by device ID, lowercased device names).
+
+    """
+    with _devices_lock:
+        return _enumerate_devices()
+
 
 class AudioManager:
     """Manages audio devices and playback operations."""
 
     DEFAULT_CACHE_SIZE_MB = 100
+    # Uncached files whose decoded size exceeds this are streamed from disk in blocks
+    STREAM_THRESHOLD_MB = 32
+    STREAM_BLOCK_FRAMES = 4096
+    STREAM_QUEUE_BLOCKS = 16
+    # WAV encodings read straight from the file: (format tag, bits) -> (dtype, scale to [-1, 1))
+    WAV_MAPPED_FORMATS: ClassVar[dict[tuple[int, int], tuple[str, float]]] = {
+        (0x0001, 16): ("<i2", 1 / 32768),
+        (0x0003, 32): ("<f4", 1.0),
+    }
 
     def __init__(
         self,
         console: Console | None = None,
         cache_enabled: bool = True,
         cache_size_mb: int | None = None,
+        decoded_store: DecodedAudioStore | None = None,
     ) -> None:
         """Initialize the AudioManager.
 
@@ -47,20 +96,47 @@ class AudioManager:
             console: Rich console for output (creates new if None)
             cache_enabled: Whether to enable audio caching (default: True)
             cache_size_mb: Maximum cache size in MB (default: 100)
+            decoded_store: On-disk store of decoded compressed audio (disabled if None)
 
         """
         self.console = console or Console()
-        self.current_stream = None
+        self.current_stream: sd.RawOutputStream | None = None
         self.output_device_id: int | None = None
         self.volume: float = 1.0
 
+        # Persistent output stream state; the callback reads _playback_data from _playback_pos
+        self._stream_config: tuple[int | None, int, int] | None = None
+        self._playback_lock = threading.Lock()
+        self._playback_data: np.ndarray | None = None
+        self._playback_pos = 0
+        # Set while a large file streams; the callback pulls decoded blocks from the queue
+        self._playback_queue: queue.Queue[np.ndarray | None] | None = None
+        self._reader_stop: threading.Event | None = None
+
         # Caching setup
         self.cache_enabled = cache_enabled
         cache_size = (cache_size_mb or self.DEFAULT_CACHE_SIZE_MB) * 1024 * 1024
         self._cache = LRUAudioCache(max_size_bytes=cache_size)
+        self.decoded_store = decoded_store
 
         logger.debug(f"AudioManager initialized (cache_enabled={cache_enabled})")
 
+    @staticmethod
+    def _devices() -> tuple[Any, ...]:
+        """Return the cached device enumeration, querying PortAudio on first use.
+
+        Returns:
+            Tuple of device info dicts, indexed by device ID.
+
+        """
+        return _cached_devices()[0]
+
+    @staticmethod
+    def refresh_devices() -> None:
+        """Discard the cached device list so the next lookup re-enumerates devices."""
+        _enumerate_devices.cache_clear()
+        logger.debug("Device cache cleared")
+
     def list_devices(self):  # noqa: ANN201
         """List all available audio devices.
 
@@ -68,7 +144,7 @@ class AudioManager:
             Device list from sounddevice query.
 
         """
-        return sd.query_devices()
+        return list(self._devices())
 
     def find_virtual_cable(self) -> int | None:
         """Find VB-Cable or similar virtual audio device.
@@ -77,18 +153,36 @@ class AudioManager:
             The device ID if found, None otherwise.
 
         """
-        devices = self.list_devices()
-        keywords = ["cable", "virtual", "vb-audio", "voicemeeter"]
-
-        for idx in range(len(devices)):
-            device = sd.query_devices(idx)
-            device_name = str(device["name"]).lower()  # pyright: ignore[reportArgumentType, reportCallIssue]
-            if any(keyword in device_name for keyword in keywords) and device["max_output_channels"] > 0:  # pyright: ignore[reportArgumentType, reportCallIssue]
+        devices, device_names_lower = _cached_devices()
+        for idx, device_name in enumerate(device_names_lower):
+            if devices[idx]["max_output_channels"] > 0 and _VIRTUAL_CABLE_PATTERN.search(device_name):
                 return idx
         return None
 
     def print_devices(self) -> None:
-        """Print all audio devices with their IDs in a formatted table."""
+        """Print all audio devices with their IDs.
+
+        Renders a formatted table on a terminal; when output is piped, writes
+        plain tab-separated rows instead of paying for table layout.
+        """
+        selected_id = self.output_device_id
+        rows = [
+            (
+                str(idx),
+                str(device["name"]),
+                str(device["max_input_channels"]),
+                str(device["max_output_channels"]),
+                "SELECTED" if selected_id == idx else "",
+            )
+            for idx, device in enumerate(self._devices())
+        ]
+
+        if not self.console.is_terminal:
+            lines = ["ID\tDevice Name\tInputs\tOutputs\tStatus"]
+            lines.extend("\t".join(row).rstrip("\t") for row in rows)
+            self.console.file.write("\n".join(lines) + "\n")
+            return
+
         table = Table(
             title="Available Audio Devices",
             show_header=True,
@@ -100,18 +194,9 @@ class AudioManager:
         table.add_column("Outputs", justify="center", width=8)
         table.add_column("Status", justify="center", width=10)
 
-        devices = self.list_devices()
-        for idx in range(len(devices)):
-            device = sd.query_devices(idx)
-            status = "[green]SELECTED[/green]" if self.output_device_id == idx else ""
-
-            table.add_row(
-                str(idx),
-                str(device["name"]),  # pyright: ignore[reportArgumentType, reportCallIssue]
-                str(device["max_input_channels"]),  # pyright: ignore[reportArgumentType, reportCallIssue]
-                str(device["max_output_channels"]),  # pyright: ignore[reportArgumentType, reportCallIssue]
-                status,
-            )
+        add_row = table.add_row
+        for idx, name, inputs, outputs, status in rows:
+            add_row(idx, name, inputs, outputs, f"[green]{status}[/green]" if status else "")
 
         self.console.print(table)
 
@@ -126,7 +211,7 @@ class AudioManager:
 
         """
         try:
-            device_info = validate_device(device_id)
+            device_info = validate_device(device_id, self._devices())
             self.output_device_id = device_id
         except DeviceNotFoundError as e:
             logger.warning(f"Device not found: {e}")
@@ -161,99 +246,232 @@ class AudioManager:
         """Adjust audio channels to match the output device.
 
         Args:
-            data: Audio data array
+            data: Audio data array of shape (frames, channels)
             max_channels: Target number of channels
 
         Returns:
-            Adjusted audio data array
+            Adjusted audio data array. Mono upmixes are a read-only broadcast
+            view of the input; callers scale out of place, so no copy is made.
 
         """
-        if data.shape[1] < max_channels:
-            # Duplicate channels to fill as much as possible
-            tile_count = max_channels // data.shape[1]
-            data = np.tile(data, (1, tile_count))
-
-            # If we still don't have enough channels (e.g. 2 -> 5), pad with silence
-            current_channels = data.shape[1]
-            if current_channels < max_channels:
-                padding = np.zeros((data.shape[0], max_channels - current_channels))
-                data = np.hstack((data, padding))
-
-        elif data.shape[1] > max_channels:
+        frames, src_ch = data.shape
+        if src_ch == max_channels:
+            return data
+
+        if src_ch > max_channels:
             # Take only the channels we need
-            data = data[:, :max_channels]
+            return data[:, :max_channels]
+
+        if src_ch == 1:
+            # Zero-copy: every output column reads the same mono samples
+            return np.broadcast_to(data, (frames, max_channels))
 
-        return data
+        # One allocation, written once: wider sources are duplicated as many
+        # whole times as fit
+        out = np.empty((frames, max_channels), dtype=data.dtype)
+
+        repeats, remainder = divmod(max_channels, src_ch)
+        for i in range(repeats):
+            out[:, i * src_ch : (i + 1) * src_ch] = data
+        if remainder:
+            # Trailing channels (e.g. 2 -> 5) stay silent
+            out[:, repeats * src_ch :] = 0
+        return out
+
+    @staticmethod
+    def _adjust_channels_into(src: np.ndarray, dst: np.ndarray, volume: float) -> None:
+        """Channel-adjust and scale audio into a preallocated buffer.
+
+        Same channel mapping as _adjust_channels, without allocating.
+
+        Args:
+            src: Audio data array of shape (frames, channels)
+            dst: Output array of shape (frames, target channels)
+            volume: Volume multiplier
+
+        """
+        src_ch = src.shape[1]
+        max_channels = dst.shape[1]
+        if src_ch >= max_channels:
+            np.multiply(src[:, :max_channels], volume, out=dst)
+            return
+
+        repeats, remainder = divmod(max_channels, src_ch)
+        np.multiply(src, volume, out=dst[:, :src_ch])
+        for i in range(1, repeats):
+            dst[:, i * src_ch : (i + 1) * src_ch] = dst[:, :src_ch]
+        if remainder:
+            dst[:, repeats * src_ch :] = 0
+
+    def _mapped_wav_layout(self, audio_file: Path) -> WavLayout | None:
+        """Parse the header of a WAV file that _map_wav can read directly.
+
+        Args:
+            audio_file: Path to the audio file
+
+        Returns:
+            The file's WavLayout, or None if soundfile has to decode it
+            (other formats, other encodings, or a header that cannot be read)
+
+        """
+        if audio_file.suffix.lower() != ".wav":
+            return None
+        try:
+            layout = read_wav_layout(audio_file)
+        except OSError as e:
+            # Not a readable file; the soundfile path reports the failure
+            logger.debug(f"Cannot read WAV header of {audio_file.name}: {e}")
+            return None
+        if (
+            layout is None
+            or layout.frames == 0
+            or (layout.format_tag, layout.bits_per_sample) not in self.WAV_MAPPED_FORMATS
+        ):
+            return None
+        return layout
+
+    def _map_wav(self, audio_file: Path, layout: WavLayout | None = None) -> tuple[np.ndarray, int] | None:
+        """Read 16-bit PCM or 32-bit float WAV samples without libsndfile.
+
+        The data chunk is memory-mapped and converted in one vectorized pass,
+        giving the same values as sf.read. The result is a copy so the mapping
+        is released at once; a cached array must not keep the user's file
+        mapped (Windows would refuse to let it be edited or deleted).
+
+        Args:
+            audio_file: Path to the .wav file
+            layout: The file's header from _mapped_wav_layout, if already parsed
+
+        Returns:
+            Tuple of (float32 data, samplerate), or None to decode with soundfile
+
+        """
+        if layout is None and (layout := self._mapped_wav_layout(audio_file)) is None:
+            return None
+        dtype, scale = self.WAV_MAPPED_FORMATS[layout.format_tag, layout.bits_per_sample]
+        try:
+            samples = np.memmap(
+                audio_file,
+                dtype=dtype,
+                mode="r",
+                offset=layout.data_offset,
+                shape=(layout.frames, layout.channels),
+            )
+            data = np.multiply(samples, np.float32(scale), dtype=np.float32)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Falling back to soundfile for {audio_file.name}: {e}")
+            return None
+        return data, layout.sample_rate
+
+    def _read_audio(
+        self,
+        audio_file: Path,
+        source: sf.SoundFile | None = None,
+        layout: WavLayout | None = None,
+    ) -> tuple[np.ndarray, int] | None:
+        """Decode an audio file from disk.
+
+        Decodes are always float32 and 2-D (frames, channels), mono included,
+        so nothing downstream needs to reshape. Plain 16-bit and float WAV files
+        are read directly from their data chunk. With a decoded store, compressed
+        files decoded before are read back instead of decoded again.
+
+        Args:
+            audio_file: Path to the audio file
+            source: Already open handle for the file; read from and closed if given
+            layout: Parsed WAV header, if already known
+
+        Returns:
+            Tuple of (data, samplerate) or None if the file could not be read
+
+        """
+        if audio_file.suffix.lower() == ".wav" and (mapped := self._map_wav(audio_file, layout)) is not None:
+            if source is not None:
+                source.close()
+            return mapped
+
+        if self.decoded_store is not None and (stored := self.decoded_store.load(audio_file)) is not None:
+            if source is not None:
+                source.close()
+            return stored
+
+        try:
+            if source is None:
+                data, samplerate = sf.read(str(audio_file), dtype="float32", always_2d=True)  # pyright: ignore[reportGeneralTypeIssues]
+            else:
+                with source:
+                    data = source.read(dtype="float32", always_2d=True)
+                    samplerate = source.samplerate
+        except sf.LibsndfileError as e:
+            logger.exception("Failed to read audio file")
+            error = AudioFileCorruptedError(
+                f"Cannot read audio file: {audio_file.name}",
+                details={"path": str(audio_file), "error": str(e)},
+            )
+            self.console.print(f"[red]✗[/red] {error.message}")
+            self.console.print(f"[dim]💡 {error.suggestion}[/dim]")
+            return None
+
+        if self.decoded_store is not None:
+            self.decoded_store.save(audio_file, data, samplerate)
+        return data, samplerate
 
     def _load_and_prepare_audio(
         self,
         audio_file: Path,
         sound_volume: float,
+        source: sf.SoundFile | None = None,
+        mtime_ns: int | None = None,
+        layout: WavLayout | None = None,
     ) -> tuple[np.ndarray, int] | None:
         """Load and prepare audio data for playback.
 
         Args:
             audio_file: Path to the audio file
             sound_volume: Per-sound volume multiplier
+            source: Already open handle for the file, used instead of reopening it
+            mtime_ns: File modification time if already known, saving another stat
+            layout: Parsed WAV header, if already known, saving another parse
 
         Returns:
             Tuple of (data, samplerate) or None if loading failed
 
         """
         cache_key = str(audio_file)
-
-        # Try cache first
-        if self.cache_enabled:
-            cached = self._cache.get(cache_key)
-            if cached:
-                data = cached.data.copy()  # Copy to avoid modifying cached data
-                samplerate = cached.samplerate
-                logger.debug(f"Cache hit for {audio_file.name}")
-            else:
-                # Load from disk and cache
-                try:
-                    data, samplerate = sf.read(str(audio_file))  # pyright: ignore[reportGeneralTypeIssues]
-                except sf.LibsndfileError as e:
-                    logger.exception("Failed to read audio file")
-                    error = AudioFileCorruptedError(
-                        f"Cannot read audio file: {audio_file.name}",
-                        details={"path": str(audio_file), "error": str(e)},
-                    )
-                    self.console.print(f"[red]✗[/red] {error.message}")
-                    self.console.print(f"[dim]💡 {error.suggestion}[/dim]")
-                    return None
-
-                # Cache the loaded audio (store original data)
-                cached_audio = CachedAudio(
-                    data=data.copy() if isinstance(data, np.ndarray) else np.array(data),
-                    samplerate=samplerate,
-                    size_bytes=data.nbytes if isinstance(data, np.ndarray) else 0,
-                    path=audio_file,
-                )
-                self._cache.put(cache_key, cached_audio)
-                logger.debug(f"Cached {audio_file.name}")
+        if mtime_ns is None:
+            mtime_ns = file_mtime_ns(audio_file) if self.cache_enabled else 0
+        cached = self._cache.get(cache_key, mtime_ns=mtime_ns) if self.cache_enabled else None
+
+        if cached:
+            if source is not None:
+                source.close()
+            # Shared with the cache; volume scaling below never writes in place
+            data = cached.data
+            samplerate = cached.samplerate
+            logger.debug(f"Cache hit for {audio_file.name}")
         else:
-            # Load without caching
-            try:
-                data, samplerate = sf.read(str(audio_file))  # pyright: ignore[reportGeneralTypeIssues]
-
-            except sf.LibsndfileError as e:
-                logger.exception("Failed to read audio file")
-                error = AudioFileCorruptedError(
-                    f"Cannot read audio file: {audio_file.name}",
-                    details={"path": str(audio_file), "error": str(e)},
-                )
-                self.console.print(f"[red]✗[/red] {error.message}")
-                self.console.print(f"[dim]💡 {error.suggestion}[/dim]")
+            result = self._read_audio(audio_file, source, layout)
+            if result is None:
                 return None
-
-        # Ensure data is in the correct format
-        if len(data.shape) == 1:
-            data = data.reshape(-1, 1)
+            data, samplerate = result
+
+            if self.cache_enabled:
+                # Cache the decoded audio as-is; it is never modified in place
+                self._cache.put(
+                    cache_key,
+                    CachedAudio(
+                        data=data,
+                        samplerate=samplerate,
+                        size_bytes=data.nbytes,
+                        path=audio_file,
+                        mtime_ns=mtime_ns,
+                    ),
+                )
+                logger.debug(f"Cached {audio_file.name}")
 
         # Get device info to match channels
-        device_info = sd.query_devices(self.output_device_id)
-        max_channels = device_info["max_output_channels"]  # pyright: ignore[reportCallIssue, reportArgumentType]
+        device_info = self._devices()[self.output_device_id]  # pyright: ignore[reportArgumentType]
+        max_channels = device_info["max_output_channels"]
 
         logger.debug(
             f"Audio info: duration={len(data) / samplerate:.2f}s, rate={samplerate}, channels={data.shape[1]}",
@@ -263,8 +481,9 @@ class AudioManager:
         data = self._adjust_channels(data, max_channels)
 
         # Apply combined volume scaling: global x sound-specific
+        # Out-of-place so cached buffers are never modified
         final_volume = self.volume * sound_volume
-        data *= final_volume
+        data = data * final_volume
 
         return data, samplerate
 
@@ -295,50 +514,85 @@ class AudioManager:
             )
             return False
 
-        if not audio_file.exists():
+        # One stat answers both "does it exist" and "is the cached decode current";
+        # os.stat skips the pathlib wrapper on this per-playback path
+        try:
+            mtime_ns = os.stat(audio_file).st_mtime_ns
+        except OSError:
             logger.warning(f"Audio file not found: {audio_file}")
             self.console.print(f"[red]✗[/red] Audio file not found: {audio_file}")
             return False
 
-        # Verify device is still available before playback
-        try:
-            validate_device(self.output_device_id)
-        except (DeviceNotFoundError, DeviceNoOutputError) as e:
-            logger.exception("Device validation failed")
-            self.console.print(f"[red]✗[/red] {e.message}")
-            self.console.print(f"[dim]💡 {e.suggestion}[/dim]")
-            return False
+        # Verify the device against the cached enumeration before playback; a
+        # stream already running on it proves it is there without even that.
+        # A device unplugged since enumeration fails when the stream opens,
+        # which refreshes the cache for the next play.
+        if not self._stream_running_on(self.output_device_id):
+            try:
+                validate_device(self.output_device_id, self._devices())
+            except (DeviceNotFoundError, DeviceNoOutputError) as e:
+                logger.exception("Device validation failed")
+                self.refresh_devices()
+                self.console.print(f"[red]✗[/red] {e.message}")
+                self.console.print(f"[dim]💡 {e.suggestion}[/dim]")
+                return False
 
         # Stop any currently playing audio
         self.stop_audio()
 
         logger.debug(f"Loading audio file: {audio_file}")
 
-        # Load and prepare audio
-        result = self._load_and_prepare_audio(audio_file, sound_volume)
-        if result is None:
-            return False
-        data, samplerate = result
+        # Large uncached files stream from disk; everything else is decoded up front.
+        # A soundfile handle is only opened when soundfile has to read the file,
+        # and then serves both the size check and the read.
+        if self.cache_enabled and str(audio_file) in self._cache:
+            source, layout = None, None
+        else:
+            layout = self._mapped_wav_layout(audio_file)
+            source = self._open_uncached(audio_file, layout)
+        blocks: queue.Queue[np.ndarray | None] | None = None
+        if source is None or not self._should_stream(source):
+            result = self._load_and_prepare_audio(audio_file, sound_volume, source, mtime_ns, layout)
+            if result is None:
+                return False
+            data, samplerate = result
+            frames, channels = data.shape
+        else:
+            samplerate = source.samplerate
+            frames = source.frames
+            channels = self._devices()[self.output_device_id]["max_output_channels"]  # pyright: ignore[reportArgumentType]
+            blocks = self._start_reader(source, channels, self.volume * sound_volume)
 
         try:
             logger.debug(f"Starting playback to device {self.output_device_id}")
-            sd.play(data, samplerate, device=self.output_device_id)
+            self._ensure_stream(samplerate, channels)
+            with self._playback_lock:
+                if blocks is None:
+                    self._playback_data = np.ascontiguousarray(data, dtype=np.float32)
+                else:
+                    # Empty first block; the callback moves on to the queue straight away
+                    self._playback_data = np.zeros((0, channels), dtype=np.float32)
+                self._playback_pos = 0
+                self._playback_queue = blocks
 
             if blocking:
                 # Calculate duration for progress bar
-                duration_seconds = len(data) / samplerate
+                duration_seconds = frames / samplerate
 
                 if show_progress and self.console.is_terminal:
                     return self._show_progress(audio_file.name, duration_seconds)
 
                 # Use polling loop instead of sd.wait() to allow KeyboardInterrupt
-                while sd.get_stream() and sd.get_stream().active:
+                while self.is_playing():
                     time.sleep(0.1)
 
         except sd.PortAudioError as e:
+            self.stop_audio()
+            self._close_stream()
             # Device disconnection or error during playback
             if "device" in str(e).lower() or "stream" in str(e).lower():
                 logger.exception("Device error during playback")
+                self.refresh_devices()
                 error = DeviceDisconnectedError(
                     details={"device_id": self.output_device_id, "error": str(e)},
                 )
@@ -348,6 +602,7 @@ class AudioManager:
                 self.console.print(f"[red]Error:[/red] {e}")
             return False
         except (OSError, RuntimeError) as e:
+            self.stop_audio()
             logger.exception("Playback error")
             self.console.print(f"[red]Error:[/red] {e}")
             return False
@@ -357,6 +612,138 @@ class AudioManager:
             )
             return True
 
+    def _open_uncached(self, audio_file: Path, layout: WavLayout | None = None) -> sf.SoundFile | None:
+        """Open an uncached audio file that only soundfile can serve.
+
+        WAV files small enough to read directly and files with a stored
+        decode are loaded without ever opening a SoundFile.
+
+        Args:
+            audio_file: Path to the audio file
+            layout: The file's header from _mapped_wav_layout, if it can be read directly
+
+        Returns:
+            Open SoundFile, or None if the file is served another way or cannot be opened
+
+        """
+        if layout is not None:
+            if not self._exceeds_stream_threshold(layout.frames, layout.channels):
+                return None
+        elif self.decoded_store is not None and audio_file in self.decoded_store:
+            # Only full decodes are stored, so the file is known not to need streaming
+            return None
+        try:
+            return sf.SoundFile(str(audio_file))
+        except sf.LibsndfileError:
+            # The full decode path reports unreadable files
+            return None
+
+    def _should_stream(self, source: sf.SoundFile) -> bool:
+        """Check whether an open file is too large to decode in full.
+
+        Args:
+            source: Open sound file
+
+        Returns:
+            True if the decoded audio would exceed STREAM_THRESHOLD_MB
+
+        """
+        if not self._exceeds_stream_threshold(source.frames, source.channels):
+            return False
+        logger.debug(f"Streaming {source.name} ({source.frames} frames x {source.channels} channels)")
+        return True
+
+    def _exceeds_stream_threshold(self, frames: int, channels: int) -> bool:
+        """Check whether decoded audio of this size is too large to hold in full.
+
+        Args:
+            frames: Number of sample frames
+            channels: Number of channels
+
+        Returns:
+            True if the float32 decode would exceed STREAM_THRESHOLD_MB
+
+        """
+        return frames * channels * np.dtype(np.float32).itemsize > self.STREAM_THRESHOLD_MB * 1024 * 1024
+
+    def _start_reader(
+        self,
+        source: sf.SoundFile,
+        channels: int,
+        volume: float,
+    ) -> queue.Queue[np.ndarray | None]:
+        """Start a background thread decoding blocks from an open file.
+
+        Args:
+            source: Open sound file; the reader thread closes it when done
+            channels: Number of output channels
+            volume: Combined volume multiplier
+
+        Returns:
+            Bounded queue of prepared blocks, terminated by None
+
+        """
+        blocks: queue.Queue[np.ndarray | None] = queue.Queue(maxsize=self.STREAM_QUEUE_BLOCKS)
+        stop = threading.Event()
+        with self._playback_lock:
+            self._reader_stop = stop
+        threading.Thread(
+            target=self._read_blocks,
+            args=(source, channels, volume, blocks, stop),
+            name="muc-audio-reader",
+            daemon=True,
+        ).start()
+        return blocks
+
+    def _read_blocks(
+        self,
+        source: sf.SoundFile,
+        channels: int,
+        volume: float,
+        blocks: queue.Queue[np.ndarray | None],
+        stop: threading.Event,
+    ) -> None:
+        """Decode, channel-adjust and scale blocks into the queue until done or stopped.
+
+        Args:
+            source: Open sound file to read from
+            channels: Number of output channels
+            volume: Combined volume multiplier
+            blocks: Queue to fill; None marks the end of the sound
+            stop: Event set when playback is stopped
+
+        """
+
+        def put(block: np.ndarray | None) -> bool:
+            while not stop.is_set():
+                try:
+                    blocks.put(block, timeout=0.1)
+                except queue.Full:
+                    continue
+                return True
+            return False
+
+        # Blocks are recycled once they can no longer be queued or playing:
+        # the queue holds at most STREAM_QUEUE_BLOCKS, the callback one more
+        read_buf = np.empty((self.STREAM_BLOCK_FRAMES, source.channels), dtype=np.float32)
+        ring = np.empty((self.STREAM_QUEUE_BLOCKS + 2, self.STREAM_BLOCK_FRAMES, channels), dtype=np.float32)
+        slot = 0
+
+        try:
+            with source:
+                while True:
+                    frames = len(source.read(self.STREAM_BLOCK_FRAMES, dtype="float32", always_2d=True, out=read_buf))
+                    if frames == 0:
+                        break
+                    block = ring[slot, :frames]
+                    self._adjust_channels_into(read_buf[:frames], block, volume)
+                    if not put(block):
+                        return
+                    slot = (slot + 1) % len(ring)
+        except (sf.LibsndfileError, RuntimeError) as e:
+            logger.warning(f"Error streaming {source.name}: {e}")
+        put(None)
+
     def _format_time(self, seconds: float) -> str:
         """Format seconds as M:SS.
 
@@ -407,7 +794,7 @@ class AudioManager:
             start_time = time.time()
 
             try:
-                while sd.get_stream() and sd.get_stream().active:
+                while self.is_playing():
                     elapsed = time.time() - start_time
                     progress.update(
                         task,
@@ -429,14 +816,137 @@ class AudioManager:
                 )
                 return True
 
-    def stop_audio(self) -> None:
-        """Stop any currently playing audio."""
+    def _stream_callback(
+        self,
+        outdata: Any,  # noqa: ANN401
+        frames: int,
+        time_info: Any,  # noqa: ANN401, ARG002
+        status: sd.CallbackFlags,
+    ) -> None:
+        """Copy the next block of the current sound into the output buffer.
+
+        Runs on the PortAudio thread. Outputs silence when nothing is playing.
+        The raw stream hands over a plain buffer, which is viewed in place as
+        float32 frames so filling it is a straight memory copy.
+
+        Args:
+            outdata: Raw output buffer to fill (interleaved float32)
+            frames: Number of frames requested
+            time_info: Stream timing information (unused)
+            status: Stream status flags
+
+        """
+        if status:
+            logger.debug(f"Output stream status: {status}")
+        out = np.frombuffer(outdata, dtype=np.float32).reshape(frames, -1)
+        written = 0
+        with self._playback_lock:
+            # Work on locals and store the state back once at the end
+            data = self._playback_data
+            pos = self._playback_pos
+            blocks = self._playback_queue
+            while written < frames and data is not None:
+                chunk = data[pos : pos + frames - written]
+                count = len(chunk)
+                out[written : written + count] = chunk
+                written += count
+                pos += count
+                if pos < len(data):
+                    break
+
+                # Current block exhausted: move to the next streamed block, or finish
+                if blocks is None:
+                    data = None
+                    break
+                try:
+                    block = blocks.get_nowait()
+                except queue.Empty:
+                    # Reader is behind; pad with silence and retry on the next callback
+                    break
+                if block is None:
+                    data = None
+                    blocks = None
+                    break
+                data = block
+                pos = 0
+            self._playback_data = data
+            self._playback_pos = pos
+            self._playback_queue = blocks
+        if written < frames:
+            out[written:] = 0
+
+    def _stream_running_on(self, device_id: int) -> bool:
+        """Check whether the output stream is open and active on a device.
+
+        Args:
+            device_id: Output device ID
+
+        Returns:
+            True if the current stream is running on that device
+
+        """
+        stream = self.current_stream
+        config = self._stream_config
+        return stream is not None and config is not None and config[0] == device_id and bool(stream.active)
+
+    def _ensure_stream(self, samplerate: int, channels: int) -> None:
+        """Open the output stream, reusing the running one when its format matches.
+
+        Args:
+            samplerate: Sample rate of the audio to play
+            channels: Number of output channels
+
+        """
+        config = (self.output_device_id, int(samplerate), channels)
+        if self.current_stream is not None and self._stream_config == config and self.current_stream.active:
+            return
+
+        self._close_stream()
+        # Raw stream: buffers are already C-contiguous float32, so sounddevice's
+        # per-callback NumPy wrapping is skipped
+        stream = sd.RawOutputStream(
+            device=self.output_device_id,
+            samplerate=samplerate,
+            channels=channels,
+            dtype="float32",
+            callback=self._stream_callback,
+        )
+        stream.start()
+        self.current_stream = stream
+        self._stream_config = config
+        logger.debug(f"Opened output stream (device={config[0]}, rate={config[1]}, channels={config[2]})")
+
+    def _close_stream(self) -> None:
+        """Stop and close the output stream if one is open."""
+        stream = self.current_stream
+        self.current_stream = None
+        self._stream_config = None
+        if stream is None:
+            return
         try:
-            sd.stop()
-            logger.debug("Audio playback stopped")
-        except (OSError, RuntimeError) as e:
-            logger.exception("Error stopping audio")
-            self.console.print(f"[red]Error stopping audio:[/red] {e}")
+            stream.stop()
+            stream.close()
+        except (OSError, RuntimeError, sd.PortAudioError) as e:
+            logger.debug(f"Error closing output stream: {e}")
+
+    def close(self) -> None:
+        """Stop playback and release the output stream."""
+        self.stop_audio()
+        self._close_stream()
+
+    def stop_audio(self) -> None:
+        """Stop any currently playing audio.
+
+        The output stream stays open so the next sound starts without reopening the device.
+        """
+        with self._playback_lock:
+            self._playback_data = None
+            self._playback_pos = 0
+            self._playback_queue = None
+            reader_stop, self._reader_stop = self._reader_stop, None
+        if reader_stop is not None:
+            reader_stop.set()
+        logger.debug("Audio playback stopped")
 
     def is_playing(self) -> bool:
         """Check if audio is currently playing.
@@ -445,7 +955,8 @@ class AudioManager:
             True if audio is currently playing, False otherwise.
 
         """
-        return sd.get_stream().active if sd.get_stream() else False
+        stream = self.current_stream
+        return self._playback_data is not None and stream is not None and bool(stream.active)
 
     # ─────────────────────────────────────────────────────────────────────────
     # Cache Management Methods
@@ -469,6 +980,8 @@ class AudioManager:
     def clear_cache(self) -> None:
         """Clear the audio cache."""
         self._cache.clear()
+        if self.decoded_store is not None:
+            self.decoded_store.clear()
         self.console.print("[green]✓[/green] Audio cache cleared")
 
     @property
@@ -1,7 +1,13 @@
 # Copyright (c) 2025. All rights reserved.
 """Audio caching system with LRU eviction."""
 
+import contextlib
+import hashlib
+import json
+import os
+import shutil
 from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from threading import Lock
@@ -11,11 +17,28 @@ import numpy as np
 import soundfile as sf
 
 from .logging_config import get_logger
+from .validators import AudioFileInfo
 
 logger = get_logger(__name__)
 
 
-@dataclass
+def file_mtime_ns(path: Path) -> int:
+    """Get a file's modification time for cache validation.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Modification time in nanoseconds, or 0 if the file cannot be stat'ed
+
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+@dataclass(slots=True)
 class CachedAudio:
     """Cached audio data with metadata."""
 
@@ -24,6 +47,7 @@ class CachedAudio:
     size_bytes: int
     path: Path
     access_count: int = field(default=0)
+    mtime_ns: int = field(default=0)
 
     @classmethod
     def from_file(cls, path: Path) -> "CachedAudio":
@@ -36,13 +60,15 @@ class CachedAudio:
             CachedAudio instance with loaded data
 
         """
-        data, samplerate = sf.read(str(path), dtype="float32")  # pyright: ignore[reportGeneralTypeIssues]
+        mtime_ns = file_mtime_ns(path)
+        data, samplerate = sf.read(str(path), dtype="float32", always_2d=True)  # pyright: ignore[reportGeneralTypeIssues]
         size_bytes = data.nbytes
         return cls(
             data=data,
             samplerate=samplerate,
             size_bytes=size_bytes,
             path=path,
+            mtime_ns=mtime_ns,
         )
 
 
@@ -69,17 +95,23 @@ class LRUAudioCache:
 
         logger.debug(f"LRUAudioCache initialized with max size {self.max_size_bytes / (1024 * 1024):.1f} MB")
 
-    def get(self, key: str) -> CachedAudio | None:
+    def get(self, key: str, mtime_ns: int | None = None) -> CachedAudio | None:
         """Get cached audio, moving to end (most recent).
 
         Args:
             key: Cache key (usually file path as string)
+            mtime_ns: Current file modification time; a cached entry decoded
+                from a different version of the file is evicted and treated as a miss
 
         Returns:
             CachedAudio if found, None otherwise
 
         """
         with self._lock:
+            if key in self._cache and mtime_ns is not None and self._cache[key].mtime_ns != mtime_ns:
+                stale = self._cache.pop(key)
+                self._current_size -= stale.size_bytes
+                logger.debug(f"Evicted stale cache entry: {key}")
             if key in self._cache:
                 self._cache.move_to_end(key)
                 self._cache[key].access_count += 1
@@ -99,11 +131,10 @@ class LRUAudioCache:
 
         """
         with self._lock:
-            # If already in cache, update and move to end
-            if key in self._cache:
-                old_size = self._cache[key].size_bytes
-                self._current_size -= old_size
-                self._cache.move_to_end(key)
+            # Drop any previous entry first so eviction cannot count it twice
+            old = self._cache.pop(key, None)
+            if old is not None:
+                self._current_size -= old.size_bytes
 
             # Evict until we have room
             while self._cache and self._current_size + audio.size_bytes > self.max_size_bytes:
@@ -132,9 +163,10 @@ class LRUAudioCache:
 
         """
         loaded = 0
-        for path in paths:
+        # Each distinct path once, in request order, skipping what is already cached
+        for path in dict.fromkeys(paths):
             key = str(path)
-            if key not in self._cache:
+            if not self.contains(key):
                 try:
                     audio = CachedAudio.from_file(path)
                     self.put(key, audio)
@@ -196,3 +228,436 @@ class LRUAudioCache:
     def __contains__(self, key: str) -> bool:
         """Check if key is in cache."""  # noqa: DOC201
         return self.contains(key)
+
+
+class ValidationCache:
+    """Persistent cache of audio file validation results.
+
+    Entries are keyed by path and reused while the file's modification time
+    and size are unchanged, so a warm scan costs one stat() per file instead
+    of a header parse.
+    """
+
+    def __init__(self, cache_file: Path | None = None) -> None:
+        """Initialize the validation cache.
+
+        Args:
+            cache_file: Path to cache JSON file (default: ~/.muc/validation_cache.json)
+
+        """
+        self.cache_file = cache_file or (Path.home() / ".muc" / "validation_cache.json")
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._seen: set[str] = set()
+        self._dirty = False
+        self._lock = Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """Load cached entries from disk."""
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable validation cache: {e}")
+            return
+
+        if isinstance(data, dict):
+            self._entries = data
+        logger.debug(f"Loaded {len(self._entries)} validation cache entries")
+
+    def get(self, path: Path, st: os.stat_result | None = None) -> AudioFileInfo | None:
+        """Get the cached validation info for a file if it is unchanged.
+
+        Args:
+            path: Path to the audio file
+            st: The file's stat result, if the caller already has one
+
+        Returns:
+            AudioFileInfo if a matching entry exists, None otherwise
+
+        """
+        key = str(path)
+        self._seen.add(key)
+        if st is None:
+            try:
+                st = path.stat()
+            except OSError:
+                return None
+
+        entry = self._entries.get(key)
+        if entry and entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size:
+            return AudioFileInfo(
+                path=path,
+                duration=entry["duration"],
+                sample_rate=entry["sample_rate"],
+                channels=entry["channels"],
+                format=entry["format"],
+                is_valid=entry["is_valid"],
+                error=entry["error"],
+            )
+        return None
+
+    def validate(
+        self,
+        path: Path,
+        validator: Callable[[Path], AudioFileInfo],
+        st: os.stat_result | None = None,
+    ) -> AudioFileInfo:
+        """Return validation info for a file, running the validator only if it changed.
+
+        Safe to call from multiple threads.
+
+        Args:
+            path: Path to the audio file
+            validator: Function performing the actual validation on a miss
+            st: The file's stat result, if the caller already has one
+
+        Returns:
+            AudioFileInfo for the file
+
+        """
+        if st is None:
+            try:
+                st = path.stat()
+            except OSError:
+                return validator(path)
+
+        cached = self.get(path, st)
+        if cached is not None:
+            return cached
+
+        info = validator(path)
+        with self._lock:
+            self._entries[str(path)] = {
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "duration": info.duration,
+                "sample_rate": info.sample_rate,
+                "channels": info.channels,
+                "format": info.format,
+                "is_valid": info.is_valid,
+                "error": info.error,
+            }
+            self._dirty = True
+        return info
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed, dropping entries for deleted files."""
+        for key in [k for k in self._entries if k not in self._seen and not Path(k).exists()]:
+            del self._entries[key]
+            self._dirty = True
+
+        if not self._dirty:
+            return
+
+        temp_path = self.cache_file.with_name(self.cache_file.name + ".tmp")
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with temp_path.open("w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+                f.flush()
+                os.fsync(f.fileno())
+            temp_path.replace(self.cache_file)
+            self._dirty = False
+            logger.debug(f"Saved {len(self._entries)} validation cache entries")
+        except OSError:
+            logger.exception("Failed to save validation cache")
+
+    def __len__(self) -> int:
+        """Return number of cached entries."""  # noqa: DOC201
+        return len(self._entries)
+
+
+class SoundIndexCache:
+    """Persistent record of the last scan result for each set of sound directories.
+
+    Lets startup show the previous sound list straight away while a fresh scan
+    runs in the background, instead of walking every directory first.
+    """
+
+    def __init__(self, cache_file: Path | None = None) -> None:
+        """Initialize the sound index cache.
+
+        Args:
+            cache_file: Path to cache JSON file (default: ~/.muc/sound_index.json)
+
+        """
+        self.cache_file = cache_file or (Path.home() / ".muc" / "sound_index.json")
+        self._lock = Lock()
+
+    @staticmethod
+    def key_for(directories: list[Path]) -> str:
+        """Build the cache key for a list of sound directories.
+
+        Args:
+            directories: Sound directories in priority order
+
+        Returns:
+            Key identifying the directory list
+
+        """
+        return "\n".join(str(directory.resolve()) for directory in directories)
+
+    def _read(self) -> dict[str, Any]:
+        """Read all cached indexes from disk.
+
+        Returns:
+            Mapping of directory key to index entry (empty if missing or unreadable)
+
+        """
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable sound index: {e}")
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def load(
+        self,
+        key: str,
+    ) -> tuple[dict[str, Path], dict[str, Path], list[tuple[Path, str]]] | None:
+        """Load the last scan result for a set of directories.
+
+        Args:
+            key: Key from key_for()
+
+        Returns:
+            Tuple of (sounds, sound sources, invalid files), or None if not cached
+
+        """
+        entry = self._read().get(key)
+        if not isinstance(entry, dict):
+            return None
+        try:
+            sounds = {name: Path(path) for name, (path, _) in entry["sounds"].items()}
+            sources = {name: Path(source) for name, (_, source) in entry["sounds"].items()}
+            invalid = [(Path(path), error) for path, error in entry["invalid"]]
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring malformed sound index entry: {e}")
+            return None
+        logger.debug(f"Loaded {len(sounds)} sounds from index cache")
+        return sounds, sources, invalid
+
+    def save(
+        self,
+        key: str,
+        sounds: dict[str, Path],
+        sources: dict[str, Path],
+        invalid: list[tuple[Path, str]],
+    ) -> None:
+        """Record a scan result for a set of directories.
+
+        Safe to call from multiple threads.
+
+        Args:
+            key: Key from key_for()
+            sounds: Sound name to file path
+            sources: Sound name to the directory it was found in
+            invalid: (file path, error) for files that failed validation
+
+        """
+        entry = {
+            "sounds": {name: [str(path), str(sources.get(name, path.parent))] for name, path in sounds.items()},
+            "invalid": [[str(path), error] for path, error in invalid],
+        }
+        with self._lock:
+            data = self._read()
+            if data.get(key) == entry:
+                return
+            data[key] = entry
+
+            temp_path = self.cache_file.with_name(self.cache_file.name + ".tmp")
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                with temp_path.open("w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                temp_path.replace(self.cache_file)
+                logger.debug(f"Saved sound index with {len(sounds)} sounds")
+            except OSError:
+                logger.exception("Failed to save sound index")
+
+
+class DecodedAudioStore:
+    """On-disk store of decoded audio for compressed formats.
+
+    Decoding MP3/OGG/FLAC/M4A is far slower than reading raw samples, so the
+    decoded float32 frames are saved as .npy files and read back on later
+    loads. Each source file gets one entry directory holding a single
+    ``<mtime_ns>_<size>_<samplerate>.npy``; an edited file misses, and its
+    new decode replaces the old one. The store is kept under a byte budget by
+    removing the least recently used entries.
+    """
+
+    # Default byte budget for all stored decodes (1 GB)
+    DEFAULT_MAX_SIZE = 1024 * 1024 * 1024
+
+    # Formats whose decode is cheap enough that storing a copy is not worth it
+    UNCOMPRESSED_FORMATS = frozenset({".wav"})
+
+    def __init__(self, cache_dir: Path | None = None, max_size_bytes: int | None = None) -> None:
+        """Initialize the decoded audio store.
+
+        Args:
+            cache_dir: Directory for decoded files (default: ~/.muc/decoded_cache)
+            max_size_bytes: Maximum total size of stored decodes (default: 1 GB)
+
+        """
+        self.cache_dir = cache_dir or (Path.home() / ".muc" / "decoded_cache")
+        self.max_size_bytes = max_size_bytes or self.DEFAULT_MAX_SIZE
+
+    def _entry(self, path: Path) -> tuple[Path, str] | None:
+        """Get the entry directory of a file and the name prefix of its current version.
+
+        Args:
+            path: Path to the audio file
+
+        Returns:
+            Tuple of (entry directory, file name prefix), or None if the file cannot be stat'ed
+
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        entry_dir = self.cache_dir / hashlib.sha256(str(path.resolve()).encode()).hexdigest()
+        return entry_dir, f"{st.st_mtime_ns}_{st.st_size}_"
+
+    def __contains__(self, path: Path) -> bool:
+        """Check whether a decode of the file's current version is stored, without loading it.
+
+        Args:
+            path: Path to the audio file
+
+        Returns:
+            True if load() would find a stored decode
+
+        """
+        if path.suffix.lower() in self.UNCOMPRESSED_FORMATS:
+            return False
+        entry = self._entry(path)
+        if entry is None:
+            return False
+        entry_dir, prefix = entry
+        try:
+            with os.scandir(entry_dir) as entries:
+                return any(e.name.startswith(prefix) and e.name.endswith(".npy") for e in entries)
+        except OSError:
+            return False
+
+    def load(self, path: Path) -> tuple[np.ndarray, int] | None:
+        """Load the decoded copy of a file if one is stored.
+
+        The samples are read into memory rather than memory-mapped, so holding
+        the result (e.g. in the LRU cache) never keeps a store file mapped and
+        pruning can always remove it.
+
+        Args:
+            path: Path to the audio file
+
+        Returns:
+            Tuple of (read-only data, samplerate) or None on a miss
+
+        """
+        if path.suffix.lower() in self.UNCOMPRESSED_FORMATS:
+            return None
+        entry = self._entry(path)
+        if entry is None:
+            return None
+        entry_dir, prefix = entry
+        try:
+            with os.scandir(entry_dir) as entries:
+                name = next(e.name for e in entries if e.name.startswith(prefix) and e.name.endswith(".npy"))
+            stored = entry_dir / name
+            data = np.load(stored, allow_pickle=False)
+            samplerate = int(name.removeprefix(prefix).removesuffix(".npy"))
+            # Refresh the entry's mtime; pruning removes the oldest entries first
+            os.utime(stored)
+        except (OSError, StopIteration, ValueError) as e:
+            if not isinstance(e, (FileNotFoundError, StopIteration)):
+                logger.debug(f"Decoded copy of {path.name} unusable: {e}")
+            return None
+        data.flags.writeable = False
+        logger.debug(f"Loaded decoded copy of {path.name}")
+        return data, samplerate
+
+    def save(self, path: Path, data: np.ndarray, samplerate: int) -> None:
+        """Store the decoded audio of a file, replacing decodes of older versions.
+
+        Args:
+            path: Path to the audio file
+            data: Decoded float32 audio of shape (frames, channels)
+            samplerate: Sample rate of the audio
+
+        """
+        if path.suffix.lower() in self.UNCOMPRESSED_FORMATS:
+            return
+        if data.nbytes > self.max_size_bytes:
+            logger.debug(f"Decoded copy of {path.name} exceeds the store budget, not stored")
+            return
+        entry = self._entry(path)
+        if entry is None:
+            return
+        entry_dir, prefix = entry
+
+        target = entry_dir / f"{prefix}{samplerate}.npy"
+        temp_path = entry_dir / f"{prefix}{samplerate}.npy.tmp"
+        try:
+            entry_dir.mkdir(parents=True, exist_ok=True)
+            with temp_path.open("wb") as f:
+                np.save(f, data, allow_pickle=False)
+                f.flush()
+                os.fsync(f.fileno())
+            temp_path.replace(target)
+            logger.debug(f"Stored decoded copy of {path.name}")
+        except OSError as e:
+            logger.warning(f"Failed to store decoded copy of {path.name}: {e}")
+            return
+
+        # Decodes of earlier versions of this file can never hit again
+        for stale in entry_dir.iterdir():
+            if stale != target:
+                stale.unlink(missing_ok=True)
+        self._prune()
+
+    def _prune(self) -> None:
+        """Remove least recently used entries until the store fits its byte budget."""
+        files: list[tuple[int, int, Path]] = []
+        try:
+            with os.scandir(self.cache_dir) as entry_dirs:
+                for entry_dir in entry_dirs:
+                    if not entry_dir.is_dir():
+                        continue
+                    with os.scandir(entry_dir.path) as entries:
+                        for entry in entries:
+                            st = entry.stat()
+                            files.append((st.st_mtime_ns, st.st_size, Path(entry.path)))
+        except OSError as e:
+            logger.debug(f"Cannot scan decoded audio store: {e}")
+            return
+
+        total = sum(size for _, size, _ in files)
+        if total <= self.max_size_bytes:
+            return
+        files.sort()
+        for _, size, stored in files:
+            if total <= self.max_size_bytes:
+                break
+            try:
+                stored.unlink()
+            except OSError:
+                # A locked entry; it is retried on the next save
+                continue
+            total -= size
+            with contextlib.suppress(OSError):
+                stored.parent.rmdir()
+        logger.debug(f"Pruned decoded audio store to {total / (1024 * 1024):.1f} MB")
+
+    def clear(self) -> None:
+        """Remove all stored decoded audio."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        logger.info("Decoded audio store cleared")
@@ -3,32 +3,30 @@
 
 import contextlib
 import sys
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import rich_click as click
-import sounddevice as sd
-from pynput import keyboard
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
-from src.audio_manager import AudioManager
-from src.audio_tools import AudioNormalizer, AudioTrimmer
 from src.config_transfer import ConfigTransfer
 from src.downloader import YouTubeDownloader, check_ffmpeg_available, check_yt_dlp_available
 from src.exceptions import MUCError
 from src.hotkey_manager import HotkeyManager
-from src.interactive_menu import InteractiveMenu
 from src.logging_config import init_logging
 from src.metadata import MetadataManager
 from src.profile_manager import ProfileManager
 from src.queue_manager import QueueManager
 from src.search import search_sounds
-from src.soundboard import Soundboard
-from src.sounds_directories import SoundsDirectoryManager
 from src.status_display import StatusDisplay
-from src.validators import validate_audio_file
+
+if TYPE_CHECKING:
+    from src.audio_manager import AudioManager
+    from src.soundboard import Soundboard
 
 # Configure rich-click
 click.rich_click.TEXT_MARKUP = "rich"
@@ -41,21 +39,57 @@ click.rich_click.MAX_WIDTH = 100
 console = Console()
 
 
-def get_soundboard() -> tuple[Soundboard, AudioManager]:
+def _prewarm_audio() -> None:
+    """Import the audio stack, which initializes PortAudio, and enumerate devices.
+
+    The device list goes into the per-process cache AudioManager reads when
+    listing, validating and selecting devices; if the main thread gets there
+    first it waits for this enumeration instead of starting its own. Runs on a
+    background thread; failures are left for the main thread to report when it
+    actually opens the device.
+    """
+    with contextlib.suppress(Exception):
+        from src.audio_manager import _cached_devices  # noqa: PLC0415
+
+        _cached_devices()
+
+
+def get_soundboard(
+    pm: ProfileManager | None = None,
+    *,
+    use_sound_index: bool = False,
+    scan: bool = True,
+) -> tuple["Soundboard", "AudioManager"]:
     """Initialize and return soundboard and audio manager instances.
 
-    Uses the active profile's settings for configuration.
+    Uses the active profile's settings for configuration. The audio stack
+    (numpy, sounddevice, soundfile) is imported here rather than at module
+    level so commands that never touch audio start quickly, and PortAudio
+    initialization overlaps with loading the profile and metadata.
+
+    Args:
+        pm: ProfileManager to reuse for later saves (creates new if None)
+        use_sound_index: Start from the last scan result and rescan in the background.
+            Meant for long-running modes; one-shot commands need an up-to-date list.
+        scan: Scan the sound library up front. Pass False when only a named sound
+            is played, so it can be found without walking the whole library.
 
     Returns:
         Tuple containing initialized Soundboard and AudioManager instances.
 
     """
-    pm = ProfileManager()
-    profile = pm.get_active_profile()
+    threading.Thread(target=_prewarm_audio, name="muc-audio-prewarm", daemon=True).start()
 
-    audio_manager = AudioManager(console)
+    pm = pm or ProfileManager()
+    profile = pm.get_active_profile()
     metadata_manager = MetadataManager()
 
+    from src.audio_manager import AudioManager  # noqa: PLC0415
+    from src.cache import DecodedAudioStore, SoundIndexCache, ValidationCache  # noqa: PLC0415
+    from src.soundboard import Soundboard  # noqa: PLC0415
+
+    audio_manager = AudioManager(console, decoded_store=DecodedAudioStore())
+
     if profile.output_device_id is not None:
         audio_manager.set_output_device(profile.output_device_id)
 
@@ -80,6 +114,9 @@ def get_soundboard() -> tuple[Soundboard, AudioManager]:
         metadata_manager=metadata_manager,
         hotkey_manager=hotkey_manager,
         sounds_dirs=sounds_dirs_paths,
+        validation_cache=ValidationCache(),
+        sound_index=SoundIndexCache() if use_sound_index else None,
+        scan=scan,
     )
     return soundboard, audio_manager
 
@@ -119,6 +156,8 @@ def setup() -> None:
     Guides you through selecting a virtual audio device (like VB-Cable)
     to route sound to your microphone in games.
     """
+    from src.audio_manager import AudioManager  # noqa: PLC0415
+
     pm = ProfileManager()
     profile = pm.get_active_profile()
     audio_manager = AudioManager(console)
@@ -159,6 +198,8 @@ def setup() -> None:
 @cli.command()
 def devices() -> None:
     """List all available audio devices on your system."""
+    from src.audio_manager import AudioManager  # noqa: PLC0415
+
     audio_manager = AudioManager(console)
     audio_manager.print_devices()
 
@@ -170,18 +211,23 @@ def play(sound_name: str | None) -> None:
 
     If no sound name is provided, shows a list of available sounds.
     """
-    soundboard, _ = get_soundboard()
-
-    if not soundboard.sounds:
-        console.print("[red]✗[/red] No sounds found in sounds directory.")
-        console.print(f"[dim]Add audio files to: {soundboard.sounds_dir}[/dim]")
-        sys.exit(1)
+    # A named sound is looked up directly; the library is only scanned on a miss
+    soundboard, _ = get_soundboard(scan=sound_name is None)
 
     if sound_name is None:
+        if not soundboard.sounds:
+            console.print("[red]✗[/red] No sounds found in sounds directory.")
+            console.print(f"[dim]Add audio files to: {soundboard.sounds_dir}[/dim]")
+            sys.exit(1)
+
         soundboard.list_sounds()
         sound_name = str(click.prompt("Enter sound name to play", type=str))
 
-    soundboard.play_sound(sound_name, blocking=True)
+    if not soundboard.play_sound(sound_name, blocking=True) and soundboard.scanned and not soundboard.sounds:
+        # The direct lookup missed and fell back to a scan, which found nothing
+        console.print("[red]✗[/red] No sounds found in sounds directory.")
+        console.print(f"[dim]Add audio files to: {soundboard.sounds_dir}[/dim]")
+        sys.exit(1)
 
 
 @cli.command()
@@ -201,7 +247,7 @@ def sounds(filter_tag: str | None, favorites: bool) -> None:
         sys.exit(1)
 
     # Get all sound names
-    sound_names = sorted(soundboard.sounds.keys())
+    sound_names = soundboard.sorted_sound_names
 
     # Filter by tag if specified
     if filter_tag:
@@ -233,6 +279,8 @@ def sounds(filter_tag: str | None, favorites: bool) -> None:
     # Setup hotkeys to show in table
     soundboard.setup_hotkeys()
 
+    hotkey_by_sound = soundboard.hotkeys_by_sound()
+
     for idx, name in enumerate(sound_names, 1):
         meta = metadata.get_metadata(name)
 
@@ -245,7 +293,7 @@ def sounds(filter_tag: str | None, favorites: bool) -> None:
             tags_str += "..."
 
         # Hotkey
-        hotkey = next((k for k, v in soundboard.hotkeys.items() if v == name), None)
+        hotkey = hotkey_by_sound.get(name)
         hotkey_display = hotkey.upper() if hotkey else "-"
 
         # Favorite indicator
@@ -405,9 +453,11 @@ def favorites() -> None:
     table.add_column("Sound Name", style="white")
     table.add_column("Hotkey", style="green")
 
+    hotkey_by_sound = soundboard.hotkeys_by_sound()
+
     for idx, name in enumerate(sorted(favorites_list), 1):
-        hotkey = next((k for k, v in soundboard.hotkeys.items() if v == name), "-")
-        table.add_row(str(idx), name, hotkey.upper() if hotkey != "-" else "-")
+        hotkey = hotkey_by_sound.get(name)
+        table.add_row(str(idx), name, hotkey.upper() if hotkey else "-")
 
     console.print(table)
 
@@ -457,6 +507,8 @@ def info(sound_name: str, preview: bool) -> None:
 
     Example: muc info airhorn
     """
+    from src.validators import validate_audio_file  # noqa: PLC0415
+
     soundboard, _ = get_soundboard()
     metadata = MetadataManager()
 
@@ -817,7 +869,10 @@ def listen() -> None:
     Uses both default (F1-F10) and custom hotkey bindings.
     Press ESC to stop listening.
     """
-    soundboard, audio_manager = get_soundboard()
+    import sounddevice as sd  # noqa: PLC0415
+    from pynput import keyboard  # noqa: PLC0415
+
+    soundboard, audio_manager = get_soundboard(use_sound_index=True)
 
     if not soundboard.sounds:
         console.print("[red]✗[/red] No sounds found.")
@@ -830,10 +885,10 @@ def listen() -> None:
     # Get device name for status display
     device_name = "Not configured"
     if audio_manager.output_device_id is not None:
+        # Served from the enumeration AudioManager already cached, not a new device query
         try:
-            device = sd.query_devices(audio_manager.output_device_id)
-            device_name = str(device["name"])  # pyright: ignore[reportArgumentType, reportCallIssue]
-        except (sd.PortAudioError, ValueError):
+            device_name = str(audio_manager.list_devices()[audio_manager.output_device_id]["name"])
+        except (sd.PortAudioError, IndexError):
             pass
 
     # Create status display
@@ -964,13 +1019,13 @@ def volume(level: float | None) -> None:
 
     Examples: mu volume 0.5 (set to 50%), mu volume (show current).
     """
-    _, audio_manager = get_soundboard()
+    pm = ProfileManager()
+    _, audio_manager = get_soundboard(pm)
     if level is None:
         percentage = int(audio_manager.volume * 100)
         console.print(f"[cyan]Current volume:[/cyan] {percentage}%")
     else:
         audio_manager.set_volume(level)
-        pm = ProfileManager()
         profile = pm.get_active_profile()
         profile.volume = audio_manager.volume
         pm.save_profile(profile)
@@ -985,7 +1040,7 @@ def auto(sequential: bool) -> None:
     Each sound will play completely before the next one starts.
     Press Ctrl+C to stop playback.
     """
-    soundboard, _ = get_soundboard()
+    soundboard, _ = get_soundboard(use_sound_index=True)
 
     if not soundboard.sounds:
         console.print("[red]✗[/red] No sounds found.")
@@ -1003,7 +1058,10 @@ def interactive() -> None:
     Provides a visual text-based menu for exploring and using the soundboard.
     Includes search, status display, and all soundboard features.
     """
-    soundboard, audio_manager = get_soundboard()
+    from src.interactive_menu import InteractiveMenu  # noqa: PLC0415
+
+    pm = ProfileManager()
+    soundboard, audio_manager = get_soundboard(pm, use_sound_index=True)
 
     if not soundboard.sounds:
         console.print("[red]✗[/red] No sounds found.")
@@ -1013,7 +1071,7 @@ def interactive() -> None:
     soundboard.setup_hotkeys()
 
     # Use the enhanced interactive menu
-    menu = InteractiveMenu(console, soundboard, audio_manager)
+    menu = InteractiveMenu(console, soundboard, audio_manager, profile_manager=pm)
     menu.run()
 
 
@@ -1297,6 +1355,8 @@ def directories() -> None:
 @directories.command(name="list")
 def dirs_list() -> None:
     """List all configured sounds directories."""
+    from src.sounds_directories import SoundsDirectoryManager  # noqa: PLC0415
+
     pm = ProfileManager()
     p = pm.get_active_profile()
 
@@ -1376,6 +1436,8 @@ def dirs_conflicts() -> None:
     When the same sound name exists in multiple directories,
     the sound from the last directory in the list is used.
     """
+    from src.sounds_directories import SoundsDirectoryManager  # noqa: PLC0415
+
     pm = ProfileManager()
     p = pm.get_active_profile()
 
@@ -1523,6 +1585,8 @@ def trim(
         muc trim intro --end 5 --fade-out 0.5
 
     """
+    from src.audio_tools import AudioTrimmer  # noqa: PLC0415
+
     soundboard, audio_manager = get_soundboard()
 
     if sound_name not in soundboard.sounds:
@@ -1622,6 +1686,8 @@ def normalize_cmd(
         muc normalize --all --in-place           # Overwrite originals
 
     """
+    from src.audio_tools import AudioNormalizer  # noqa: PLC0415
+
     soundboard, _ = get_soundboard()
     normalizer = AudioNormalizer()
 
@@ -1717,7 +1783,10 @@ def cache_stats() -> None:
 
     Displays information about cache usage, hit rate, and memory consumption.
     """
-    _, audio_manager = get_soundboard()
+    from src.audio_manager import AudioManager  # noqa: PLC0415
+
+    # Only the audio manager holds cache state; no need to scan the sound library
+    audio_manager = AudioManager(console)
     stats = audio_manager.cache_stats
 
     table = Table(title="Audio Cache Statistics", show_header=True, header_style="bold cyan")
@@ -1741,9 +1810,12 @@ def cache_stats() -> None:
 def cache_clear() -> None:
     """Clear the audio cache.
 
-    Removes all cached sounds from memory.
+    Removes all cached sounds from memory and decoded copies from disk.
     """
-    _, audio_manager = get_soundboard()
+    from src.audio_manager import AudioManager  # noqa: PLC0415
+    from src.cache import DecodedAudioStore  # noqa: PLC0415
+
+    audio_manager = AudioManager(console, decoded_store=DecodedAudioStore())
     audio_manager.clear_cache()
 
 
@@ -1787,8 +1859,8 @@ def cache_preload(hotkeys: bool, favorites: bool, preload_all: bool) -> None:
         console.print("[yellow]⚠[/yellow] No sounds to preload. Use --hotkeys, --favorites, or --all")
         return
 
-    # Remove duplicates
-    paths = list(set(paths))
+    # Remove duplicates, keeping hotkey order so the first bindings load first
+    paths = list(dict.fromkeys(paths))
 
     console.print(f"[cyan]Preloading {len(paths)} sounds...[/cyan]")
     loaded = audio_manager.preload_sounds(paths)
@@ -29,6 +29,7 @@ class InteractiveMenu:
         console: Console,
         soundboard: "Soundboard",
         audio_manager: "AudioManager",
+        profile_manager: ProfileManager | None = None,
     ) -> None:
         """Initialize InteractiveMenu.
 
@@ -36,17 +37,26 @@ class InteractiveMenu:
             console: Rich console for output
             soundboard: Soundboard instance
             audio_manager: AudioManager instance
+            profile_manager: ProfileManager used to persist settings (creates new if None)
 
         """
         self.console = console
         self.soundboard = soundboard
         self.audio_manager = audio_manager
+        self._profile_manager = profile_manager
         self.metadata = MetadataManager()
         self.last_played: str | None = None
         self.last_played_time: datetime | None = None
 
         logger.debug("InteractiveMenu initialized")
 
+    @property
+    def profile_manager(self) -> ProfileManager:
+        """ProfileManager used to persist settings, created on first use."""
+        if self._profile_manager is None:
+            self._profile_manager = ProfileManager()
+        return self._profile_manager
+
     def _build_header(self) -> Panel:
         """Build the status header panel.
 
@@ -303,10 +313,9 @@ class InteractiveMenu:
         self.audio_manager.print_devices()
         device_id = click.prompt("Enter device ID", type=int)
         if self.audio_manager.set_output_device(device_id):
-            pm = ProfileManager()
-            profile = pm.get_active_profile()
+            profile = self.profile_manager.get_active_profile()
             profile.output_device_id = device_id
-            pm.save_profile(profile)
+            self.profile_manager.save_profile(profile)
 
     def _adjust_volume(self) -> None:
         """Adjust the playback volume."""
@@ -317,10 +326,9 @@ class InteractiveMenu:
             type=click.IntRange(0, 100),
         )
         self.audio_manager.set_volume(volume_input / 100.0)
-        pm = ProfileManager()
-        profile = pm.get_active_profile()
+        profile = self.profile_manager.get_active_profile()
         profile.volume = self.audio_manager.volume
-        pm.save_profile(profile)
+        self.profile_manager.save_profile(profile)
 
     def _auto_play(self) -> None:
         """Auto-play all sounds."""
@@ -1,17 +1,32 @@
 # Copyright (c) 2025. All rights reserved.
 """Sound metadata management for tags, favorites, and play statistics."""
 
+import atexit
 import json
+import threading
+import time
+import weakref
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 
 from .logging_config import get_logger
+from .profile_manager import _write_json
 
 logger = get_logger(__name__)
 
+# Managers that have deferred saves, flushed once at interpreter exit
+_deferred_writers: "weakref.WeakSet[MetadataManager]" = weakref.WeakSet()
 
-@dataclass
+
+@atexit.register
+def _flush_deferred_writers() -> None:
+    """Persist the pending changes of every manager still alive at exit."""
+    for manager in list(_deferred_writers):
+        manager.flush()
+
+
+@dataclass(slots=True)
 class SoundMetadata:
     """Metadata for a single sound."""
 
@@ -62,6 +77,11 @@ class SoundMetadata:
 class MetadataManager:
     """Manages sound metadata storage."""
 
+    # Deferred saves (play statistics) wait for this much quiet time...
+    SAVE_DELAY = 1.0
+    # ...but are never held off longer than this, even under continuous plays
+    SAVE_MAX_DELAY = 5.0
+
     def __init__(self, metadata_file: Path | None = None) -> None:
         """Initialize MetadataManager.
 
@@ -72,6 +92,17 @@ class MetadataManager:
         self.metadata_file = metadata_file or (Path.home() / ".muc" / "metadata.json")
         self.sounds: dict[str, SoundMetadata] = {}
         self.all_tags: set[str] = set()
+
+        # Guards sounds and all_tags, which the background writer reads
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+
+        # Background writer state for deferred saves
+        self._save_event = threading.Event()
+        self._save_thread: threading.Thread | None = None
+        self._dirty_since: float | None = None
+        self._last_change = 0.0
+
         self.load()
 
     def load(self) -> None:
@@ -95,21 +126,88 @@ class MetadataManager:
             logger.exception("Cannot read metadata file")
 
     def save(self) -> None:
-        """Save metadata to file."""
+        """Save metadata to file.
+
+        Must not be called while holding the metadata lock: a concurrent save
+        holds the write lock and waits for it.
+        """
         logger.debug("Saving metadata")
 
-        self.metadata_file.parent.mkdir(parents=True, exist_ok=True)
-        data = {
-            "sounds": {name: meta.to_dict() for name, meta in self.sounds.items()},
-            "tags": sorted(self.all_tags),
-        }
+        # Writes are serialized, and each one snapshots the state only once it
+        # holds the write lock, so an older snapshot never overwrites a newer one
+        with self._write_lock:
+            with self._lock:
+                # Everything is written, so any pending deferred save is satisfied
+                self._dirty_since = None
+                data = {
+                    "sounds": {name: meta.to_dict() for name, meta in self.sounds.items()},
+                    "tags": sorted(self.all_tags),
+                }
+
+            try:
+                self.metadata_file.parent.mkdir(parents=True, exist_ok=True)
+                # Atomic replace: a crash mid-write never truncates the file
+                _write_json(self.metadata_file, data)
+                logger.debug("Metadata saved successfully")
+            except OSError:
+                logger.exception("Failed to save metadata")
+
+    def schedule_save(self) -> None:
+        """Mark metadata as changed and let the background writer save it.
+
+        Bursts of changes are coalesced into a single write once SAVE_DELAY
+        seconds pass without further changes, or SAVE_MAX_DELAY seconds after
+        the first unsaved change, whichever comes first.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._last_change = now
+            if self._dirty_since is None:
+                self._dirty_since = now
+            if self._save_thread is None:
+                self._save_thread = threading.Thread(target=self._save_worker, name="muc-metadata-writer", daemon=True)
+                self._save_thread.start()
+                # Persist whatever is still pending when the process exits
+                _deferred_writers.add(self)
+        self._save_event.set()
+
+    def flush(self) -> None:
+        """Write pending deferred changes now, if there are any."""
+        if self._dirty_since is not None:
+            self.save()
 
-        try:
-            with self.metadata_file.open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-            logger.debug("Metadata saved successfully")
-        except OSError:
-            logger.exception("Failed to save metadata")
+    def _pending_save_delay(self) -> float | None:
+        """Return seconds until a deferred save is due, or None if nothing is pending."""
+        with self._lock:
+            if self._dirty_since is None:
+                return None
+            now = time.monotonic()
+            return min(
+                self.SAVE_DELAY - (now - self._last_change),
+                self.SAVE_MAX_DELAY - (now - self._dirty_since),
+            )
+
+    def _save_worker(self) -> None:
+        """Background loop performing deferred saves, exiting once nothing is pending.
+
+        The thread holds a reference to the manager, so it does not outlive
+        the pending changes; the next schedule_save starts a new one.
+        """
+        while True:
+            with self._lock:
+                delay = self._pending_save_delay()
+                if delay is None:
+                    self._save_thread = None
+                    return
+            if delay <= 0:
+                try:
+                    self.flush()
+                except Exception:
+                    # Never let one failed write stop the writer; the next change retries
+                    logger.exception("Deferred metadata save failed")
+            else:
+                self._save_event.wait(delay)
+                self._save_event.clear()
 
     def get_metadata(self, sound_name: str) -> SoundMetadata:
         """Get metadata for a sound, creating default if not exists.
@@ -121,9 +219,10 @@ class MetadataManager:
             SoundMetadata for the sound
 
         """
-        if sound_name not in self.sounds:
-            self.sounds[sound_name] = SoundMetadata()
-        return self.sounds[sound_name]
+        with self._lock:
+            if sound_name not in self.sounds:
+                self.sounds[sound_name] = SoundMetadata()
+            return self.sounds[sound_name]
 
     def add_tag(self, sound_name: str, tag: str) -> bool:
         """Add a tag to a sound.
@@ -136,15 +235,16 @@ class MetadataManager:
             True if tag was added (not a duplicate)
 
         """
-        meta = self.get_metadata(sound_name)
         tag = tag.lower().strip()
-        if tag and tag not in meta.tags:
+        with self._lock:
+            meta = self.get_metadata(sound_name)
+            if not tag or tag in meta.tags:
+                return False
             meta.tags.append(tag)
             self.all_tags.add(tag)
-            self.save()
-            logger.debug(f"Added tag '{tag}' to '{sound_name}'")
-            return True
-        return False
+        self.save()
+        logger.debug(f"Added tag '{tag}' to '{sound_name}'")
+        return True
 
     def remove_tag(self, sound_name: str, tag: str) -> bool:
         """Remove a tag from a sound.
@@ -157,14 +257,15 @@ class MetadataManager:
             True if tag was removed
 
         """
-        meta = self.get_metadata(sound_name)
         tag = tag.lower().strip()
-        if tag in meta.tags:
+        with self._lock:
+            meta = self.get_metadata(sound_name)
+            if tag not in meta.tags:
+                return False
             meta.tags.remove(tag)
-            self.save()
-            logger.debug(f"Removed tag '{tag}' from '{sound_name}'")
-            return True
-        return False
+        self.save()
+        logger.debug(f"Removed tag '{tag}' from '{sound_name}'")
+        return True
 
     def get_sounds_by_tag(self, tag: str) -> list[str]:
         """Get all sounds with a specific tag.
@@ -177,7 +278,8 @@ class MetadataManager:
 
         """
         tag = tag.lower().strip()
-        return [name for name, meta in self.sounds.items() if tag in meta.tags]
+        with self._lock:
+            return [name for name, meta in self.sounds.items() if tag in meta.tags]
 
     def get_sounds_by_tags(self, tags: list[str]) -> list[str]:
         """Get all sounds with any of the specified tags (OR logic).
@@ -190,7 +292,8 @@ class MetadataManager:
 
         """
         tags = [t.lower().strip() for t in tags]
-        return [name for name, meta in self.sounds.items() if any(t in meta.tags for t in tags)]
+        with self._lock:
+            return [name for name, meta in self.sounds.items() if any(t in meta.tags for t in tags)]
 
     def get_favorites(self) -> list[str]:
         """Get all favorite sounds.
@@ -199,7 +302,8 @@ class MetadataManager:
             List of favorite sound names
 
         """
-        return [name for name, meta in self.sounds.items() if meta.favorite]
+        with self._lock:
+            return [name for name, meta in self.sounds.items() if meta.favorite]
 
     def set_favorite(self, sound_name: str, *, is_favorite: bool) -> None:
         """Set favorite status for a sound.
@@ -209,8 +313,8 @@ class MetadataManager:
             is_favorite: Whether to mark as favorite
 
         """
-        meta = self.get_metadata(sound_name)
-        meta.favorite = is_favorite
+        with self._lock:
+            self.get_metadata(sound_name).favorite = is_favorite
         self.save()
         logger.debug(f"Set '{sound_name}' favorite={is_favorite}")
 
@@ -224,11 +328,12 @@ class MetadataManager:
             New favorite status
 
         """
-        meta = self.get_metadata(sound_name)
-        meta.favorite = not meta.favorite
+        with self._lock:
+            meta = self.get_metadata(sound_name)
+            meta.favorite = is_favorite = not meta.favorite
         self.save()
-        logger.debug(f"Toggled '{sound_name}' favorite={meta.favorite}")
-        return meta.favorite
+        logger.debug(f"Toggled '{sound_name}' favorite={is_favorite}")
+        return is_favorite
 
     def set_volume(self, sound_name: str, volume: float) -> None:
         """Set volume for a specific sound.
@@ -238,10 +343,11 @@ class MetadataManager:
             volume: Volume level (0.0 to 2.0)
 
         """
-        meta = self.get_metadata(sound_name)
-        meta.volume = max(0.0, min(2.0, volume))
+        volume = max(0.0, min(2.0, volume))
+        with self._lock:
+            self.get_metadata(sound_name).volume = volume
         self.save()
-        logger.debug(f"Set '{sound_name}' volume={meta.volume}")
+        logger.debug(f"Set '{sound_name}' volume={volume}")
 
     def record_play(self, sound_name: str) -> None:
         """Record that a sound was played.
@@ -250,10 +356,12 @@ class MetadataManager:
             sound_name: Name of the sound that was played
 
         """
-        meta = self.get_metadata(sound_name)
-        meta.play_count += 1
-        meta.last_played = datetime.now(tz=UTC)
-        self.save()
+        with self._lock:
+            meta = self.get_metadata(sound_name)
+            meta.play_count += 1
+            meta.last_played = datetime.now(tz=UTC)
+        # Plays happen at hotkey rate; statistics are written in the background
+        self.schedule_save()
         logger.debug(f"Recorded play for '{sound_name}' (count={meta.play_count})")
 
     def get_all_tags_with_counts(self) -> dict[str, int]:
@@ -263,11 +371,12 @@ class MetadataManager:
             Dictionary mapping tag names to counts
 
         """
-        tag_counts: dict[str, int] = {}
-        for meta in self.sounds.values():
-            for tag in meta.tags:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
-        return tag_counts
+        with self._lock:
+            tag_counts: dict[str, int] = {}
+            for meta in self.sounds.values():
+                for tag in meta.tags:
+                    tag_counts[tag] = tag_counts.get(tag, 0) + 1
+            return tag_counts
 
     def cleanup_unused_tags(self) -> int:
         """Remove tags that are no longer used by any sound.
@@ -276,11 +385,12 @@ class MetadataManager:
             Number of tags removed
 
         """
-        used_tags = set()
-        for meta in self.sounds.values():
-            used_tags.update(meta.tags)
+        with self._lock:
+            used_tags = set()
+            for meta in self.sounds.values():
+                used_tags.update(meta.tags)
 
-        removed = len(self.all_tags - used_tags)
-        self.all_tags = used_tags
+            removed = len(self.all_tags - used_tags)
+            self.all_tags = used_tags
         self.save()
         return removed
@@ -1,7 +1,10 @@
 # Copyright (c) 2025. All rights reserved.
 """Profile management for MUC Soundboard."""
 
+import contextlib
+import hashlib
 import json
+import os
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -9,10 +12,109 @@ from typing import Any
 
 from .logging_config import get_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger(__name__)
 
 
-@dataclass
+def _read_json(path: Path) -> Any:  # noqa: ANN401
+    """Read and parse a JSON file, using orjson when it is installed.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+
+    """
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _write_json(path: Path, data: Any) -> None:  # noqa: ANN401
+    """Atomically write data as indented JSON, using orjson when it is installed.
+
+    The payload is written to a sibling temp file, flushed to disk and then
+    renamed over the destination, so readers never see a partial file. The
+    directory is synced afterwards so the rename itself survives a crash.
+
+    Args:
+        path: Destination file path
+        data: JSON-serializable data
+
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
+
+    temp_path = path.with_name(f"{path.name}.tmp")
+    with temp_path.open("wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    temp_path.replace(path)
+    _fsync_directory(path.parent)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush directory entry changes, such as a rename, to disk.
+
+    Skipped where directories cannot be opened or synced (e.g. Windows).
+
+    Args:
+        directory: Directory to sync
+
+    """
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        with contextlib.suppress(OSError):
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _content_digest(data: Any) -> bytes:  # noqa: ANN401
+    """Hash JSON-serializable data independently of formatting and key order.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        SHA-256 digest of the canonical serialization
+
+    """
+    if orjson is not None:
+        raw = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    else:
+        raw = json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(raw).digest()
+
+
+def _profile_digest(profile: "Profile") -> bytes:
+    """Hash a profile's persisted content, ignoring its save timestamp.
+
+    Args:
+        profile: Profile to hash
+
+    Returns:
+        Digest that only changes when the profile's content changes
+
+    """
+    data = profile.to_dict()
+    del data["updated_at"]
+    return _content_digest(data)
+
+
+@dataclass(slots=True)
 class Profile:
     """A configuration profile."""
 
@@ -144,6 +246,10 @@ class ProfileManager:
         self.profiles_dir = self.base_dir / "profiles"
         self.config_file = self.base_dir / "config.json"
 
+        # Digests of what is known to be on disk, so unchanged saves skip the write
+        self._saved_config_digest: bytes | None = None
+        self._saved_profile_digests: dict[str, bytes] = {}
+
         self._ensure_directories()
         self._global_config = self._load_global_config()
 
@@ -156,23 +262,17 @@ class ProfileManager:
 
     def _migrate_legacy_config(self) -> None:
         """Migrate legacy config.json to profile format if needed."""
-        if not self.config_file.exists():
-            # No config at all, create default profile
-            if not list(self.profiles_dir.glob("*.json")):
-                self._create_default_profile()
-            return
-
-        # Check if already migrated
+        # A missing or unreadable config loads as a current-version default,
+        # so only a legacy config.json falls through to migration
         if "version" in self._global_config and self._global_config.get("version", 0) >= self.CONFIG_VERSION:
-            # Already migrated, ensure default profile exists
-            if not list(self.profiles_dir.glob("*.json")):
+            # Already migrated (or no config at all), ensure default profile exists
+            if next(self.profiles_dir.glob("*.json"), None) is None:
                 self._create_default_profile()
             return
 
         # Load old config
         try:
-            with self.config_file.open(encoding="utf-8") as f:
-                old_config = json.load(f)
+            old_config = _read_json(self.config_file)
         except (json.JSONDecodeError, OSError):
             logger.warning("Could not read legacy config for migration")
             self._create_default_profile()
@@ -244,18 +344,18 @@ class ProfileManager:
             Global configuration dictionary
 
         """
-        if self.config_file.exists():
-            try:
-                with self.config_file.open(encoding="utf-8") as f:
-                    data = json.load(f)
-            except (json.JSONDecodeError, OSError):
-                pass
-            else:
-                # Only return if it's the new format (has version key)
-                if "version" in data and data.get("version", 0) >= self.CONFIG_VERSION:
-                    return data
-                # Legacy config exists - return without version so migration triggers
-                return {"_legacy_exists": True}
+        try:
+            data = _read_json(self.config_file)
+        except (json.JSONDecodeError, OSError):
+            # Includes FileNotFoundError on first run
+            pass
+        else:
+            # Only return if it's the new format (has version key)
+            if "version" in data and data.get("version", 0) >= self.CONFIG_VERSION:
+                self._saved_config_digest = _content_digest(data)
+                return data
+            # Legacy config exists - return without version so migration triggers
+            return {"_legacy_exists": True}
         return {
             "version": self.CONFIG_VERSION,
             "default_profile": "default",
@@ -264,10 +364,14 @@ class ProfileManager:
         }
 
     def _save_global_config(self) -> None:
-        """Save global configuration."""
+        """Save global configuration, skipping the write when nothing changed."""
+        digest = _content_digest(self._global_config)
+        if digest == self._saved_config_digest and self.config_file.exists():
+            logger.debug("Global config unchanged, skipping save")
+            return
         self.base_dir.mkdir(parents=True, exist_ok=True)
-        with self.config_file.open("w", encoding="utf-8") as f:
-            json.dump(self._global_config, f, indent=2)
+        _write_json(self.config_file, self._global_config)
+        self._saved_config_digest = digest
 
     @property
     def active_profile_name(self) -> str:
@@ -311,16 +415,15 @@ class ProfileManager:
 
         """
         profile_file = self.profiles_dir / f"{name}.json"
-        if not profile_file.exists():
-            return None
-
         try:
-            with profile_file.open(encoding="utf-8") as f:
-                data = json.load(f)
-            return Profile.from_dict(data)
+            profile = Profile.from_dict(_read_json(profile_file))
+        except FileNotFoundError:
+            return None
         except (json.JSONDecodeError, OSError):
             logger.exception(f"Failed to load profile {name}")
             return None
+        self._saved_profile_digests[name] = _profile_digest(profile)
+        return profile
 
     def get_active_profile(self) -> Profile:
         """Get the currently active profile.
@@ -342,14 +445,21 @@ class ProfileManager:
     def save_profile(self, profile: Profile) -> None:
         """Save a profile.
 
+        Profiles whose content matches what was last loaded or saved are not
+        rewritten, and keep their updated_at timestamp.
+
         Args:
             profile: Profile to save
 
         """
-        profile.updated_at = datetime.now(tz=UTC)
         profile_file = self.profiles_dir / f"{profile.name}.json"
-        with profile_file.open("w", encoding="utf-8") as f:
-            json.dump(profile.to_dict(), f, indent=2)
+        digest = _profile_digest(profile)
+        if digest == self._saved_profile_digests.get(profile.name) and profile_file.exists():
+            logger.debug(f"Profile {profile.name} unchanged, skipping save")
+            return
+        profile.updated_at = datetime.now(tz=UTC)
+        _write_json(profile_file, profile.to_dict())
+        self._saved_profile_digests[profile.name] = digest
         logger.info(f"Saved profile: {profile.name}")
 
     def create_profile(
@@ -428,6 +538,7 @@ class ProfileManager:
             return False
 
         profile_file.unlink()
+        self._saved_profile_digests.pop(name, None)
 
         # If deleted profile was active, switch to default
         if self.active_profile_name == name:
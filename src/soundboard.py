@@ -1,7 +1,11 @@
 # Copyright (c) 2025. All rights reserved.
 """Soundboard with hotkey bindings for playing audio files."""
 
+import functools
+import os
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from pynput import keyboard
@@ -9,12 +13,12 @@ from rich.console import Console
 from rich.table import Table
 
 from src.audio_manager import AudioManager
+from src.cache import SoundIndexCache, ValidationCache
 from src.hotkey_manager import HotkeyManager
 from src.logging_config import get_logger
 from src.metadata import MetadataManager
-from src.profile_manager import ProfileManager
-from src.sounds_directories import SoundsDirectoryManager
-from src.validators import SUPPORTED_FORMATS, validate_audio_file_safe
+from src.sounds_directories import SoundsDirectoryManager, iter_audio_entries
+from src.validators import SUPPORTED_FORMATS, AudioFileInfo, validate_audio_file_safe
 
 logger = get_logger(__name__)
 
@@ -22,6 +26,15 @@ logger = get_logger(__name__)
 class Soundboard:
     """Manages sound files and hotkey bindings."""
 
+    # Upper bound on threads reading audio headers during a scan; header reads
+    # wait on the disk rather than the CPU, so allow several per core
+    VALIDATION_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+    # Read uncached headers in inode order, which roughly follows on-disk
+    # layout and saves seeks on spinning disks
+    SORT_BY_INODE = True
+    # Function keys F1-F10, bound to the first sounds by default
+    DEFAULT_FUNCTION_KEYS: tuple[str, ...] = tuple(f"<f{i}>" for i in range(1, 11))
+
     def __init__(
         self,
         audio_manager: AudioManager,
@@ -30,6 +43,10 @@ class Soundboard:
         metadata_manager: MetadataManager | None = None,
         hotkey_manager: HotkeyManager | None = None,
         sounds_dirs: list[Path] | None = None,
+        validation_cache: ValidationCache | None = None,
+        sound_index: SoundIndexCache | None = None,
+        *,
+        scan: bool = True,
     ) -> None:
         """Initialize the Soundboard.
 
@@ -40,15 +57,33 @@ class Soundboard:
             metadata_manager: MetadataManager instance (creates new if None)
             hotkey_manager: HotkeyManager instance (creates new if None)
             sounds_dirs: List of directories to scan for sounds (preferred)
+            validation_cache: Persistent cache letting rescans skip unchanged files
+            sound_index: Persistent last-scan result, served at startup while a rescan runs
+            scan: Scan the sounds directories now. If False, play_sound looks names
+                up directly and only scans the library on a miss
 
         """
         self.audio_manager = audio_manager
         self.console = console or Console()
         self.metadata = metadata_manager or MetadataManager()
         self.hotkey_manager = hotkey_manager or HotkeyManager()
+        self.validation_cache = validation_cache
+        self.sound_index = sound_index
+        self._revalidate_thread: threading.Thread | None = None
+        # Set once the library has been scanned; the lock keeps concurrent
+        # first plays on an unscanned board from scanning twice
+        self._scanned = threading.Event()
+        self._scan_lock = threading.Lock()
         self.sounds: dict[str, Path] = {}
+        self._sorted_sound_names: list[str] | None = None
         self.sound_sources: dict[str, Path] = {}  # Track which directory each sound came from
         self.hotkeys: dict[str, str] = {}
+        self._hotkey_mode: str | None = None  # Mode of the last setup_hotkeys call
+        self._manual_hotkeys: dict[str, str] = {}  # Bindings made with set_hotkey
+        # Guards the library/hotkey swap done by the background rescan against
+        # binding and listening on the main thread; hotkeys is only ever replaced
+        # whole, never mutated in place, so unlocked readers see a consistent dict
+        self._hotkey_lock = threading.RLock()
         self.listener: keyboard.GlobalHotKeys | None = None
         self.invalid_files: list[tuple[Path, str]] = []  # Track invalid files
 
@@ -65,57 +100,285 @@ class Soundboard:
 
         logger.debug(f"Soundboard initialized with sounds_dirs: {self.sounds_dirs}")
 
-        # Scan for audio files
-        self._scan_sounds()
+        # Serve the last scan result if there is one, otherwise scan now
+        if scan and not self._load_sound_index():
+            self._scan_sounds()
 
-    def _scan_sounds(self) -> None:
-        """Scan the sounds directories for audio files with validation."""
-        self.invalid_files = []
-        self.sounds = {}
-        self.sound_sources = {}
+    def _validate_file(self, audio_file: Path, st: os.stat_result | None = None) -> AudioFileInfo:
+        """Validate an audio file, reusing the cached result if it is unchanged.
+
+        Args:
+            audio_file: Path to the audio file
+            st: The file's stat result, if already known
+
+        Returns:
+            AudioFileInfo with validation status
+
+        """
+        if self.validation_cache is None:
+            return validate_audio_file_safe(audio_file)
+        return self.validation_cache.validate(audio_file, validate_audio_file_safe, st)
+
+    @staticmethod
+    def _stat(audio_file: Path) -> os.stat_result | None:
+        """Stat an audio file.
+
+        Args:
+            audio_file: Path to the audio file
+
+        Returns:
+            The stat result, or None if the file cannot be stat'ed
+
+        """
+        try:
+            return os.stat(audio_file)
+        except OSError:
+            return None
+
+    @staticmethod
+    def _entry_stat(entry: os.DirEntry[str]) -> os.stat_result | None:
+        """Stat an audio file through its directory entry from the walk.
+
+        Args:
+            entry: The file's directory entry
+
+        Returns:
+            The stat result, or None if the file cannot be stat'ed
+
+        """
+        try:
+            return entry.stat()
+        except OSError:
+            return None
+
+    @staticmethod
+    def _disk_order_key(st: os.stat_result | None) -> tuple[int, int]:
+        """Get a sort key approximating where a file lives on disk.
+
+        Args:
+            st: The file's stat result
+
+        Returns:
+            Tuple of (device, inode), or (0, 0) if the file could not be stat'ed
+
+        """
+        if st is None:
+            return 0, 0
+        return st.st_dev, st.st_ino
+
+    def _validate_files(
+        self,
+        audio_files: list[Path],
+        stats: list[os.stat_result | None] | None = None,
+    ) -> list[AudioFileInfo]:
+        """Validate audio files, reading headers of uncached files in parallel.
+
+        Each file is stat'ed once; that result serves the cache check, the read
+        ordering and the new cache entry. Cache hits are resolved on the calling
+        thread; only files that need a header parse are handed to a bounded
+        worker pool.
+
+        Args:
+            audio_files: Paths to the audio files
+            stats: Stat results from the directory walk, in the same order
+                (each file is stat'ed here if not given)
+
+        Returns:
+            AudioFileInfo for each file, in the same order
+
+        """
+        if stats is None:
+            stats = [self._stat(audio_file) for audio_file in audio_files]
+        results: list[AudioFileInfo | None] = [None] * len(audio_files)
+        misses: list[int] = []
+        for i, (audio_file, st) in enumerate(zip(audio_files, stats, strict=True)):
+            cached = None
+            if self.validation_cache is not None and st is not None:
+                cached = self.validation_cache.get(audio_file, st)
+            if cached is None:
+                misses.append(i)
+            else:
+                results[i] = cached
+
+        if self.SORT_BY_INODE and len(misses) > 1:
+            misses.sort(key=lambda i: self._disk_order_key(stats[i]))
+
+        if len(misses) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.VALIDATION_WORKERS, len(misses)),
+                thread_name_prefix="muc-validate",
+            ) as executor:
+                infos = executor.map(
+                    self._validate_file,
+                    [audio_files[i] for i in misses],
+                    [stats[i] for i in misses],
+                )
+                for i, info in zip(misses, infos, strict=True):
+                    results[i] = info
+        else:
+            for i in misses:
+                results[i] = self._validate_file(audio_files[i], stats[i])
+
+        return [info for info in results if info is not None]
+
+    def _load_sound_index(self) -> bool:
+        """Load the previous scan result and rescan in the background.
+
+        Returns:
+            True if a cached result was loaded, False if a full scan is needed
+
+        """
+        if self.sound_index is None:
+            return False
+        cached = self.sound_index.load(SoundIndexCache.key_for(self.sounds_dirs))
+        if cached is None or not cached[0]:
+            # An empty library is cheap to rescan and may have been filled since
+            return False
+
+        self.sounds, self.sound_sources, self.invalid_files = cached
+        self._sorted_sound_names = None
+        self._scanned.set()
+        self._report_scan()
+
+        self._revalidate_thread = threading.Thread(
+            target=self._revalidate_sound_index,
+            name="muc-sound-index",
+            daemon=True,
+        )
+        self._revalidate_thread.start()
+        return True
+
+    def _revalidate_sound_index(self) -> None:
+        """Rescan the sounds directories quietly and swap in the fresh result."""
+        try:
+            collected = self._collect_sounds()
+        except Exception as e:  # noqa: BLE001
+            logger.debug(f"Background sound rescan failed: {e}")
+            return
+        if collected is None:
+            return
+
+        sounds, sources, invalid = collected
+        with self._hotkey_lock:
+            changed = sounds != self.sounds
+            if changed:
+                logger.info(f"Sound library changed since last run: {len(self.sounds)} -> {len(sounds)} sounds")
+            self.sounds, self.sound_sources, self.invalid_files = sounds, sources, invalid
+            self._sorted_sound_names = None
+
+            if changed and self.hotkeys:
+                # Hotkeys were bound from the cached index; rebind them to the fresh library
+                hotkeys = self._mode_bindings(self._hotkey_mode, {}) if self._hotkey_mode else {}
+                hotkeys.update(
+                    {key: sound_name for key, sound_name in self._manual_hotkeys.items() if sound_name in sounds},
+                )
+                self.hotkeys = hotkeys
+                if self.listener is not None:
+                    self.start_listening()
+        self._save_sound_index()
+
+    def wait_for_rescan(self, timeout: float | None = None) -> bool:
+        """Wait for a background rescan started from the sound index to finish.
+
+        Args:
+            timeout: Maximum seconds to wait (wait indefinitely if None)
+
+        Returns:
+            True if a rescan was still running when called
+
+        """
+        thread = self._revalidate_thread
+        if thread is None or not thread.is_alive():
+            return False
+        thread.join(timeout)
+        return True
+
+    def _save_sound_index(self) -> None:
+        """Record the current scan result for the next startup."""
+        if self.sound_index is not None:
+            self.sound_index.save(
+                SoundIndexCache.key_for(self.sounds_dirs),
+                self.sounds,
+                self.sound_sources,
+                self.invalid_files,
+            )
+
+    def _collect_sounds(self) -> tuple[dict[str, Path], dict[str, Path], list[tuple[Path, str]]] | None:
+        """Find and validate audio files in the sounds directories.
+
+        Returns:
+            Tuple of (sounds, sound sources, invalid files), or None if the
+            single sounds directory does not exist
+
+        """
+        sounds: dict[str, Path] = {}
+        sources: dict[str, Path] = {}
+        invalid: list[tuple[Path, str]] = []
+
+        # (sound name, source directory, file) in priority order; the first valid file wins
+        candidates: list[tuple[str, Path, Path]] = []
+        # Stat results from the walk, when it provides them
+        stats: list[os.stat_result | None] | None = None
 
         if len(self.sounds_dirs) > 1:
             # Use SoundsDirectoryManager for multiple directories
             dir_manager = SoundsDirectoryManager(self.sounds_dirs)
             all_sounds = dir_manager.scan_all()
 
-            for sound_name, (source_dir, audio_file) in all_sounds.items():
-                # Validate the audio file
-                file_info = validate_audio_file_safe(audio_file)
-
-                if file_info.is_valid:
-                    self.sounds[sound_name] = audio_file
-                    self.sound_sources[sound_name] = source_dir
-                    logger.debug(f"Found valid sound: {sound_name} from {source_dir}")
-                else:
-                    self.invalid_files.append((audio_file, file_info.error or "Unknown error"))
-                    logger.warning(f"Invalid audio file: {audio_file} - {file_info.error}")
+            candidates.extend(
+                (sound_name, source_dir, audio_file) for sound_name, (source_dir, audio_file) in all_sounds.items()
+            )
         else:
             # Single directory - original behavior
             sounds_dir = self.sounds_dirs[0] if self.sounds_dirs else self.sounds_dir
             if not sounds_dir.exists():
                 logger.warning(f"Sounds directory not found: {sounds_dir}")
-                self.console.print(
-                    f"[yellow]⚠[/yellow] Sounds directory not found: {sounds_dir}",
-                )
-                return
+                return None
+
+            stats = []
+            for sound_name, audio_file, entry in iter_audio_entries(sounds_dir):
+                candidates.append((sound_name, sounds_dir, audio_file))
+                stats.append(self._entry_stat(entry))
+
+        file_infos = self._validate_files([audio_file for _, _, audio_file in candidates], stats)
 
-            supported_extensions = list(SUPPORTED_FORMATS)
+        for (sound_name, source_dir, audio_file), file_info in zip(candidates, file_infos, strict=True):
+            if file_info.is_valid:
+                if sound_name in sounds:
+                    # The walk yields top-level files first, so they shadow subdirectories
+                    logger.debug(f"Skipping duplicate sound name {sound_name}: {audio_file}")
+                    continue
+                sounds[sound_name] = audio_file
+                sources[sound_name] = source_dir
+                logger.debug(f"Found valid sound: {sound_name} from {source_dir}")
+            else:
+                invalid.append((audio_file, file_info.error or "Unknown error"))
+                logger.warning(f"Invalid audio file: {audio_file} - {file_info.error}")
 
-            for audio_file in sounds_dir.rglob("*"):
-                if audio_file.suffix.lower() in supported_extensions:
-                    # Validate the audio file
-                    file_info = validate_audio_file_safe(audio_file)
+        if self.validation_cache is not None:
+            self.validation_cache.save()
 
-                    if file_info.is_valid:
-                        sound_name = audio_file.stem
-                        self.sounds[sound_name] = audio_file
-                        self.sound_sources[sound_name] = sounds_dir
-                        logger.debug(f"Found valid sound: {sound_name}")
-                    else:
-                        self.invalid_files.append((audio_file, file_info.error or "Unknown error"))
-                        logger.warning(f"Invalid audio file: {audio_file} - {file_info.error}")
+        return sounds, sources, invalid
 
+    def _scan_sounds(self) -> None:
+        """Scan the sounds directories for audio files with validation."""
+        self._sorted_sound_names = None
+        collected = self._collect_sounds()
+        if collected is None:
+            self.sounds, self.sound_sources, self.invalid_files = {}, {}, []
+            self._scanned.set()
+            self.console.print(
+                f"[yellow]⚠[/yellow] Sounds directory not found: {self.sounds_dirs[0]}",
+            )
+            return
+
+        self.sounds, self.sound_sources, self.invalid_files = collected
+        self._scanned.set()
+        self._save_sound_index()
+        self._report_scan()
+
+    def _report_scan(self) -> None:
+        """Print how many sounds were found and whether any failed to load."""
         if self.sounds:
             logger.info(f"Found {len(self.sounds)} valid audio files")
             self.console.print(
@@ -138,15 +401,60 @@ class Soundboard:
                 f"[dim]Supported formats: {', '.join(sorted(SUPPORTED_FORMATS))}[/dim]",
             )
 
+    @property
+    def scanned(self) -> bool:
+        """Whether the library has been scanned or loaded from the sound index.
+
+        Returns:
+            True once ``sounds`` holds the library
+
+        """
+        return self._scanned.is_set()
+
+    @property
+    def sorted_sound_names(self) -> list[str]:
+        """Sound names in alphabetical order, computed once per scan.
+
+        Returns:
+            Sorted list of sound names (shared; do not modify)
+
+        """
+        if self._sorted_sound_names is None:
+            self._sorted_sound_names = sorted(self.sounds)
+        return self._sorted_sound_names
+
     def setup_default_hotkeys(self) -> None:
         """Set up default hotkey bindings for the first 10 sounds."""
-        # Function keys F1-F10
-        function_keys = [f"<f{i}>" for i in range(1, 11)]
+        with self._hotkey_lock:
+            self.hotkeys = {**self.hotkeys, **self._default_bindings()}
+
+    def _default_bindings(self) -> dict[str, str]:
+        """Map the default function keys to the first sounds.
 
-        sound_names = sorted(self.sounds.keys())
+        Returns:
+            Dictionary of hotkey to sound name
+
+        """
+        return dict(zip(self.DEFAULT_FUNCTION_KEYS, self.sorted_sound_names, strict=False))
 
-        for idx, sound_name in enumerate(sound_names[:10]):
-            self.hotkeys[function_keys[idx]] = sound_name
+    def _mode_bindings(self, mode: str, hotkeys: dict[str, str]) -> dict[str, str]:
+        """Build the bindings for a hotkey mode on top of existing ones.
+
+        Args:
+            mode: Hotkey mode ("default", "custom", "merged")
+            hotkeys: Bindings to start from (ignored in "custom" mode)
+
+        Returns:
+            A new dictionary of hotkey to sound name
+
+        """
+        if mode == "custom":
+            return self.hotkey_manager.get_all_bindings()
+        hotkeys = {**hotkeys, **self._default_bindings()}
+        if mode != "default":  # "merged"
+            # Custom hotkeys override defaults
+            hotkeys.update(self.hotkey_manager.get_all_bindings())
+        return hotkeys
 
     def setup_hotkeys(self, *, mode: str | None = None) -> None:
         """Set up hotkeys based on configuration mode.
@@ -155,18 +463,11 @@ class Soundboard:
             mode: Hotkey mode ("default", "custom", "merged"). Uses profile if None.
 
         """
-        pm = ProfileManager()
-        profile = pm.get_active_profile()
+        profile = self.hotkey_manager.profile_manager.get_active_profile()
         mode = mode or profile.hotkey_mode
-
-        if mode == "default":
-            self.setup_default_hotkeys()
-        elif mode == "custom":
-            self.hotkeys = self.hotkey_manager.get_all_bindings()
-        else:  # "merged"
-            self.setup_default_hotkeys()
-            # Custom hotkeys override defaults
-            self.hotkeys.update(self.hotkey_manager.get_all_bindings())
+        with self._hotkey_lock:
+            self._hotkey_mode = mode
+            self.hotkeys = self._mode_bindings(mode, self.hotkeys)
 
     def set_hotkey(self, key: str, sound_name: str) -> bool:
         """Bind a hotkey to a sound.
@@ -179,67 +480,100 @@ class Soundboard:
             True if binding was successful
 
         """
-        if sound_name not in self.sounds:
-            self.console.print(f"[red]✗[/red] Sound '{sound_name}' not found.")
-            return False
+        with self._hotkey_lock:
+            if sound_name not in self.sounds:
+                self.console.print(f"[red]✗[/red] Sound '{sound_name}' not found.")
+                return False
 
-        self.hotkeys[key] = sound_name
+            self.hotkeys = {**self.hotkeys, key: sound_name}
+            self._manual_hotkeys[key] = sound_name
         self.console.print(f"[green]✓[/green] Bound {key} to {sound_name}")
         return True
 
-    def _create_hotkey_handler(self, sound_name: str):  # noqa: ANN202
-        """Create a handler function for a specific sound.
-
-        Args:
-            sound_name: Name of the sound to play
+    def hotkeys_by_sound(self) -> dict[str, str]:
+        """Map each bound sound to its hotkey.
 
         Returns:
-            Handler function that plays the specified sound
+            Dictionary of sound name to hotkey; the first key bound to a sound wins
 
         """
+        return {sound_name: key for key, sound_name in reversed(self.hotkeys.items())}
 
-        def handler() -> None:
-            audio_file = self.sounds.get(sound_name)
-            if audio_file:
-                # Get per-sound volume from metadata
-                meta = self.metadata.get_metadata(sound_name)
-                self.audio_manager.play_audio(audio_file, sound_volume=meta.volume)
-                # Record play
-                self.metadata.record_play(sound_name)
+    def _play_hotkey_sound(self, sound_name: str) -> None:
+        """Play a sound in response to a hotkey press.
 
-        return handler
+        Args:
+            sound_name: Name of the sound to play
+
+        """
+        audio_file = self.sounds.get(sound_name)
+        if audio_file:
+            # Get per-sound volume from metadata
+            meta = self.metadata.get_metadata(sound_name)
+            self.audio_manager.play_audio(audio_file, sound_volume=meta.volume)
+            # Record play
+            self.metadata.record_play(sound_name)
 
     def start_listening(self) -> None:
         """Start listening for hotkeys."""
-        if not self.hotkeys:
-            logger.warning("No hotkeys configured")
-            self.console.print(
-                "[yellow]⚠[/yellow] No hotkeys configured. Use setup_default_hotkeys() first.",
-            )
-            return
+        with self._hotkey_lock:
+            if not self.hotkeys:
+                logger.warning("No hotkeys configured")
+                self.console.print(
+                    "[yellow]⚠[/yellow] No hotkeys configured. Use setup_default_hotkeys() first.",
+                )
+                return
 
-        # Create handler mapping
-        handlers = {}
-        for key, sound_name in self.hotkeys.items():
-            handlers[key] = self._create_hotkey_handler(sound_name)
+            # Create handler mapping
+            handlers = {
+                key: functools.partial(self._play_hotkey_sound, sound_name) for key, sound_name in self.hotkeys.items()
+            }
 
-        # Stop existing listener if any
-        self.stop_listening()
+            # Stop existing listener if any
+            self.stop_listening()
 
-        try:
-            self.listener = keyboard.GlobalHotKeys(handlers)
-            self.listener.start()
-            logger.info("Hotkey listener started")
-        except (OSError, RuntimeError) as e:
-            logger.exception("Failed to start hotkey listener")
-            self.console.print(f"[red]Error:[/red] {e}")
+            try:
+                self.listener = keyboard.GlobalHotKeys(handlers)
+                self.listener.start()
+                logger.info("Hotkey listener started")
+            except (OSError, RuntimeError) as e:
+                logger.exception("Failed to start hotkey listener")
+                self.console.print(f"[red]Error:[/red] {e}")
 
     def stop_listening(self) -> None:
         """Stop listening for hotkeys."""
-        if self.listener:
-            self.listener.stop()
-            self.listener = None
-            logger.debug("Hotkey listener stopped")
+        with self._hotkey_lock:
+            if self.listener:
+                self.listener.stop()
+                self.listener = None
+                logger.debug("Hotkey listener stopped")
+
+    def _quick_lookup(self, sound_name: str) -> Path | None:
+        """Find a sound by probing for <name><ext> at the top of the sounds directory.
+
+        Only used before the library has been scanned, and only when it agrees
+        with the scan: top-level files win over subdirectories, but with several
+        directories, or several top-level files sharing the name, priority
+        depends on the full scan, so no shortcut is taken.
+
+        Args:
+            sound_name: Name of the sound to find
+
+        Returns:
+            Path to a valid audio file, or None to fall back to a full scan
+
+        """
+        if len(self.sounds_dirs) != 1:
+            return None
+        candidates = [
+            candidate
+            for ext in SUPPORTED_FORMATS
+            if os.path.isfile(candidate := self.sounds_dirs[0] / f"{sound_name}{ext}")
+        ]
+        if len(candidates) != 1 or not self._validate_file(candidates[0]).is_valid:
+            return None
+        logger.debug(f"Found {sound_name} without scanning: {candidates[0]}")
+        return candidates[0]
 
     def play_sound(self, sound_name: str, *, blocking: bool = False) -> bool:
         """Manually play a sound by name.
@@ -253,6 +587,16 @@ class Soundboard:
 
         """
         audio_file = self.sounds.get(sound_name)
+        if audio_file is None and not self._scanned.is_set():
+            audio_file = self._quick_lookup(sound_name)
+            if audio_file is None:
+                with self._scan_lock:
+                    if not self._scanned.is_set():
+                        self._scan_sounds()
+                audio_file = self.sounds.get(sound_name)
+        elif audio_file is None and self.wait_for_rescan():
+            # The name may belong to a file added since the cached index was written
+            audio_file = self.sounds.get(sound_name)
         if audio_file:
             logger.debug(f"Playing sound: {sound_name}")
             # Get per-sound volume from metadata
@@ -284,11 +628,11 @@ class Soundboard:
             self.console.print("[yellow]⚠[/yellow] No sounds to play.")
             return
 
-        sound_names = list(self.sounds.keys())
         if shuffle:
+            sound_names = list(self.sounds.keys())
             random.shuffle(sound_names)
         else:
-            sound_names = sorted(sound_names)
+            sound_names = self.sorted_sound_names
 
         total = len(sound_names)
         mode = "randomly" if shuffle else "sequentially"
@@ -320,8 +664,10 @@ class Soundboard:
         table.add_column("Sound Name", style="white")
         table.add_column("Hotkey", style="green", justify="center")
 
-        for idx, name in enumerate(sorted(self.sounds.keys()), 1):
-            hotkey = next((k for k, v in self.hotkeys.items() if v == name), None)
+        hotkey_by_sound = self.hotkeys_by_sound()
+
+        for idx, name in enumerate(self.sorted_sound_names, 1):
+            hotkey = hotkey_by_sound.get(name)
             hotkey_display = hotkey.upper() if hotkey else "-"
             table.add_row(str(idx), name, hotkey_display)
 
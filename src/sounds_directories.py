@@ -1,6 +1,8 @@
 # Copyright (c) 2025. All rights reserved.
 """Multiple sounds directory management for MUC Soundboard."""
 
+import os
+from collections.abc import Iterator
 from pathlib import Path
 
 from rich.console import Console
@@ -11,6 +13,64 @@ from .validators import SUPPORTED_FORMATS
 
 logger = get_logger(__name__)
 
+# A tuple so one str.endswith call checks every extension
+AUDIO_EXTENSIONS = tuple(sorted(ext.lower() for ext in SUPPORTED_FORMATS))
+
+
+def iter_audio_entries(directory: Path) -> Iterator[tuple[str, Path, os.DirEntry[str]]]:
+    """Recursively yield supported audio files under a directory with their directory entries.
+
+    Walks with os.scandir, so file types come from the directory listing and
+    only matching files get a Path object. Symlinked and hidden directories
+    are not followed. Files at the top of the directory are yielded before
+    anything in its subdirectories, and a name seen again within one
+    directory is shadowed by its first file.
+
+    The entry's stat() is cached on it and, on Windows, comes from the
+    listing itself, so callers that need file metadata should use it rather
+    than stat'ing the path again.
+
+    Args:
+        directory: Directory to walk
+
+    Yields:
+        Tuples of (sound name, file path, directory entry)
+
+    """
+    stack = [os.fspath(directory)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if not name.startswith("."):
+                        stack.append(entry.path)
+                    continue
+                if name.lower().endswith(AUDIO_EXTENSIONS) and entry.is_file():
+                    dot = name.rfind(".")
+                    if dot > 0:
+                        yield name[:dot], Path(entry.path), entry
+
+
+def iter_audio_files(directory: Path) -> Iterator[tuple[str, Path]]:
+    """Recursively yield supported audio files under a directory.
+
+    See iter_audio_entries for the walk order and which files are included.
+
+    Args:
+        directory: Directory to walk
+
+    Yields:
+        Tuples of (sound name, file path)
+
+    """
+    for name, audio_file, _ in iter_audio_entries(directory):
+        yield name, audio_file
+
 
 class SoundsDirectoryManager:
     """Manages multiple sounds directories."""
@@ -26,6 +86,26 @@ class SoundsDirectoryManager:
         if directories:
             for d in directories:
                 self.directories.append(d.resolve())
+        # Sounds found per directory, walked once and shared by every query
+        self._index: dict[Path, list[tuple[str, Path]] | None] = {}
+
+    def _directory_sounds(self, directory: Path) -> list[tuple[str, Path]] | None:
+        """Get the indexed sounds of a configured directory, walking it on first use.
+
+        Args:
+            directory: Configured sounds directory
+
+        Returns:
+            List of (sound name, file path) tuples, or None if the directory does not exist
+
+        """
+        if directory not in self._index:
+            self._index[directory] = list(iter_audio_files(directory)) if directory.exists() else None
+        return self._index[directory]
+
+    def refresh(self) -> None:
+        """Forget the indexed sounds so the next query walks the directories again."""
+        self._index.clear()
 
     def add_directory(self, path: Path) -> bool:
         """Add a sounds directory.
@@ -69,7 +149,9 @@ class SoundsDirectoryManager:
     def scan_all(self) -> dict[str, tuple[Path, Path]]:
         """Scan all directories for sounds.
 
-        Later directories take precedence for name conflicts.
+        Later directories take precedence for name conflicts; within a
+        directory the first file walked wins, so the top level shadows
+        subdirectories.
 
         Returns:
             Dict mapping sound name to (source_dir, file_path)
@@ -77,20 +159,22 @@ class SoundsDirectoryManager:
         """
         sounds: dict[str, tuple[Path, Path]] = {}
 
-        for directory in self.directories:
-            if not directory.exists():
+        # Walk from the highest priority down, so the first entry seen for a
+        # name is the one that wins and overridden files are never stored
+        for directory in reversed(self.directories):
+            directory_sounds = self._directory_sounds(directory)
+            if directory_sounds is None:
                 logger.warning(f"Sounds directory not found: {directory}")
                 continue
 
-            for audio_file in directory.rglob("*"):
-                if audio_file.suffix.lower() in SUPPORTED_FORMATS:
-                    name = audio_file.stem
-                    if name in sounds:
-                        _, old_path = sounds[name]
-                        logger.debug(
-                            f"Sound '{name}' overridden: {old_path} -> {audio_file}",
-                        )
-                    sounds[name] = (directory, audio_file)
+            for name, audio_file in directory_sounds:
+                if name in sounds:
+                    _, active_path = sounds[name]
+                    logger.debug(
+                        f"Sound '{name}' overridden: {audio_file} -> {active_path}",
+                    )
+                    continue
+                sounds[name] = (directory, audio_file)
 
         logger.info(f"Found {len(sounds)} sounds across {len(self.directories)} directories")
         return sounds
@@ -106,16 +190,8 @@ class SoundsDirectoryManager:
 
         """
         sounds: dict[str, Path] = {}
-        directory = directory.resolve()
-
-        if not directory.exists():
-            return sounds
-
-        for audio_file in directory.rglob("*"):
-            if audio_file.suffix.lower() in SUPPORTED_FORMATS:
-                name = audio_file.stem
-                sounds[name] = audio_file
-
+        for name, audio_file in iter_audio_files(directory.resolve()):
+            sounds.setdefault(name, audio_file)
         return sounds
 
     def get_sound_counts(self) -> dict[Path, int]:
@@ -127,11 +203,8 @@ class SoundsDirectoryManager:
         """
         counts: dict[Path, int] = {}
         for directory in self.directories:
-            if directory.exists():
-                count = sum(1 for f in directory.rglob("*") if f.suffix.lower() in SUPPORTED_FORMATS)
-                counts[directory] = count
-            else:
-                counts[directory] = 0
+            directory_sounds = self._directory_sounds(directory)
+            counts[directory] = len(directory_sounds) if directory_sounds is not None else 0
         return counts
 
     def list_directories(self, console: Console) -> None:
@@ -148,8 +221,9 @@ class SoundsDirectoryManager:
         table.add_column("Status", justify="center")
 
         for idx, directory in enumerate(self.directories, 1):
-            if directory.exists():
-                count = sum(1 for f in directory.rglob("*") if f.suffix.lower() in SUPPORTED_FORMATS)
+            directory_sounds = self._directory_sounds(directory)
+            if directory_sounds is not None:
+                count = len(directory_sounds)
                 status = "[green]OK[/green]"
             else:
                 count = 0
@@ -187,8 +261,8 @@ class SoundsDirectoryManager:
     def find_sound(self, name: str) -> tuple[Path, Path] | None:
         """Find a specific sound across all directories.
 
-        Searches directories in order, returns the last match
-        (matching the override behavior).
+        Searches directories in order, returns the match from the last
+        directory that has one (matching the override behavior).
 
         Args:
             name: Sound name to find
@@ -200,13 +274,11 @@ class SoundsDirectoryManager:
         result: tuple[Path, Path] | None = None
 
         for directory in self.directories:
-            if not directory.exists():
-                continue
-
-            for audio_file in directory.rglob("*"):
-                if audio_file.suffix.lower() in SUPPORTED_FORMATS and audio_file.stem == name:
+            for sound_name, audio_file in self._directory_sounds(directory) or ():
+                if sound_name == name:
                     result = (directory, audio_file)
-                    # Continue searching to get the last match
+                    # Continue with the next directory to get the last match
+                    break
 
         return result
 
@@ -220,15 +292,10 @@ class SoundsDirectoryManager:
         all_sounds: dict[str, list[tuple[Path, Path]]] = {}
 
         for directory in self.directories:
-            if not directory.exists():
-                continue
-
-            for audio_file in directory.rglob("*"):
-                if audio_file.suffix.lower() in SUPPORTED_FORMATS:
-                    name = audio_file.stem
-                    if name not in all_sounds:
-                        all_sounds[name] = []
-                    all_sounds[name].append((directory, audio_file))
+            for name, audio_file in self._directory_sounds(directory) or ():
+                if name not in all_sounds:
+                    all_sounds[name] = []
+                all_sounds[name].append((directory, audio_file))
 
         # Return only sounds with conflicts (more than one source)
         return {name: sources for name, sources in all_sounds.items() if len(sources) > 1}
@@ -1,7 +1,6 @@
 # Copyright (c) 2025. All rights reserved.
 """Status bar display for listen mode."""
 
-import time
 from datetime import UTC, datetime
 from threading import Event, Thread
 
@@ -69,6 +68,24 @@ class StatusDisplay:
             return f"{hours}:{minutes:02d}:{seconds:02d}"
         return f"{minutes}:{seconds:02d}"
 
+    def _display_state(self) -> tuple[object, ...]:
+        """Snapshot the values shown in the panel.
+
+        Returns:
+            Tuple that changes whenever the rendered panel would
+
+        """
+        return (
+            self.device_name,
+            self.volume,
+            self.sound_count,
+            self.hotkey_count,
+            self.last_played,
+            self.last_played_key,
+            self.is_playing,
+            self._format_uptime(),
+        )
+
     def _build_display(self) -> Panel:
         """Build the status panel.
 
@@ -181,12 +198,14 @@ class StatusDisplay:
         )
         self._live.start()
 
-        # Start update thread
+        # Start update thread; the panel is only rebuilt when what it shows changed
         def update_loop() -> None:
-            while not self._stop_event.is_set():
-                if self._live:
+            shown = self._display_state()
+            while not self._stop_event.wait(0.5):
+                state = self._display_state()
+                if state != shown and self._live:
                     self._live.update(self._build_display())
-                time.sleep(0.5)
+                    shown = state
 
         self._update_thread = Thread(target=update_loop, daemon=True)
         self._update_thread.start()
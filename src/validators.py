@@ -2,8 +2,10 @@
 """Validation utilities for MUC Soundboard."""
 
 import json
+import struct
+from collections.abc import Mapping, Sequence
 from pathlib import Path
-from typing import NamedTuple
+from typing import Any, NamedTuple
 
 import sounddevice as sd
 import soundfile as sf
@@ -50,6 +52,76 @@ class DeviceInfo(NamedTuple):
     is_valid_output: bool
 
 
+class WavLayout(NamedTuple):
+    """Sample format and data location of a plain WAV file."""
+
+    format_tag: int
+    channels: int
+    sample_rate: int
+    bits_per_sample: int
+    block_align: int
+    data_offset: int
+    data_size: int
+
+    @property
+    def frames(self) -> int:
+        """Number of complete sample frames in the data chunk."""
+        return self.data_size // self.block_align
+
+
+# WAVE_FORMAT_PCM, WAVE_FORMAT_IEEE_FLOAT and WAVE_FORMAT_EXTENSIBLE
+_WAV_FORMAT_TAGS = frozenset({0x0001, 0x0003, 0xFFFE})
+
+
+def read_wav_layout(file_path: Path) -> WavLayout | None:
+    """Read the sample format and data chunk position from a WAV header.
+
+    Only walks the RIFF chunk headers, skipping libsndfile's format probe.
+    Anything unusual (compressed codecs, RF64, truncated data) returns None
+    so the caller can fall back to soundfile.
+
+    Args:
+        file_path: Path to the .wav file
+
+    Returns:
+        WavLayout, or None if the file is not a plain PCM/float WAV
+
+    """
+    with file_path.open("rb") as f:
+        riff = f.read(12)
+        if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:] != b"WAVE":
+            return None
+
+        fmt: tuple[int, int, int, int, int] | None = None
+        while True:
+            chunk = f.read(8)
+            if len(chunk) < 8:
+                return None
+            chunk_id, size = chunk[:4], struct.unpack("<I", chunk[4:])[0]
+            if chunk_id == b"fmt ":
+                fields = f.read(16)
+                if size < 16 or len(fields) < 16:
+                    return None
+                tag, channels, sample_rate, _, block_align, bits = struct.unpack("<HHIIHH", fields)
+                fmt = (tag, channels, sample_rate, block_align, bits)
+                f.seek(size - 16 + (size & 1), 1)
+            elif chunk_id == b"data":
+                break
+            else:
+                # Chunks are word-aligned
+                f.seek(size + (size & 1), 1)
+
+        data_start = f.tell()
+        data_available = f.seek(0, 2) - data_start
+
+    if fmt is None:
+        return None
+    tag, channels, sample_rate, block_align, bits = fmt
+    if tag not in _WAV_FORMAT_TAGS or not channels or not sample_rate or not block_align or size > data_available:
+        return None
+    return WavLayout(tag, channels, sample_rate, bits, block_align, data_start, size)
+
+
 def validate_audio_file(file_path: Path, *, warn_long_duration: bool = True) -> AudioFileInfo:
     """Validate an audio file and return its information.
 
@@ -91,11 +163,18 @@ def validate_audio_file(file_path: Path, *, warn_long_duration: bool = True) ->
         )
 
     try:
-        info = sf.info(str(file_path))
-        duration = info.duration
-        sample_rate = info.samplerate
-        channels = info.channels
-        file_format = info.format
+        layout = read_wav_layout(file_path) if suffix == ".wav" else None
+        if layout is not None:
+            duration = layout.frames / layout.sample_rate
+            sample_rate = layout.sample_rate
+            channels = layout.channels
+            file_format = "WAV"
+        else:
+            info = sf.info(str(file_path))
+            duration = info.duration
+            sample_rate = info.samplerate
+            channels = info.channels
+            file_format = info.format
 
         logger.debug(
             f"Audio file valid: {file_path.name} (duration={duration:.2f}s, rate={sample_rate}, channels={channels})",
@@ -152,11 +231,13 @@ def validate_audio_file_safe(file_path: Path, *, warn_long_duration: bool = Fals
         )
 
 
-def validate_device(device_id: int) -> DeviceInfo:
+def validate_device(device_id: int, devices: Sequence[Mapping[str, Any]] | None = None) -> DeviceInfo:
     """Validate an audio device.
 
     Args:
         device_id: ID of the device to validate
+        devices: Device info dicts indexed by device ID, e.g. an already cached
+            enumeration (queried from PortAudio if None)
 
     Returns:
         DeviceInfo with device details
@@ -164,7 +245,8 @@ def validate_device(device_id: int) -> DeviceInfo:
     """
     logger.debug(f"Validating device ID: {device_id}")
 
-    devices = sd.query_devices()
+    if devices is None:
+        devices = sd.query_devices()  # pyright: ignore[reportAssignmentType]
     if device_id < 0 or device_id >= len(devices):
         raise DeviceNotFoundError(
             f"Device ID {device_id} does not exist",
@@ -172,12 +254,10 @@ def validate_device(device_id: int) -> DeviceInfo:
             details={"device_id": device_id, "max_id": len(devices) - 1},
         )
 
-    device = sd.query_devices(device_id)
-    # Type narrowing: when called with int, returns dict not DeviceList
-    device_dict: dict = device  # type: ignore[assignment]
-    name = str(device_dict["name"])
-    input_channels = int(device_dict["max_input_channels"])
-    output_channels = int(device_dict["max_output_channels"])
+    device = devices[device_id]
+    name = str(device["name"])
+    input_channels = int(device["max_input_channels"])
+    output_channels = int(device["max_output_channels"])
 
     if output_channels == 0:
         raise DeviceNoOutputError(
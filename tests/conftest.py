@@ -2,19 +2,24 @@
 # ruff: noqa: DOC201, DOC402
 """Shared pytest fixtures for MUC tests."""
 
-import tempfile
-from collections.abc import Generator
+import io
+import json
+import shutil
+import sys
+from collections.abc import Generator, Mapping
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
 
-import numpy as np
 import pytest
 from rich.console import Console
 
 from src.exceptions import DeviceNoOutputError, DeviceNotFoundError
 from src.logging_config import reset_logging
-from src.validators import AudioFileInfo, DeviceInfo
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 @pytest.fixture(autouse=True)
@@ -24,42 +29,81 @@ def reset_loguru() -> Generator[None]:
     reset_logging()
 
 
+def _refresh_device_cache() -> None:
+    """Clear the process-wide device enumeration, if the audio stack has been imported at all."""
+    # Importing src.audio_manager here would load numpy for every test, audio or not
+    audio_manager = sys.modules.get("src.audio_manager")
+    if audio_manager is not None:
+        audio_manager.AudioManager.refresh_devices()
+
+
+@pytest.fixture(autouse=True)
+def reset_device_cache() -> Generator[None]:
+    """Clear the process-wide device enumeration so each test sees its own mock devices."""
+    _refresh_device_cache()
+    yield
+    _refresh_device_cache()
+
+
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Resolve Path.home() to a fresh directory so no test reads or writes the user's ~/.muc."""
+    home = tmp_path_factory.mktemp("home")
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))
+    # LOG_DIR is computed at import time, before HOME is redirected
+    monkeypatch.setattr("src.logging_config.LOG_DIR", home / ".muc" / "logs")
+    monkeypatch.setattr("src.logging_config.LOG_FILE", home / ".muc" / "logs" / "muc.log")
+    return home
+
+
 @pytest.fixture
 def console() -> Console:
-    """Create a console that captures output for testing."""
+    """Create a plain console that discards output, for tests that never read it."""
+    return Console(file=io.StringIO(), width=120, no_color=True)
+
+
+@pytest.fixture
+def recording_console() -> Console:
+    """Create a console that records output for tests that inspect it with export_text()."""
     return Console(force_terminal=True, width=120, record=True)
 
 
 @pytest.fixture
-def temp_dir() -> Generator[Path]:
-    """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def muc_home(tmp_path: Path) -> Path:
+    """Create a temporary home directory with an empty .muc config directory."""
+    (tmp_path / ".muc").mkdir()
+    return tmp_path
 
 
 @pytest.fixture
-def temp_config_file(temp_dir: Path) -> Path:
+def temp_config_file(muc_home: Path) -> Path:
     """Create a temporary config file path."""
-    config_dir = temp_dir / ".muc"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    return config_dir / "config.json"
+    return muc_home / ".muc" / "config.json"
 
 
-@pytest.fixture
-def sample_config_data() -> dict:
-    """Sample configuration data for testing."""
-    return {
-        "output_device_id": 5,
-        "sounds_dir": "/path/to/sounds",
-        "volume": 0.75,
-    }
+@pytest.fixture(scope="session")
+def sample_config_data() -> Mapping[str, Any]:
+    """Sample configuration data for testing (read-only, shared across the session)."""
+    return MappingProxyType(
+        {
+            "output_device_id": 5,
+            "sounds_dir": "/path/to/sounds",
+            "volume": 0.75,
+        }
+    )
 
 
-@pytest.fixture
-def temp_sounds_dir(temp_dir: Path) -> Path:
-    """Create a temporary sounds directory with sample placeholder files."""
-    sounds_dir = temp_dir / "sounds"
-    sounds_dir.mkdir(parents=True, exist_ok=True)
+@pytest.fixture(scope="session")
+def sample_config_json(sample_config_data: Mapping[str, Any]) -> str:
+    """Sample configuration serialized once as JSON text."""
+    return json.dumps(dict(sample_config_data))
+
+
+@pytest.fixture(scope="module")
+def temp_sounds_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a sounds directory with sample placeholder files, shared read-only by a test module."""
+    sounds_dir = tmp_path_factory.mktemp("sounds")
 
     # Create empty placeholder files (actual audio not needed for scanning tests)
     (sounds_dir / "sound1.wav").touch()
@@ -67,13 +111,21 @@ def temp_sounds_dir(temp_dir: Path) -> Path:
     (sounds_dir / "sound3.ogg").touch()
     (sounds_dir / "subdir").mkdir()
     (sounds_dir / "subdir" / "sound4.flac").touch()
+    (sounds_dir / "readme.txt").touch()  # Not audio; scans must skip it
 
     return sounds_dir
 
 
+@pytest.fixture
+def writable_sounds_dir(temp_sounds_dir: Path, tmp_path: Path) -> Path:
+    """Copy the sample sounds directory for tests that add or change files."""
+    return Path(shutil.copytree(temp_sounds_dir, tmp_path / "sounds"))
+
+
 @pytest.fixture
 def mock_audio_validation() -> Generator[None]:
     """Mock audio file validation to allow dummy files in tests."""
+    from src.validators import AudioFileInfo  # noqa: PLC0415
 
     def mock_validate(file_path: Path) -> AudioFileInfo:
         """Return mock validation info for any supported audio file."""
@@ -92,10 +144,11 @@ def mock_audio_validation() -> Generator[None]:
 
 
 @pytest.fixture
-def mock_device_validation(mock_device_list: list[dict[str, int | str]]) -> Generator[None]:
+def mock_device_validation(mock_device_list: tuple[Mapping[str, int | str], ...]) -> Generator[None]:
     """Mock device validation for audio manager tests."""
+    from src.validators import DeviceInfo  # noqa: PLC0415
 
-    def mock_validate(device_id: int) -> DeviceInfo:
+    def mock_validate(device_id: int, _devices: object = None) -> DeviceInfo:
         """Return mock validation info for devices.
 
         Raises:
@@ -129,50 +182,70 @@ def mock_device_validation(mock_device_list: list[dict[str, int | str]]) -> Gene
         yield
 
 
-@pytest.fixture
-def mock_device_list() -> list[dict[str, int | str]]:
-    """Mock device list for testing."""
-    return [
-        {"name": "Speakers (Realtek)", "max_input_channels": 0, "max_output_channels": 2},
-        {"name": "Microphone (Realtek)", "max_input_channels": 2, "max_output_channels": 0},
-        {"name": "CABLE Input (VB-Audio Virtual Cable)", "max_input_channels": 0, "max_output_channels": 8},
-        {"name": "CABLE Output (VB-Audio Virtual Cable)", "max_input_channels": 8, "max_output_channels": 0},
-        {"name": "Headphones (USB Audio)", "max_input_channels": 0, "max_output_channels": 2},
-    ]
+@pytest.fixture(scope="session")
+def mock_device_list() -> tuple[Mapping[str, int | str], ...]:
+    """Mock device list for testing (read-only, shared across the session)."""
+    return tuple(
+        MappingProxyType(device)
+        for device in (
+            {"name": "Speakers (Realtek)", "max_input_channels": 0, "max_output_channels": 2},
+            {"name": "Microphone (Realtek)", "max_input_channels": 2, "max_output_channels": 0},
+            {"name": "CABLE Input (VB-Audio Virtual Cable)", "max_input_channels": 0, "max_output_channels": 8},
+            {"name": "CABLE Output (VB-Audio Virtual Cable)", "max_input_channels": 8, "max_output_channels": 0},
+            {"name": "Headphones (USB Audio)", "max_input_channels": 0, "max_output_channels": 2},
+        )
+    )
 
 
 @pytest.fixture
-def mock_sounddevice(mock_device_list: list[dict[str, int | str]]) -> Generator[MagicMock]:
+def mock_sounddevice(
+    mock_device_list: tuple[Mapping[str, int | str], ...], monkeypatch: pytest.MonkeyPatch
+) -> MagicMock:
     """Mock sounddevice module for testing without audio hardware."""
-    with patch("src.audio_manager.sd") as mock_sd:
-        # Set up device query behavior
-        def query_devices_handler(idx: int | None = None) -> Any:  # noqa: ANN401
-            if idx is None:
-                return mock_device_list
-            if 0 <= idx < len(mock_device_list):
-                return mock_device_list[idx]
-            msg = f"Invalid device index: {idx}"
-            raise ValueError(msg)
+    mock_sd = MagicMock()
+
+    # Set up device query behavior
+    def query_devices_handler(idx: int | None = None) -> Any:  # noqa: ANN401
+        if idx is None:
+            return mock_device_list
+        if 0 <= idx < len(mock_device_list):
+            return mock_device_list[idx]
+        msg = f"Invalid device index: {idx}"
+        raise ValueError(msg)
+
+    mock_sd.query_devices = MagicMock(side_effect=query_devices_handler)
+    mock_sd.RawOutputStream = MagicMock()
+    mock_sd.play = MagicMock()
+    mock_sd.stop = MagicMock()
+    mock_sd.get_stream = MagicMock(return_value=None)
+
+    monkeypatch.setattr("src.audio_manager.sd", mock_sd)
+    return mock_sd
 
-        mock_sd.query_devices = MagicMock(side_effect=query_devices_handler)
-        mock_sd.play = MagicMock()
-        mock_sd.stop = MagicMock()
-        mock_sd.get_stream = MagicMock(return_value=None)
 
-        yield mock_sd
+@pytest.fixture(scope="session")
+def stereo_audio() -> "np.ndarray":
+    """One second of silent stereo audio at 44100Hz, allocated once and shared read-only."""
+    import numpy as np  # noqa: PLC0415
+
+    data = np.zeros((44100, 2), dtype=np.float32)
+    data.flags.writeable = False
+    return data
 
 
 @pytest.fixture
-def mock_soundfile() -> Generator[MagicMock]:
+def mock_soundfile(stereo_audio: "np.ndarray", monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     """Mock soundfile module for testing without actual audio files."""
-    with patch("src.audio_manager.sf") as mock_sf:
-        # Return stereo audio data by default (1 second at 44100Hz)
-        rng = np.random.default_rng()
-        mock_sf.read.return_value = (
-            rng.random((44100, 2), dtype=np.float32),
-            44100,
-        )
-        yield mock_sf
+    mock_sf = MagicMock()
+    mock_sf.read.return_value = (stereo_audio, 44100)
+    mock_sf.info.return_value = MagicMock(frames=44100, channels=2, samplerate=44100)
+    # Open handles report the same format and decode whatever read() is set to return
+    handle = mock_sf.SoundFile.return_value
+    handle.frames, handle.channels, handle.samplerate = 44100, 2, 44100
+    handle.read.side_effect = lambda *_args, **_kwargs: mock_sf.read.return_value[0]
+
+    monkeypatch.setattr("src.audio_manager.sf", mock_sf)
+    return mock_sf
 
 
 @pytest.fixture
@@ -187,10 +260,11 @@ def mock_pynput() -> Generator[MagicMock]:
 @pytest.fixture
 def mock_audio_manager(console: Console) -> MagicMock:
     """Create a mock AudioManager for Soundboard tests."""
+    # Built per test: a shared mock, reset or shallow-copied, would carry attributes,
+    # child mocks and recorded calls from one test into the next
     mock_manager = MagicMock()
     mock_manager.console = console
-    mock_manager.play_audio = MagicMock(return_value=True)
-    mock_manager.stop_audio = MagicMock()
+    mock_manager.play_audio.return_value = True
     mock_manager.output_device_id = 2
     mock_manager.volume = 1.0
     return mock_manager
@@ -1,19 +1,23 @@
 # Copyright (c) 2025. All rights reserved.
 """Integration tests for CLI commands."""
 
+import subprocess
+import sys
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
+import click
 import pytest
 from click.testing import CliRunner
 
-from src.cli import cli
+from src.audio_manager import _cached_devices
+from src.cli import _prewarm_audio, cli
 from src.profile_manager import Profile
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cli_runner() -> CliRunner:
-    """Create a Click CLI test runner.
+    """Create a Click CLI test runner shared by every test (it keeps no state between invokes).
 
     Returns:
         CliRunner: A Click testing utility for invoking CLI commands.
@@ -58,28 +62,56 @@ def use_mock_audio_validation(mock_audio_validation: MagicMock) -> MagicMock:
     return mock_audio_validation
 
 
+@pytest.fixture(autouse=True)
+def use_mock_cli_environment(
+    monkeypatch: pytest.MonkeyPatch,
+    mock_profile_manager: MagicMock,
+    mock_sounddevice: MagicMock,
+) -> MagicMock:
+    """Point every CLI command at the mock profile manager and audio devices.
+
+    Returns:
+        MagicMock: The mock sounddevice module.
+
+    """
+    monkeypatch.setattr("src.cli.ProfileManager", lambda: mock_profile_manager)
+    # Streams report playback finished, so blocking plays return at once
+    mock_sounddevice.RawOutputStream.return_value.active = False
+    return mock_sounddevice
+
+
 class TestCLIDevices:
     """Tests for 'muc devices' command."""
 
-    def test_devices_command_output(self, cli_runner: CliRunner, mock_sounddevice: MagicMock) -> None:
+    def test_devices_command_output(self, cli_runner: CliRunner) -> None:
         """Should display device table."""
-        with patch("src.audio_manager.sd", mock_sounddevice):
-            result = cli_runner.invoke(cli, ["devices"])
+        result = cli_runner.invoke(cli, ["devices"])
 
         assert result.exit_code == 0
         assert "Speakers" in result.output
         assert "CABLE Input" in result.output
 
-    def test_devices_shows_ids(self, cli_runner: CliRunner, mock_sounddevice: MagicMock) -> None:
+    def test_devices_shows_ids(self, cli_runner: CliRunner) -> None:
         """Should show device IDs in output."""
-        with patch("src.audio_manager.sd", mock_sounddevice):
-            result = cli_runner.invoke(cli, ["devices"])
+        result = cli_runner.invoke(cli, ["devices"])
 
         assert result.exit_code == 0
         # Device IDs should be present
         assert "0" in result.output
 
 
+class TestAudioPrewarm:
+    """Tests for the background audio prewarm."""
+
+    def test_prewarm_fills_device_cache(self, use_mock_cli_environment: MagicMock) -> None:
+        """Should enumerate devices into the cache AudioManager reads, so they are queried once."""
+        _prewarm_audio()
+        devices, _ = _cached_devices()
+
+        assert devices[0]["name"] == "Speakers (Realtek)"
+        use_mock_cli_environment.query_devices.assert_called_once_with()
+
+
 class TestCLIVolume:
     """Tests for 'muc volume' command."""
 
@@ -87,17 +119,12 @@ class TestCLIVolume:
         self,
         cli_runner: CliRunner,
         mock_profile_manager: MagicMock,
-        mock_sounddevice: MagicMock,
     ) -> None:
         """Should display current volume."""
         # Update profile to have specific volume
         mock_profile_manager.get_active_profile.return_value.volume = 0.75
 
-        with (
-            patch("src.cli.ProfileManager", return_value=mock_profile_manager),
-            patch("src.audio_manager.sd", mock_sounddevice),
-        ):
-            result = cli_runner.invoke(cli, ["volume"])
+        result = cli_runner.invoke(cli, ["volume"])
 
         assert result.exit_code == 0
         assert "75%" in result.output
@@ -106,14 +133,9 @@ class TestCLIVolume:
         self,
         cli_runner: CliRunner,
         mock_profile_manager: MagicMock,
-        mock_sounddevice: MagicMock,
     ) -> None:
         """Should set volume level."""
-        with (
-            patch("src.cli.ProfileManager", return_value=mock_profile_manager),
-            patch("src.audio_manager.sd", mock_sounddevice),
-        ):
-            result = cli_runner.invoke(cli, ["volume", "0.5"])
+        result = cli_runner.invoke(cli, ["volume", "0.5"])
 
         assert result.exit_code == 0
         mock_profile_manager.save_profile.assert_called_once()
@@ -122,17 +144,14 @@ class TestCLIVolume:
         self,
         cli_runner: CliRunner,
         mock_profile_manager: MagicMock,
-        mock_sounddevice: MagicMock,
     ) -> None:
         """Should reject volume outside valid range."""
-        with (
-            patch("src.cli.ProfileManager", return_value=mock_profile_manager),
-            patch("src.audio_manager.sd", mock_sounddevice),
-        ):
-            result = cli_runner.invoke(cli, ["volume", "1.5"])
+        # Outside standalone mode the error propagates instead of being rendered as a usage panel
+        result = cli_runner.invoke(cli, ["volume", "1.5"], standalone_mode=False)
 
         # Click should reject values outside FloatRange(0.0, 1.0)
-        assert result.exit_code != 0
+        assert isinstance(result.exception, click.BadParameter)
+        mock_profile_manager.save_profile.assert_not_called()
 
 
 class TestCLISounds:
@@ -142,29 +161,30 @@ class TestCLISounds:
         self,
         cli_runner: CliRunner,
         mock_profile_manager: MagicMock,
-        mock_sounddevice: MagicMock,
     ) -> None:
         """Should list available sounds."""
-        with (
-            patch("src.cli.ProfileManager", return_value=mock_profile_manager),
-            patch("src.audio_manager.sd", mock_sounddevice),
-        ):
-            result = cli_runner.invoke(cli, ["sounds"])
+        result = cli_runner.invoke(cli, ["sounds"])
 
         assert result.exit_code == 0
         assert "sound1" in result.output
 
+    def test_sounds_writes_caches_under_isolated_home(self, cli_runner: CliRunner, isolated_home: Path) -> None:
+        """Should persist the validation cache under the redirected home directory."""
+        result = cli_runner.invoke(cli, ["sounds"])
+
+        assert result.exit_code == 0
+        assert (isolated_home / ".muc" / "validation_cache.json").exists()
+
     def test_sounds_empty_directory(
         self,
         cli_runner: CliRunner,
-        temp_dir: Path,
-        mock_sounddevice: MagicMock,
+        mock_profile_manager: MagicMock,
+        tmp_path: Path,
     ) -> None:
         """Should show error for empty sounds directory."""
-        empty_dir = temp_dir / "empty_sounds"
+        empty_dir = tmp_path / "empty_sounds"
         empty_dir.mkdir()
 
-        mock_pm = MagicMock()
         profile = Profile(
             name="default",
             settings={
@@ -174,13 +194,9 @@ class TestCLISounds:
                 "sounds_dirs": [str(empty_dir)],
             },
         )
-        mock_pm.get_active_profile.return_value = profile
+        mock_profile_manager.get_active_profile.return_value = profile
 
-        with (
-            patch("src.cli.ProfileManager", return_value=mock_pm),
-            patch("src.audio_manager.sd", mock_sounddevice),
-        ):
-            result = cli_runner.invoke(cli, ["sounds"])
+        result = cli_runner.invoke(cli, ["sounds"])
 
         assert result.exit_code == 1
         assert "No sounds found" in result.output
@@ -193,14 +209,9 @@ class TestCLIHotkeys:
         self,
         cli_runner: CliRunner,
         mock_profile_manager: MagicMock,
-        mock_sounddevice: MagicMock,
     ) -> None:
         """Should display hotkey bindings."""
-        with (
-            patch("src.cli.ProfileManager", return_value=mock_profile_manager),
-            patch("src.audio_manager.sd", mock_sounddevice),
-        ):
-            result = cli_runner.invoke(cli, ["hotkeys"])
+        result = cli_runner.invoke(cli, ["hotkeys"])
 
         assert result.exit_code == 0
         # Should show F1-F4 for the 4 sounds
@@ -214,18 +225,12 @@ class TestCLIPlay:
         self,
         cli_runner: CliRunner,
         mock_profile_manager: MagicMock,
-        mock_sounddevice: MagicMock,
         mock_soundfile: MagicMock,
     ) -> None:
         """Should play specified sound."""
         mock_profile_manager.get_active_profile.return_value.output_device_id = 0
 
-        with (
-            patch("src.cli.ProfileManager", return_value=mock_profile_manager),
-            patch("src.audio_manager.sd", mock_sounddevice),
-            patch("src.audio_manager.sf", mock_soundfile),
-        ):
-            result = cli_runner.invoke(cli, ["play", "sound1"])
+        result = cli_runner.invoke(cli, ["play", "sound1"])
 
         assert result.exit_code == 0
 
@@ -233,16 +238,11 @@ class TestCLIPlay:
         self,
         cli_runner: CliRunner,
         mock_profile_manager: MagicMock,
-        mock_sounddevice: MagicMock,
     ) -> None:
         """Should warn when no output device is set."""
         mock_profile_manager.get_active_profile.return_value.output_device_id = None
 
-        with (
-            patch("src.cli.ProfileManager", return_value=mock_profile_manager),
-            patch("src.audio_manager.sd", mock_sounddevice),
-        ):
-            result = cli_runner.invoke(cli, ["play", "sound1"])
+        result = cli_runner.invoke(cli, ["play", "sound1"])
 
         # Should show error about no output device
         assert "No output device" in result.output or result.exit_code == 1
@@ -251,19 +251,30 @@ class TestCLIPlay:
         self,
         cli_runner: CliRunner,
         mock_profile_manager: MagicMock,
-        mock_sounddevice: MagicMock,
     ) -> None:
         """Should handle non-existent sound gracefully."""
         mock_profile_manager.get_active_profile.return_value.output_device_id = 0
 
-        with (
-            patch("src.cli.ProfileManager", return_value=mock_profile_manager),
-            patch("src.audio_manager.sd", mock_sounddevice),
-        ):
-            result = cli_runner.invoke(cli, ["play", "nonexistent"])
+        result = cli_runner.invoke(cli, ["play", "nonexistent"])
 
         assert "not found" in result.output.lower()
 
+    def test_play_with_empty_library(
+        self,
+        cli_runner: CliRunner,
+        mock_profile_manager: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Should exit with an error when the sounds directory has no sounds."""
+        profile = mock_profile_manager.get_active_profile.return_value
+        profile.output_device_id = 0
+        profile.sounds_dirs = [str(tmp_path)]
+
+        result = cli_runner.invoke(cli, ["play", "sound1"])
+
+        assert result.exit_code == 1
+        assert "No sounds found in sounds directory" in result.output
+
 
 class TestCLIStop:
     """Tests for 'muc stop' command."""
@@ -272,14 +283,9 @@ class TestCLIStop:
         self,
         cli_runner: CliRunner,
         mock_profile_manager: MagicMock,
-        mock_sounddevice: MagicMock,
     ) -> None:
         """Should stop currently playing sound."""
-        with (
-            patch("src.cli.ProfileManager", return_value=mock_profile_manager),
-            patch("src.audio_manager.sd", mock_sounddevice),
-        ):
-            result = cli_runner.invoke(cli, ["stop"])
+        result = cli_runner.invoke(cli, ["stop"])
 
         assert result.exit_code == 0
         assert "Stopped" in result.output
@@ -292,15 +298,10 @@ class TestCLISetup:
         self,
         cli_runner: CliRunner,
         mock_profile_manager: MagicMock,
-        mock_sounddevice: MagicMock,
     ) -> None:
         """Should find and suggest virtual cable during setup."""
-        with (
-            patch("src.cli.ProfileManager", return_value=mock_profile_manager),
-            patch("src.audio_manager.sd", mock_sounddevice),
-        ):
-            # Answer 'yes' to use detected device
-            result = cli_runner.invoke(cli, ["setup"], input="y\n")
+        # Answer 'yes' to use detected device
+        result = cli_runner.invoke(cli, ["setup"], input="y\n")
 
         assert result.exit_code == 0
         assert "virtual audio device" in result.output.lower() or "CABLE" in result.output
@@ -309,12 +310,11 @@ class TestCLISetup:
 class TestCLIAuto:
     """Tests for 'muc auto' command."""
 
-    def test_auto_no_sounds(self, cli_runner: CliRunner, temp_dir: Path, mock_sounddevice: MagicMock) -> None:
+    def test_auto_no_sounds(self, cli_runner: CliRunner, mock_profile_manager: MagicMock, tmp_path: Path) -> None:
         """Should show error when no sounds available."""
-        empty_dir = temp_dir / "empty"
+        empty_dir = tmp_path / "empty"
         empty_dir.mkdir()
 
-        mock_pm = MagicMock()
         profile = Profile(
             name="default",
             settings={
@@ -324,18 +324,28 @@ class TestCLIAuto:
                 "sounds_dirs": [str(empty_dir)],
             },
         )
-        mock_pm.get_active_profile.return_value = profile
+        mock_profile_manager.get_active_profile.return_value = profile
 
-        with (
-            patch("src.cli.ProfileManager", return_value=mock_pm),
-            patch("src.audio_manager.sd", mock_sounddevice),
-        ):
-            result = cli_runner.invoke(cli, ["auto"])
+        result = cli_runner.invoke(cli, ["auto"])
 
         assert result.exit_code == 1
         assert "No sounds found" in result.output
 
 
+class TestCLICache:
+    """Tests for 'muc cache' commands."""
+
+    def test_cache_stats_does_not_scan_sounds(self, cli_runner: CliRunner, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should report cache statistics without building a soundboard."""
+        mock_get_soundboard = MagicMock()
+        monkeypatch.setattr("src.cli.get_soundboard", mock_get_soundboard)
+        result = cli_runner.invoke(cli, ["cache", "stats"])
+
+        assert result.exit_code == 0
+        assert "Cached Sounds" in result.output
+        mock_get_soundboard.assert_not_called()
+
+
 class TestCLIMainCommand:
     """Tests for main 'muc' command."""
 
@@ -361,3 +371,17 @@ class TestCLIMainCommand:
 
         assert result.exit_code == 0
         assert "0.5.1" in result.output
+
+    def test_import_does_not_load_audio_backends(self) -> None:
+        """Should defer sounddevice, soundfile and pynput until a command needs them."""
+        backends = ("sounddevice", "soundfile", "pynput")
+        script = f"import sys, src.cli; print(','.join(m for m in {backends!r} if m in sys.modules))"
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", script],
+            capture_output=True,
+            check=True,
+            cwd=Path(__file__).parents[2],
+            text=True,
+        )
+
+        assert not result.stdout.strip()
@@ -2,13 +2,21 @@
 # ruff: noqa: ARG002
 """Unit tests for AudioManager class."""
 
+import queue
+import threading
+import time
+from io import StringIO
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import numpy as np
+import pytest
+import soundfile as sf
 from rich.console import Console
 
 from src.audio_manager import AudioManager
+from src.cache import DecodedAudioStore
+from src.validators import read_wav_layout
 
 
 class TestAudioManagerDevices:
@@ -69,6 +77,55 @@ class TestAudioManagerDevices:
 
             assert cable_id == 1
 
+    def test_device_enumeration_is_cached(self, console: Console, mock_sounddevice: MagicMock) -> None:
+        """Should query PortAudio once and reuse the device list until refreshed."""
+        with patch("src.audio_manager.sd", mock_sounddevice):
+            manager = AudioManager(console)
+            manager.find_virtual_cable()
+            manager.print_devices()
+            manager.list_devices()
+
+            assert mock_sounddevice.query_devices.call_count == 1
+
+            manager.refresh_devices()
+            manager.list_devices()
+
+            assert mock_sounddevice.query_devices.call_count == 2
+
+    def test_device_enumeration_shared_across_instances(
+        self,
+        console: Console,
+        mock_sounddevice: MagicMock,
+    ) -> None:
+        """Should reuse one enumeration for every AudioManager in the process."""
+        with patch("src.audio_manager.sd", mock_sounddevice):
+            AudioManager(console).list_devices()
+            AudioManager(console).find_virtual_cable()
+
+            assert mock_sounddevice.query_devices.call_count == 1
+
+    def test_concurrent_first_enumeration_queries_once(
+        self,
+        console: Console,
+        mock_sounddevice: MagicMock,
+    ) -> None:
+        """Should make a caller racing the first enumeration wait for its result."""
+        devices = mock_sounddevice.query_devices.return_value
+
+        def slow_query() -> object:
+            time.sleep(0.1)
+            return devices
+
+        mock_sounddevice.query_devices.side_effect = slow_query
+        with patch("src.audio_manager.sd", mock_sounddevice):
+            threads = [threading.Thread(target=AudioManager(console).list_devices) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+
+            assert mock_sounddevice.query_devices.call_count == 1
+
 
 class TestAudioManagerSetOutputDevice:
     """Tests for set_output_device method."""
@@ -87,6 +144,22 @@ class TestAudioManagerSetOutputDevice:
             assert result is True
             assert manager.output_device_id == 0
 
+    def test_set_output_device_and_play_enumerate_once(
+        self,
+        console: Console,
+        mock_sounddevice: MagicMock,
+        mock_soundfile: MagicMock,
+        temp_sounds_dir: Path,
+    ) -> None:
+        """Should validate the device against the cached enumeration on set and on play."""
+        mock_sounddevice.RawOutputStream.return_value.active = False
+        with patch("src.validators.sd", mock_sounddevice):
+            manager = AudioManager(console)
+            assert manager.set_output_device(0) is True
+            assert manager.play_audio(temp_sounds_dir / "sound2.mp3") is True
+
+        mock_sounddevice.query_devices.assert_called_once_with()
+
     def test_set_output_device_no_output_channels(
         self,
         console: Console,
@@ -205,6 +278,30 @@ class TestAudioManagerChannelAdjustment:
         np.testing.assert_array_almost_equal(result[:, 0], [0.5, 0.2])
         np.testing.assert_array_almost_equal(result[:, 1], [0.3, 0.1])
 
+    def test_upmix_mono_to_surround(self, console: Console) -> None:
+        """Should broadcast mono to every output channel, keeping float32."""
+        manager = AudioManager(console)
+        mono_data = np.array([[0.5], [0.3]], dtype=np.float32)
+
+        result = manager._adjust_channels(mono_data, 8)
+
+        assert result.shape == (2, 8)
+        assert result.dtype == np.float32
+        assert result.strides[1] == 0  # broadcast view, not a copy
+        np.testing.assert_array_almost_equal(result, np.repeat(mono_data, 8, axis=1))
+
+    def test_upmix_pads_remaining_channels_with_silence(self, console: Console) -> None:
+        """Should duplicate stereo and leave leftover channels silent."""
+        manager = AudioManager(console)
+        stereo_data = np.array([[0.5, 0.3], [0.2, 0.1]], dtype=np.float32)
+
+        result = manager._adjust_channels(stereo_data, 5)
+
+        assert result.shape == (2, 5)
+        assert result.dtype == np.float32
+        np.testing.assert_array_almost_equal(result[:, 2:4], stereo_data)
+        np.testing.assert_array_equal(result[:, 4], [0.0, 0.0])
+
     def test_preserve_channels_when_matching(self, console: Console) -> None:
         """Should preserve audio when channels already match."""
         manager = AudioManager(console)
@@ -229,6 +326,17 @@ class TestAudioManagerChannelAdjustment:
         np.testing.assert_array_almost_equal(result[:, 0], [0.1, 0.6])
         np.testing.assert_array_almost_equal(result[:, 1], [0.2, 0.5])
 
+    @pytest.mark.parametrize(("src_channels", "max_channels"), [(1, 2), (2, 2), (2, 5), (6, 2), (1, 8)])
+    def test_adjust_into_matches_adjust_channels(self, console: Console, src_channels: int, max_channels: int) -> None:
+        """Should write the same scaled output into a preallocated buffer."""
+        manager = AudioManager(console)
+        data = np.arange(4 * src_channels, dtype=np.float32).reshape(4, src_channels)
+        out = np.full((4, max_channels), np.nan, dtype=np.float32)
+
+        manager._adjust_channels_into(data, out, 0.5)
+
+        np.testing.assert_array_almost_equal(out, manager._adjust_channels(data, max_channels) * 0.5)
+
 
 class TestAudioManagerPlayback:
     """Tests for audio playback functionality."""
@@ -242,12 +350,12 @@ class TestAudioManagerPlayback:
 
         assert result is False
 
-    def test_play_audio_file_not_found(self, console: Console, mock_sounddevice: MagicMock, temp_dir: Path) -> None:
+    def test_play_audio_file_not_found(self, console: Console, mock_sounddevice: MagicMock, tmp_path: Path) -> None:
         """Should fail gracefully when audio file doesn't exist."""
         with patch("src.audio_manager.sd", mock_sounddevice):
             manager = AudioManager(console)
             manager.output_device_id = 0
-            nonexistent_file = temp_dir / "nonexistent.wav"
+            nonexistent_file = tmp_path / "nonexistent.wav"
 
             result = manager.play_audio(nonexistent_file)
 
@@ -270,7 +378,9 @@ class TestAudioManagerPlayback:
             result = manager.play_audio(audio_file)
 
             assert result is True
-            mock_sounddevice.play.assert_called_once()
+            mock_sounddevice.RawOutputStream.assert_called_once()
+            mock_sounddevice.RawOutputStream.return_value.start.assert_called_once()
+            assert manager.is_playing() is True
 
     def test_play_audio_applies_volume(
         self,
@@ -293,44 +403,429 @@ class TestAudioManagerPlayback:
 
             manager.play_audio(audio_file)
 
-            # Check the data passed to sd.play has been scaled
-            call_args = mock_sounddevice.play.call_args
-            played_data = call_args[0][0]
+            # Check the data handed to the output stream has been scaled
+            played_data = manager._playback_data
+            assert played_data is not None
             # Volume 0.5 should scale down the data
             assert np.max(played_data) <= 0.5
 
-    def test_stop_audio(self, console: Console, mock_sounddevice: MagicMock) -> None:
-        """Should stop audio playback."""
-        with patch("src.audio_manager.sd", mock_sounddevice):
+    def test_play_audio_reuses_cached_decode(
+        self,
+        console: Console,
+        mock_sounddevice: MagicMock,
+        mock_soundfile: MagicMock,
+        mock_device_validation: MagicMock,
+        temp_sounds_dir: Path,
+    ) -> None:
+        """Should decode once, reuse the open stream, and leave the cached buffer unscaled."""
+        with patch("src.audio_manager.sd", mock_sounddevice), patch("src.audio_manager.sf", mock_soundfile):
+            original_data = np.ones((100, 2), dtype=np.float32)
+            mock_soundfile.read.return_value = (original_data, 44100)
+
+            manager = AudioManager(console)
+            manager.set_output_device(0)
+            manager.volume = 0.5
+            audio_file = temp_sounds_dir / "sound1.wav"
+
+            manager.play_audio(audio_file)
+            manager.play_audio(audio_file)
+
+            # Opened once, and the same handle decoded without a separate header probe
+            mock_soundfile.SoundFile.assert_called_once()
+            mock_soundfile.SoundFile.return_value.read.assert_called_once()
+            mock_soundfile.info.assert_not_called()
+            mock_sounddevice.RawOutputStream.assert_called_once()
+            np.testing.assert_array_equal(original_data, 1.0)
+            assert np.max(manager._playback_data) == 0.5  # pyright: ignore[reportArgumentType]
+
+    def test_play_audio_stats_file_once(
+        self,
+        console: Console,
+        mock_sounddevice: MagicMock,
+        mock_soundfile: MagicMock,
+        mock_device_validation: MagicMock,
+        temp_sounds_dir: Path,
+    ) -> None:
+        """Should reuse the existence check's stat to validate the cache entry."""
+        with (
+            patch("src.audio_manager.sd", mock_sounddevice),
+            patch("src.audio_manager.sf", mock_soundfile),
+            patch("src.audio_manager.file_mtime_ns") as mock_mtime,
+        ):
+            manager = AudioManager(console)
+            manager.set_output_device(0)
+            audio_file = temp_sounds_dir / "sound1.wav"
+
+            assert manager.play_audio(audio_file) is True
+
+            mock_mtime.assert_not_called()
+            assert manager._cache.get(str(audio_file), mtime_ns=audio_file.stat().st_mtime_ns) is not None
+
+    def test_play_audio_skips_device_query_while_stream_runs(
+        self,
+        console: Console,
+        mock_sounddevice: MagicMock,
+        mock_soundfile: MagicMock,
+        temp_sounds_dir: Path,
+    ) -> None:
+        """Should only re-validate the device when no stream is running on it."""
+        with (
+            patch("src.audio_manager.sd", mock_sounddevice),
+            patch("src.audio_manager.sf", mock_soundfile),
+            patch("src.audio_manager.validate_device") as mock_validate,
+        ):
             manager = AudioManager(console)
+            manager.output_device_id = 0
+            audio_file = temp_sounds_dir / "sound1.wav"
+
+            assert manager.play_audio(audio_file) is True
+            assert manager.play_audio(audio_file) is True
+            assert mock_validate.call_count == 1
+
+            manager.current_stream.active = False  # pyright: ignore[reportOptionalMemberAccess]
+            assert manager.play_audio(audio_file) is True
+            assert mock_validate.call_count == 2
+
+    def test_stop_audio(
+        self,
+        console: Console,
+        mock_sounddevice: MagicMock,
+        mock_soundfile: MagicMock,
+        mock_device_validation: MagicMock,
+        temp_sounds_dir: Path,
+    ) -> None:
+        """Should stop audio playback but keep the output stream open."""
+        with patch("src.audio_manager.sd", mock_sounddevice), patch("src.audio_manager.sf", mock_soundfile):
+            manager = AudioManager(console)
+            manager.set_output_device(0)
+            manager.play_audio(temp_sounds_dir / "sound1.wav")
+
             manager.stop_audio()
 
-            mock_sounddevice.stop.assert_called_once()
+            assert manager.is_playing() is False
+            mock_sounddevice.RawOutputStream.return_value.close.assert_not_called()
+
+    def test_close_releases_stream(
+        self,
+        console: Console,
+        mock_sounddevice: MagicMock,
+        mock_soundfile: MagicMock,
+        mock_device_validation: MagicMock,
+        temp_sounds_dir: Path,
+    ) -> None:
+        """Should stop and close the output stream on close()."""
+        with patch("src.audio_manager.sd", mock_sounddevice), patch("src.audio_manager.sf", mock_soundfile):
+            manager = AudioManager(console)
+            manager.set_output_device(0)
+            manager.play_audio(temp_sounds_dir / "sound1.wav")
+
+            manager.close()
+
+            mock_sounddevice.RawOutputStream.return_value.close.assert_called_once()
+            assert manager.current_stream is None
+
+
+class TestAudioManagerStreamCallback:
+    """Tests for the output stream callback."""
+
+    def test_callback_copies_frames_and_advances(self, console: Console) -> None:
+        """Should copy the next block and advance the playback position."""
+        manager = AudioManager(console)
+        manager._playback_data = np.arange(8, dtype=np.float32).reshape(4, 2)
+        outdata = np.empty((2, 2), dtype=np.float32)
+
+        manager._stream_callback(outdata, 2, None, 0)
+
+        np.testing.assert_array_equal(outdata, [[0, 1], [2, 3]])
+        assert manager._playback_pos == 2
+
+    def test_callback_pads_with_silence_at_end(self, console: Console) -> None:
+        """Should zero-fill past the end of the sound and finish playback."""
+        manager = AudioManager(console)
+        manager._playback_data = np.ones((3, 2), dtype=np.float32)
+        outdata = np.empty((4, 2), dtype=np.float32)
+
+        manager._stream_callback(outdata, 4, None, 0)
+
+        np.testing.assert_array_equal(outdata[:3], 1.0)
+        np.testing.assert_array_equal(outdata[3], 0.0)
+        assert manager._playback_data is None
+
+    def test_callback_outputs_silence_when_idle(self, console: Console) -> None:
+        """Should output silence when nothing is queued."""
+        manager = AudioManager(console)
+        outdata = np.ones((4, 2), dtype=np.float32)
+
+        manager._stream_callback(outdata, 4, None, 0)
+
+        np.testing.assert_array_equal(outdata, 0.0)
+
+
+class TestAudioManagerStreaming:
+    """Tests for block-wise streaming of large files."""
+
+    def test_large_file_streams_in_blocks(
+        self,
+        console: Console,
+        mock_sounddevice: MagicMock,
+        mock_device_validation: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Should stream uncached files above the threshold without a full decode."""
+        audio_file = tmp_path / "long.wav"
+        source = np.linspace(-0.5, 0.5, 10000, dtype=np.float32).reshape(5000, 2)
+        sf.write(audio_file, source, 44100, subtype="FLOAT")
+
+        with patch("src.audio_manager.sd", mock_sounddevice):
+            manager = AudioManager(console)
+            manager.STREAM_THRESHOLD_MB = 0
+            manager.STREAM_BLOCK_FRAMES = 1024
+            manager.set_output_device(0)
+
+            with patch("src.audio_manager.sf.read") as mock_read:
+                assert manager.play_audio(audio_file) is True
+                mock_read.assert_not_called()
+
+            assert manager._playback_queue is not None
+            assert len(manager._cache) == 0
+
+            chunks = []
+            deadline = time.monotonic() + 5
+            while manager._playback_data is not None and time.monotonic() < deadline:
+                outdata = np.empty((512, 2), dtype=np.float32)
+                manager._stream_callback(outdata, 512, None, 0)
+                chunks.append(outdata)
+
+            assert manager._playback_data is None
+            played = np.concatenate(chunks)
+            start = int(np.argmax(np.any(played != 0, axis=1)))
+            np.testing.assert_allclose(played[start : start + 5000], source, atol=1e-6)
+
+    def test_reader_recycles_preallocated_blocks(self, console: Console, tmp_path: Path) -> None:
+        """Should decode into a fixed ring of buffers rather than allocating per block."""
+        audio_file = tmp_path / "long.wav"
+        sf.write(audio_file, np.zeros((64 * 40, 2), dtype=np.float32), 44100, subtype="FLOAT")
+        manager = AudioManager(console)
+        manager.STREAM_BLOCK_FRAMES = 64
+        manager.STREAM_QUEUE_BLOCKS = 4
+        ring_size = manager.STREAM_QUEUE_BLOCKS + 2
+        blocks: queue.Queue[np.ndarray | None] = queue.Queue()
+
+        manager._read_blocks(sf.SoundFile(audio_file), 2, 1.0, blocks, threading.Event())
+
+        read = [blocks.get_nowait() for _ in range(blocks.qsize())]
+        assert read.pop() is None
+        assert len(read) == 40
+        assert np.shares_memory(read[0], read[ring_size])
+        assert not np.shares_memory(read[0], read[1])
+
+    def test_reader_decodes_into_its_own_buffer(self, console: Console, tmp_path: Path) -> None:
+        """Should pass a preallocated out= buffer to every SoundFile.read call."""
+        audio_file = tmp_path / "long.wav"
+        sf.write(audio_file, np.zeros((64 * 3, 1), dtype=np.float32), 44100, subtype="FLOAT")
+        manager = AudioManager(console)
+        manager.STREAM_BLOCK_FRAMES = 64
+
+        with patch.object(sf.SoundFile, "read", autospec=True, side_effect=sf.SoundFile.read) as mock_read:
+            manager._read_blocks(sf.SoundFile(audio_file), 2, 1.0, queue.Queue(), threading.Event())
+
+        buffers = [c.kwargs["out"] for c in mock_read.call_args_list]
+        assert len(buffers) == 4  # three blocks and the empty read at the end
+        assert all(buf is buffers[0] for buf in buffers)
+        assert buffers[0].dtype == np.float32
+        assert buffers[0].shape == (64, 1)
+
+    def test_callback_finishes_at_end_of_stream(self, console: Console) -> None:
+        """Should pull queued blocks and stop at the end marker."""
+        manager = AudioManager(console)
+        blocks: queue.Queue[np.ndarray | None] = queue.Queue()
+        blocks.put(np.ones((3, 2), dtype=np.float32))
+        blocks.put(None)
+        manager._playback_data = np.zeros((0, 2), dtype=np.float32)
+        manager._playback_queue = blocks
+        outdata = np.empty((4, 2), dtype=np.float32)
+
+        manager._stream_callback(outdata, 4, None, 0)
+
+        np.testing.assert_array_equal(outdata[:3], 1.0)
+        np.testing.assert_array_equal(outdata[3], 0.0)
+        assert manager._playback_data is None
+        assert manager._playback_queue is None
+
+    def test_callback_pads_silence_on_underrun(self, console: Console) -> None:
+        """Should keep playing with silence when the reader falls behind."""
+        manager = AudioManager(console)
+        manager._playback_data = np.zeros((0, 2), dtype=np.float32)
+        manager._playback_queue = queue.Queue()
+        outdata = np.ones((4, 2), dtype=np.float32)
+
+        manager._stream_callback(outdata, 4, None, 0)
+
+        np.testing.assert_array_equal(outdata, 0.0)
+        assert manager._playback_data is not None
+
+    def test_stop_audio_stops_reader(self, console: Console) -> None:
+        """Should signal the reader thread when playback is stopped."""
+        manager = AudioManager(console)
+        stop = threading.Event()
+        manager._reader_stop = stop
+
+        manager.stop_audio()
+
+        assert stop.is_set()
+        assert manager._reader_stop is None
+
+
+class TestAudioManagerWavMapping:
+    """Tests for reading plain WAV files without libsndfile."""
+
+    @pytest.mark.parametrize("subtype", ["PCM_16", "FLOAT"])
+    def test_plain_wav_matches_soundfile_decode(self, console: Console, tmp_path: Path, subtype: str) -> None:
+        """Should read 16-bit and float WAV samples directly, matching sf.read."""
+        audio_file = tmp_path / "plain.wav"
+        source = np.linspace(-0.5, 0.5, 2000, dtype=np.float32).reshape(1000, 2)
+        sf.write(audio_file, source, 22050, subtype=subtype)
+        expected, _ = sf.read(audio_file, dtype="float32", always_2d=True)
+        manager = AudioManager(console)
+
+        with patch("src.audio_manager.sf.read") as mock_read:
+            result = manager._read_audio(audio_file)
+
+        mock_read.assert_not_called()
+        assert result is not None
+        data, samplerate = result
+        assert samplerate == 22050
+        assert data.dtype == np.float32
+        assert not isinstance(data, np.memmap)
+        np.testing.assert_array_equal(data, expected)
+
+    def test_other_wav_encodings_fall_back_to_soundfile(self, console: Console, tmp_path: Path) -> None:
+        """Should decode encodings without a direct mapping through soundfile."""
+        audio_file = tmp_path / "deep.wav"
+        sf.write(audio_file, np.zeros((100, 1), dtype=np.float32), 22050, subtype="PCM_24")
+        manager = AudioManager(console)
+
+        with patch("src.audio_manager.sf.read", side_effect=sf.read) as mock_read:
+            result = manager._read_audio(audio_file)
+
+        mock_read.assert_called_once()
+        assert result is not None
+        assert result[0].shape == (100, 1)
+
+    def test_play_plain_wav_never_opens_soundfile(
+        self,
+        console: Console,
+        mock_sounddevice: MagicMock,
+        mock_device_validation: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Should read a small plain WAV directly, without a SoundFile handle."""
+        audio_file = tmp_path / "plain.wav"
+        sf.write(audio_file, np.zeros((100, 2), dtype=np.float32), 22050, subtype="PCM_16")
+
+        with patch("src.audio_manager.sd", mock_sounddevice), patch("src.audio_manager.sf.SoundFile") as mock_open:
+            manager = AudioManager(console)
+            manager.set_output_device(0)
+            assert manager.play_audio(audio_file) is True
+
+        mock_open.assert_not_called()
+
+    def test_play_parses_wav_header_once(
+        self,
+        console: Console,
+        mock_sounddevice: MagicMock,
+        mock_device_validation: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Should hand the header parsed for the streaming check on to the direct read."""
+        audio_file = tmp_path / "plain.wav"
+        sf.write(audio_file, np.zeros((100, 2), dtype=np.float32), 22050, subtype="PCM_16")
+
+        with (
+            patch("src.audio_manager.sd", mock_sounddevice),
+            patch("src.audio_manager.read_wav_layout", side_effect=read_wav_layout) as mock_layout,
+        ):
+            manager = AudioManager(console)
+            manager.set_output_device(0)
+            assert manager.play_audio(audio_file) is True
+
+        mock_layout.assert_called_once_with(audio_file)
+
+    def test_play_unreadable_wav_fails_cleanly(
+        self,
+        console: Console,
+        mock_sounddevice: MagicMock,
+        mock_device_validation: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Should report a .wav path that cannot be opened instead of raising."""
+        audio_file = tmp_path / "folder.wav"
+        audio_file.mkdir()
+
+        with patch("src.audio_manager.sd", mock_sounddevice):
+            manager = AudioManager(console)
+            manager.set_output_device(0)
+            assert manager.play_audio(audio_file) is False
+
+    def test_play_stored_decode_never_opens_soundfile(
+        self,
+        console: Console,
+        mock_sounddevice: MagicMock,
+        mock_device_validation: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Should serve a compressed file from the decoded store without a SoundFile handle."""
+        audio_file = tmp_path / "song.ogg"
+        audio_file.write_bytes(b"encoded")
+        store = DecodedAudioStore(tmp_path / "decoded")
+        store.save(audio_file, np.zeros((100, 2), dtype=np.float32), 22050)
+
+        with patch("src.audio_manager.sd", mock_sounddevice), patch("src.audio_manager.sf.SoundFile") as mock_open:
+            manager = AudioManager(console, decoded_store=store)
+            manager.set_output_device(0)
+            assert manager.play_audio(audio_file) is True
+
+        mock_open.assert_not_called()
 
 
 class TestAudioManagerPrintDevices:
     """Tests for print_devices method."""
 
-    def test_print_devices_shows_all_devices(self, console: Console, mock_sounddevice: MagicMock) -> None:
+    def test_print_devices_shows_all_devices(self, recording_console: Console, mock_sounddevice: MagicMock) -> None:
         """Should display all devices in formatted table."""
         with patch("src.audio_manager.sd", mock_sounddevice):
-            manager = AudioManager(console)
+            manager = AudioManager(recording_console)
             manager.print_devices()
 
-            output = console.export_text()
+            output = recording_console.export_text()
             assert "Speakers" in output
             assert "CABLE Input" in output
 
-    def test_print_devices_shows_selected_device(self, console: Console, mock_sounddevice: MagicMock) -> None:
+    def test_print_devices_shows_selected_device(self, recording_console: Console, mock_sounddevice: MagicMock) -> None:
         """Should indicate which device is currently selected."""
         with patch("src.audio_manager.sd", mock_sounddevice):
-            manager = AudioManager(console)
+            manager = AudioManager(recording_console)
             manager.output_device_id = 2
             manager.print_devices()
 
-            output = console.export_text()
+            output = recording_console.export_text()
             assert "SELECTED" in output
 
+    def test_print_devices_plain_when_not_terminal(self, mock_sounddevice: MagicMock) -> None:
+        """Should write tab-separated rows when output is not a terminal."""
+        output = StringIO()
+        console = Console(file=output, force_terminal=False)
+        with patch("src.audio_manager.sd", mock_sounddevice):
+            manager = AudioManager(console)
+            manager.output_device_id = 2
+            manager.print_devices()
+
+            lines = output.getvalue().splitlines()
+            assert lines[0] == "ID\tDevice Name\tInputs\tOutputs\tStatus"
+            assert lines[1] == "0\tSpeakers (Realtek)\t0\t2"
+            assert lines[3] == "2\tCABLE Input (VB-Audio Virtual Cable)\t0\t8\tSELECTED"
+            assert "Available Audio Devices" not in output.getvalue()
+
 
 class TestAudioManagerIsPlaying:
     """Tests for is_playing method."""
@@ -340,27 +835,48 @@ class TestAudioManagerIsPlaying:
         mock_stream = MagicMock()
         mock_stream.active = True
 
-        with patch("src.audio_manager.sd") as mock_sd:
-            mock_sd.get_stream.return_value = mock_stream
-            manager = AudioManager(console)
+        manager = AudioManager(console)
+        manager.current_stream = mock_stream
+        manager._playback_data = np.zeros((10, 2), dtype=np.float32)
 
-            assert manager.is_playing() is True
+        assert manager.is_playing() is True
 
     def test_is_playing_when_not_active(self, console: Console) -> None:
         """Should return False when audio stream is not active."""
         mock_stream = MagicMock()
         mock_stream.active = False
 
-        with patch("src.audio_manager.sd") as mock_sd:
-            mock_sd.get_stream.return_value = mock_stream
-            manager = AudioManager(console)
+        manager = AudioManager(console)
+        manager.current_stream = mock_stream
+        manager._playback_data = np.zeros((10, 2), dtype=np.float32)
 
-            assert manager.is_playing() is False
+        assert manager.is_playing() is False
 
     def test_is_playing_when_no_stream(self, console: Console) -> None:
         """Should return False when there is no audio stream."""
+        manager = AudioManager(console)
+
+        assert manager.is_playing() is False
+
+    def test_is_playing_when_sound_finished(self, console: Console) -> None:
+        """Should return False when the stream is open but idle."""
+        mock_stream = MagicMock()
+        mock_stream.active = True
+
+        manager = AudioManager(console)
+        manager.current_stream = mock_stream
+
+        assert manager.is_playing() is False
+
+    def test_is_playing_does_not_query_portaudio(self, console: Console) -> None:
+        """Should answer from the owned stream without calling sd.get_stream."""
+        mock_stream = MagicMock()
+        mock_stream.active = True
+
         with patch("src.audio_manager.sd") as mock_sd:
-            mock_sd.get_stream.return_value = None
             manager = AudioManager(console)
+            manager.current_stream = mock_stream
+            manager._playback_data = np.zeros((10, 2), dtype=np.float32)
 
-            assert manager.is_playing() is False
+            assert manager.is_playing() is True
+            mock_sd.get_stream.assert_not_called()
@@ -74,10 +74,10 @@ class TestAudioTrimmerFormatSeconds:
 class TestAudioTrimmerGetDuration:
     """Tests for AudioTrimmer.get_duration method."""
 
-    def test_returns_duration(self, temp_dir: Path) -> None:
+    def test_returns_duration(self, tmp_path: Path) -> None:
         """Should return file duration."""
         trimmer = AudioTrimmer()
-        test_file = temp_dir / "test.wav"
+        test_file = tmp_path / "test.wav"
         test_file.touch()
 
         mock_info = MagicMock()
@@ -107,10 +107,10 @@ class TestAudioTrimmerTrim:
         data = rng.random((samples, 2), dtype=np.float32)
         return data, samplerate
 
-    def test_trims_audio(self, temp_dir: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
+    def test_trims_audio(self, tmp_path: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
         """Should trim audio to specified range."""
         trimmer = AudioTrimmer()
-        input_file = temp_dir / "input.wav"
+        input_file = tmp_path / "input.wav"
         input_file.touch()
 
         data, samplerate = mock_audio_data
@@ -128,11 +128,11 @@ class TestAudioTrimmerTrim:
         written_data = mock_write.call_args[0][1]
         assert len(written_data) == 88200
 
-    def test_trims_with_custom_output(self, temp_dir: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
+    def test_trims_with_custom_output(self, tmp_path: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
         """Should use custom output path when provided."""
         trimmer = AudioTrimmer()
-        input_file = temp_dir / "input.wav"
-        output_file = temp_dir / "output.wav"
+        input_file = tmp_path / "input.wav"
+        output_file = tmp_path / "output.wav"
         input_file.touch()
 
         data, samplerate = mock_audio_data
@@ -145,10 +145,10 @@ class TestAudioTrimmerTrim:
 
         assert result == output_file
 
-    def test_trims_to_end_when_no_end_specified(self, temp_dir: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
+    def test_trims_to_end_when_no_end_specified(self, tmp_path: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
         """Should trim to end of file when end is not specified."""
         trimmer = AudioTrimmer()
-        input_file = temp_dir / "input.wav"
+        input_file = tmp_path / "input.wav"
         input_file.touch()
 
         data, samplerate = mock_audio_data
@@ -163,10 +163,10 @@ class TestAudioTrimmerTrim:
         written_data = mock_write.call_args[0][1]
         assert len(written_data) == 88200
 
-    def test_raises_on_start_exceeds_duration(self, temp_dir: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
+    def test_raises_on_start_exceeds_duration(self, tmp_path: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
         """Should raise ValueError when start exceeds duration."""
         trimmer = AudioTrimmer()
-        input_file = temp_dir / "input.wav"
+        input_file = tmp_path / "input.wav"
         input_file.touch()
 
         data, samplerate = mock_audio_data
@@ -177,10 +177,10 @@ class TestAudioTrimmerTrim:
         ):
             trimmer.trim(input_file, start=10.0)
 
-    def test_raises_on_start_after_end(self, temp_dir: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
+    def test_raises_on_start_after_end(self, tmp_path: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
         """Should raise ValueError when start is after end."""
         trimmer = AudioTrimmer()
-        input_file = temp_dir / "input.wav"
+        input_file = tmp_path / "input.wav"
         input_file.touch()
 
         data, samplerate = mock_audio_data
@@ -191,10 +191,10 @@ class TestAudioTrimmerTrim:
         ):
             trimmer.trim(input_file, start=3.0, end=1.0)
 
-    def test_applies_fade_in(self, temp_dir: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
+    def test_applies_fade_in(self, tmp_path: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
         """Should apply fade in effect."""
         trimmer = AudioTrimmer()
-        input_file = temp_dir / "input.wav"
+        input_file = tmp_path / "input.wav"
         input_file.touch()
 
         data, samplerate = mock_audio_data
@@ -209,10 +209,10 @@ class TestAudioTrimmerTrim:
         # First sample should be near zero (faded)
         assert abs(written_data[0, 0]) < abs(data[0, 0])
 
-    def test_applies_fade_out(self, temp_dir: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
+    def test_applies_fade_out(self, tmp_path: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
         """Should apply fade out effect."""
         trimmer = AudioTrimmer()
-        input_file = temp_dir / "input.wav"
+        input_file = tmp_path / "input.wav"
         input_file.touch()
 
         data, samplerate = mock_audio_data
@@ -231,9 +231,9 @@ class TestAudioTrimmerTrim:
 class TestAudioNormalizerAnalyze:
     """Tests for AudioNormalizer.analyze method."""
 
-    def test_analyzes_stereo_audio(self, temp_dir: Path) -> None:
+    def test_analyzes_stereo_audio(self, tmp_path: Path) -> None:
         """Should analyze stereo audio levels."""
-        test_file = temp_dir / "test.wav"
+        test_file = tmp_path / "test.wav"
         test_file.touch()
 
         # Create test data with known levels
@@ -257,9 +257,9 @@ class TestAudioNormalizerAnalyze:
         assert result["peak"] > 0
         assert result["rms"] > 0
 
-    def test_analyzes_mono_audio(self, temp_dir: Path) -> None:
+    def test_analyzes_mono_audio(self, tmp_path: Path) -> None:
         """Should analyze mono audio levels."""
-        test_file = temp_dir / "test.wav"
+        test_file = tmp_path / "test.wav"
         test_file.touch()
 
         rng = np.random.default_rng(42)
@@ -271,9 +271,9 @@ class TestAudioNormalizerAnalyze:
 
         assert result["channels"] == 1
 
-    def test_handles_silent_audio(self, temp_dir: Path) -> None:
+    def test_handles_silent_audio(self, tmp_path: Path) -> None:
         """Should handle silent audio (all zeros)."""
-        test_file = temp_dir / "test.wav"
+        test_file = tmp_path / "test.wav"
         test_file.touch()
 
         data = np.zeros((44100, 2), dtype=np.float32)
@@ -302,10 +302,10 @@ class TestAudioNormalizerNormalize:
         data = rng.random((44100, 2), dtype=np.float32) * 0.5
         return data, samplerate
 
-    def test_normalizes_to_target_peak(self, temp_dir: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
+    def test_normalizes_to_target_peak(self, tmp_path: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
         """Should normalize to target peak level."""
         normalizer = AudioNormalizer()
-        input_file = temp_dir / "input.wav"
+        input_file = tmp_path / "input.wav"
         input_file.touch()
 
         data, samplerate = mock_audio_data
@@ -319,10 +319,10 @@ class TestAudioNormalizerNormalize:
         assert result.name == "input_normalized.wav"
         mock_write.assert_called_once()
 
-    def test_normalizes_with_rms_mode(self, temp_dir: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
+    def test_normalizes_with_rms_mode(self, tmp_path: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
         """Should normalize using RMS mode."""
         normalizer = AudioNormalizer()
-        input_file = temp_dir / "input.wav"
+        input_file = tmp_path / "input.wav"
         input_file.touch()
 
         data, samplerate = mock_audio_data
@@ -335,10 +335,10 @@ class TestAudioNormalizerNormalize:
 
         mock_write.assert_called_once()
 
-    def test_normalizes_in_place(self, temp_dir: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
+    def test_normalizes_in_place(self, tmp_path: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
         """Should overwrite original when in_place=True."""
         normalizer = AudioNormalizer()
-        input_file = temp_dir / "input.wav"
+        input_file = tmp_path / "input.wav"
         input_file.touch()
 
         data, samplerate = mock_audio_data
@@ -353,11 +353,11 @@ class TestAudioNormalizerNormalize:
         # Check output path in write call
         assert mock_write.call_args[0][0] == str(input_file)
 
-    def test_uses_custom_output_path(self, temp_dir: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
+    def test_uses_custom_output_path(self, tmp_path: Path, mock_audio_data: tuple[np.ndarray, int]) -> None:
         """Should use custom output path when provided."""
         normalizer = AudioNormalizer()
-        input_file = temp_dir / "input.wav"
-        output_file = temp_dir / "custom_output.wav"
+        input_file = tmp_path / "input.wav"
+        output_file = tmp_path / "custom_output.wav"
         input_file.touch()
 
         data, samplerate = mock_audio_data
@@ -370,10 +370,10 @@ class TestAudioNormalizerNormalize:
 
         assert result == output_file
 
-    def test_raises_on_silent_audio(self, temp_dir: Path) -> None:
+    def test_raises_on_silent_audio(self, tmp_path: Path) -> None:
         """Should raise ValueError for silent audio."""
         normalizer = AudioNormalizer()
-        input_file = temp_dir / "silent.wav"
+        input_file = tmp_path / "silent.wav"
         input_file.touch()
 
         data = np.zeros((44100, 2), dtype=np.float32)
@@ -385,10 +385,10 @@ class TestAudioNormalizerNormalize:
         ):
             normalizer.normalize(input_file)
 
-    def test_clips_to_prevent_distortion(self, temp_dir: Path) -> None:
+    def test_clips_to_prevent_distortion(self, tmp_path: Path) -> None:
         """Should clip audio to prevent clipping distortion."""
         normalizer = AudioNormalizer()
-        input_file = temp_dir / "input.wav"
+        input_file = tmp_path / "input.wav"
         input_file.touch()
 
         # Audio that will exceed 1.0 after normalization to 0 dB
@@ -411,11 +411,11 @@ class TestAudioNormalizerNormalize:
 class TestAudioNormalizerNormalizeBatch:
     """Tests for AudioNormalizer.normalize_batch method."""
 
-    def test_normalizes_multiple_files(self, temp_dir: Path) -> None:
+    def test_normalizes_multiple_files(self, tmp_path: Path) -> None:
         """Should normalize multiple files."""
         normalizer = AudioNormalizer()
 
-        files = [temp_dir / f"file{i}.wav" for i in range(3)]
+        files = [tmp_path / f"file{i}.wav" for i in range(3)]
         for f in files:
             f.touch()
 
@@ -431,11 +431,11 @@ class TestAudioNormalizerNormalizeBatch:
 
         assert len(results) == 3
 
-    def test_calls_progress_callback(self, temp_dir: Path) -> None:
+    def test_calls_progress_callback(self, tmp_path: Path) -> None:
         """Should call progress callback for each file."""
         normalizer = AudioNormalizer()
 
-        files = [temp_dir / f"file{i}.wav" for i in range(3)]
+        files = [tmp_path / f"file{i}.wav" for i in range(3)]
         for f in files:
             f.touch()
 
@@ -453,11 +453,11 @@ class TestAudioNormalizerNormalizeBatch:
 
         assert callback.call_count == 3
 
-    def test_continues_on_error(self, temp_dir: Path) -> None:
+    def test_continues_on_error(self, tmp_path: Path) -> None:
         """Should continue processing after an error."""
         normalizer = AudioNormalizer()
 
-        files = [temp_dir / f"file{i}.wav" for i in range(3)]
+        files = [tmp_path / f"file{i}.wav" for i in range(3)]
         for f in files:
             f.touch()
 
@@ -1,12 +1,14 @@
 # Copyright (c) 2025. All rights reserved.
 """Tests for the cache module."""
 
+import os
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 
-from src.cache import CachedAudio, LRUAudioCache
+from src.cache import CachedAudio, DecodedAudioStore, LRUAudioCache, SoundIndexCache, ValidationCache
+from src.validators import AudioFileInfo
 
 
 class TestCachedAudio:
@@ -42,7 +44,7 @@ class TestCachedAudio:
             assert cached.samplerate == 44100
             assert np.array_equal(cached.data, test_data)
             assert cached.path == test_file
-            mock_read.assert_called_once_with(str(test_file), dtype="float32")
+            mock_read.assert_called_once_with(str(test_file), dtype="float32", always_2d=True)
 
 
 class TestLRUAudioCache:
@@ -76,6 +78,37 @@ class TestLRUAudioCache:
         assert result.samplerate == 44100
         assert np.array_equal(result.data, data)
 
+    def test_get_evicts_stale_entry(self) -> None:
+        """Test that an entry decoded from an older file version is evicted."""
+        cache = LRUAudioCache()
+        data = np.array([[0.1, 0.2]], dtype=np.float32)
+        cached = CachedAudio(
+            data=data,
+            samplerate=44100,
+            size_bytes=data.nbytes,
+            path=Path("test.wav"),
+            mtime_ns=100,
+        )
+
+        cache.put("test.wav", cached)
+
+        assert cache.get("test.wav", mtime_ns=100) is not None
+        assert cache.get("test.wav", mtime_ns=200) is None
+        assert "test.wav" not in cache
+        assert cache.stats["size_bytes"] == 0
+
+    def test_replacing_entry_keeps_size_accurate(self) -> None:
+        """Test that re-caching a key with audio larger than the limit counts it once."""
+        small = np.zeros((10, 2), dtype=np.float32)
+        large = np.zeros((20, 2), dtype=np.float32)
+        cache = LRUAudioCache(max_size_bytes=large.nbytes - 1)
+
+        cache.put("test.wav", CachedAudio(data=small, samplerate=44100, size_bytes=small.nbytes, path=Path("t.wav")))
+        cache.put("test.wav", CachedAudio(data=large, samplerate=44100, size_bytes=large.nbytes, path=Path("t.wav")))
+
+        assert len(cache) == 1
+        assert cache.stats["size_bytes"] == large.nbytes
+
     def test_get_nonexistent(self) -> None:
         """Test getting nonexistent key."""
         cache = LRUAudioCache()
@@ -223,6 +256,20 @@ class TestLRUAudioCache:
             assert loaded == 3
             assert len(cache) == 3
 
+    def test_preload_skips_duplicates_and_cached(self, tmp_path: Path) -> None:
+        """Test that preload decodes each uncached path only once."""
+        cache = LRUAudioCache()
+        cached_file = tmp_path / "cached.wav"
+        new_file = tmp_path / "new.wav"
+        data = np.array([[0.1, 0.2]], dtype=np.float32)
+        cache.put(str(cached_file), CachedAudio(data=data, samplerate=44100, size_bytes=data.nbytes, path=cached_file))
+
+        with patch("src.cache.sf.read", return_value=(data, 44100)) as mock_read:
+            loaded = cache.preload([new_file, cached_file, new_file])
+
+        assert loaded == 1
+        mock_read.assert_called_once_with(str(new_file), dtype="float32", always_2d=True)
+
     def test_preload_handles_errors(self, tmp_path: Path) -> None:
         """Test that preload handles file errors gracefully."""
         cache = LRUAudioCache()
@@ -267,3 +314,218 @@ class TestLRUAudioCache:
             cache.put(f"test{i}.wav", cached)
 
         assert len(cache) == 3
+
+
+class TestValidationCache:
+    """Tests for ValidationCache."""
+
+    @staticmethod
+    def _validator() -> MagicMock:
+        """Create a validator mock returning valid info for any path."""
+        return MagicMock(
+            side_effect=lambda path: AudioFileInfo(
+                path=path,
+                duration=1.5,
+                sample_rate=44100,
+                channels=2,
+                format="WAV",
+                is_valid=True,
+            ),
+        )
+
+    def test_unchanged_file_skips_validator_after_reload(self, tmp_path: Path) -> None:
+        """Test that a persisted entry is reused while the file is unchanged."""
+        sound = tmp_path / "test.wav"
+        sound.write_bytes(b"data")
+        cache_file = tmp_path / "cache.json"
+        validator = self._validator()
+
+        cache = ValidationCache(cache_file)
+        cache.validate(sound, validator)
+        cache.save()
+
+        reloaded = ValidationCache(cache_file)
+        info = reloaded.validate(sound, validator)
+
+        assert validator.call_count == 1
+        assert info.is_valid
+        assert info.duration == 1.5
+        assert info.path == sound
+
+    def test_modified_file_is_revalidated(self, tmp_path: Path) -> None:
+        """Test that a change in file size invalidates the entry."""
+        sound = tmp_path / "test.wav"
+        sound.write_bytes(b"data")
+        validator = self._validator()
+        cache = ValidationCache(tmp_path / "cache.json")
+
+        cache.validate(sound, validator)
+        sound.write_bytes(b"longer data")
+        cache.validate(sound, validator)
+
+        assert validator.call_count == 2
+
+    def test_validate_uses_given_stat(self, tmp_path: Path) -> None:
+        """Test that a caller-supplied stat result is used instead of re-stat'ing."""
+        audio_file = tmp_path / "sound.wav"
+        audio_file.write_bytes(b"data")
+        st = audio_file.stat()
+        audio_file.unlink()  # any stat() of the path would now fail
+        cache = ValidationCache(tmp_path / "validation_cache.json")
+        validator = MagicMock(return_value=AudioFileInfo(audio_file, 1.0, 44100, 2, "WAV", is_valid=True))
+
+        cache.validate(audio_file, validator, st)
+
+        validator.assert_called_once_with(audio_file)
+        assert cache.get(audio_file, st) is not None
+        assert cache.get(audio_file) is None
+
+    def test_save_drops_deleted_files(self, tmp_path: Path) -> None:
+        """Test that entries for files that no longer exist are pruned on save."""
+        sound = tmp_path / "test.wav"
+        sound.write_bytes(b"data")
+        cache_file = tmp_path / "cache.json"
+
+        cache = ValidationCache(cache_file)
+        cache.validate(sound, self._validator())
+        cache.save()
+        sound.unlink()
+
+        reloaded = ValidationCache(cache_file)
+        reloaded.save()
+
+        assert len(ValidationCache(cache_file)) == 0
+
+    def test_corrupted_cache_file_starts_empty(self, tmp_path: Path) -> None:
+        """Test that an unreadable cache file is ignored."""
+        cache_file = tmp_path / "cache.json"
+        cache_file.write_text("{not json", encoding="utf-8")
+
+        assert len(ValidationCache(cache_file)) == 0
+
+
+class TestSoundIndexCache:
+    """Tests for SoundIndexCache."""
+
+    def test_save_and_load_round_trip(self, tmp_path: Path) -> None:
+        """Test that a saved scan result is read back by a new instance."""
+        key = SoundIndexCache.key_for([tmp_path / "sounds"])
+        sounds = {"airhorn": tmp_path / "sounds" / "airhorn.wav"}
+        sources = {"airhorn": tmp_path / "sounds"}
+        invalid = [(tmp_path / "sounds" / "bad.mp3", "Corrupted")]
+
+        SoundIndexCache(tmp_path / "index.json").save(key, sounds, sources, invalid)
+        result = SoundIndexCache(tmp_path / "index.json").load(key)
+
+        assert result == (sounds, sources, invalid)
+
+    def test_load_missing_returns_none(self, tmp_path: Path) -> None:
+        """Test that unknown directory sets and missing files are cache misses."""
+        cache = SoundIndexCache(tmp_path / "index.json")
+        assert cache.load("unknown") is None
+
+        cache.save("known", {}, {}, [])
+        assert cache.load("unknown") is None
+
+    def test_keys_are_kept_separately(self, tmp_path: Path) -> None:
+        """Test that saving one directory set keeps the others."""
+        cache = SoundIndexCache(tmp_path / "index.json")
+        cache.save("a", {"one": tmp_path / "one.wav"}, {}, [])
+        cache.save("b", {"two": tmp_path / "two.wav"}, {}, [])
+
+        result = cache.load("a")
+        assert result is not None
+        assert result[0] == {"one": tmp_path / "one.wav"}
+
+
+class TestDecodedAudioStore:
+    """Tests for DecodedAudioStore."""
+
+    def test_save_and_load(self, tmp_path: Path) -> None:
+        """Test that a stored decode is loaded back as a read-only in-memory array."""
+        sound = tmp_path / "test.mp3"
+        sound.write_bytes(b"encoded")
+        data = np.arange(8, dtype=np.float32).reshape(4, 2)
+        store = DecodedAudioStore(tmp_path / "decoded")
+
+        store.save(sound, data, 22050)
+        result = store.load(sound)
+
+        assert result is not None
+        loaded, samplerate = result
+        assert samplerate == 22050
+        assert not isinstance(loaded, np.memmap)
+        assert not loaded.flags.writeable
+        np.testing.assert_array_equal(loaded, data)
+
+    def test_modified_file_misses(self, tmp_path: Path) -> None:
+        """Test that editing the source file invalidates the stored decode."""
+        sound = tmp_path / "test.ogg"
+        sound.write_bytes(b"encoded")
+        store = DecodedAudioStore(tmp_path / "decoded")
+
+        store.save(sound, np.zeros((4, 2), dtype=np.float32), 44100)
+        sound.write_bytes(b"re-encoded")
+
+        assert store.load(sound) is None
+
+    def test_new_version_replaces_old_decode(self, tmp_path: Path) -> None:
+        """Test that storing an edited file removes the decode of its old version."""
+        sound = tmp_path / "test.ogg"
+        sound.write_bytes(b"encoded")
+        store = DecodedAudioStore(tmp_path / "decoded")
+        store.save(sound, np.zeros((4, 2), dtype=np.float32), 44100)
+
+        sound.write_bytes(b"re-encoded")
+        os.utime(sound, ns=(1, 1))
+        store.save(sound, np.ones((4, 2), dtype=np.float32), 44100)
+
+        stored = list((tmp_path / "decoded").rglob("*.npy"))
+        assert len(stored) == 1
+        result = store.load(sound)
+        assert result is not None
+        np.testing.assert_array_equal(result[0], np.ones((4, 2), dtype=np.float32))
+
+    def test_prunes_least_recently_used(self, tmp_path: Path) -> None:
+        """Test that saving past the byte budget removes the least recently used decodes."""
+        data = np.zeros((1024, 2), dtype=np.float32)  # 8 KB, plus the .npy header
+        store = DecodedAudioStore(tmp_path / "decoded", max_size_bytes=20 * 1024)
+        sounds = []
+        for i in range(3):
+            sound = tmp_path / f"sound{i}.mp3"
+            sound.write_bytes(b"encoded")
+            sounds.append(sound)
+
+        store.save(sounds[0], data, 44100)
+        store.save(sounds[1], data, 44100)
+        # Age the first entry, then use it so the second becomes least recently used
+        for npy in (tmp_path / "decoded").rglob("*.npy"):
+            os.utime(npy, ns=(1, 1))
+        assert store.load(sounds[0]) is not None
+        store.save(sounds[2], data, 44100)
+
+        assert store.load(sounds[0]) is not None
+        assert store.load(sounds[1]) is None
+        assert store.load(sounds[2]) is not None
+
+    def test_uncompressed_files_are_not_stored(self, tmp_path: Path) -> None:
+        """Test that WAV files are never copied into the store."""
+        sound = tmp_path / "test.wav"
+        sound.write_bytes(b"pcm")
+        store = DecodedAudioStore(tmp_path / "decoded")
+
+        store.save(sound, np.zeros((4, 2), dtype=np.float32), 44100)
+
+        assert store.load(sound) is None
+        assert not (tmp_path / "decoded").exists()
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """Test that clear removes all stored decodes."""
+        sound = tmp_path / "test.flac"
+        sound.write_bytes(b"encoded")
+        store = DecodedAudioStore(tmp_path / "decoded")
+        store.save(sound, np.zeros((4, 2), dtype=np.float32), 44100)
+
+        store.clear()
+
+        assert store.load(sound) is None
@@ -2,9 +2,7 @@
 """Tests for config transfer module."""
 
 import json
-import tempfile
 import zipfile
-from collections.abc import Generator
 from pathlib import Path
 
 import pytest
@@ -17,26 +15,24 @@ class TestConfigTransfer:
     """Test the ConfigTransfer class."""
 
     @pytest.fixture
-    def temp_base_dir(self) -> Generator[Path]:
+    def temp_base_dir(self, tmp_path: Path) -> Path:
         """Create a temporary base directory for testing.
 
-        Yields:
+        Returns:
             Path: Temporary directory path.
 
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
+        return tmp_path
 
     @pytest.fixture
-    def temp_output_dir(self) -> Generator[Path]:
-        """Create a temporary output directory for testing.
+    def temp_output_dir(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        """Create a temporary output directory for testing, separate from the base directory.
 
-        Yields:
+        Returns:
             Path: Temporary output directory path.
 
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
+        return tmp_path_factory.mktemp("output")
 
     @pytest.fixture
     def manager(self, temp_base_dir: Path) -> ProfileManager:
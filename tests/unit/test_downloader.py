@@ -52,14 +52,14 @@ class TestYouTubeDownloaderValidateUrl:
     """Tests for YouTubeDownloader.validate_url method."""
 
     @pytest.fixture
-    def downloader(self, console: Console, temp_dir: Path) -> YouTubeDownloader:
+    def downloader(self, console: Console, tmp_path: Path) -> YouTubeDownloader:
         """Create a YouTubeDownloader instance.
 
         Returns:
             YouTubeDownloader instance for testing.
 
         """
-        return YouTubeDownloader(console, temp_dir)
+        return YouTubeDownloader(console, tmp_path)
 
     def test_validates_standard_url(self, downloader: YouTubeDownloader) -> None:
         """Should validate standard youtube.com URL."""
@@ -189,14 +189,14 @@ class TestYouTubeDownloaderGetVideoInfo:
     """Tests for YouTubeDownloader.get_video_info method."""
 
     @pytest.fixture
-    def downloader(self, console: Console, temp_dir: Path) -> YouTubeDownloader:
+    def downloader(self, console: Console, tmp_path: Path) -> YouTubeDownloader:
         """Create a YouTubeDownloader instance.
 
         Returns:
             YouTubeDownloader instance for testing.
 
         """
-        return YouTubeDownloader(console, temp_dir)
+        return YouTubeDownloader(console, tmp_path)
 
     def test_returns_info_on_success(self, downloader: YouTubeDownloader) -> None:
         """Should return video info dict on success."""
@@ -237,14 +237,14 @@ class TestYouTubeDownloaderDownload:
     """Tests for YouTubeDownloader.download method."""
 
     @pytest.fixture
-    def downloader(self, console: Console, temp_dir: Path) -> YouTubeDownloader:
+    def downloader(self, console: Console, tmp_path: Path) -> YouTubeDownloader:
         """Create a YouTubeDownloader instance.
 
         Returns:
             YouTubeDownloader instance for testing.
 
         """
-        return YouTubeDownloader(console, temp_dir)
+        return YouTubeDownloader(console, tmp_path)
 
     def test_returns_none_when_yt_dlp_missing(self, downloader: YouTubeDownloader) -> None:
         """Should return None when yt-dlp is not installed."""
@@ -270,9 +270,9 @@ class TestYouTubeDownloaderDownload:
             result = downloader.download("https://invalid-url.com")
             assert result is None
 
-    def test_creates_sounds_directory(self, downloader: YouTubeDownloader, temp_dir: Path) -> None:
+    def test_creates_sounds_directory(self, downloader: YouTubeDownloader, tmp_path: Path) -> None:
         """Should create sounds directory if it doesn't exist."""
-        sounds_dir = temp_dir / "new_sounds"
+        sounds_dir = tmp_path / "new_sounds"
         new_downloader = YouTubeDownloader(downloader.console, sounds_dir)
 
         # Verify directory doesn't exist
@@ -292,16 +292,16 @@ class TestYouTubeDownloaderIntegration:
     """Integration-style tests for YouTubeDownloader (mocked)."""
 
     @pytest.fixture
-    def downloader(self, console: Console, temp_dir: Path) -> YouTubeDownloader:
+    def downloader(self, console: Console, tmp_path: Path) -> YouTubeDownloader:
         """Create a YouTubeDownloader instance.
 
         Returns:
             YouTubeDownloader instance for testing.
 
         """
-        return YouTubeDownloader(console, temp_dir)
+        return YouTubeDownloader(console, tmp_path)
 
-    def test_full_download_flow_mocked(self, downloader: YouTubeDownloader, temp_dir: Path) -> None:
+    def test_full_download_flow_mocked(self, downloader: YouTubeDownloader, tmp_path: Path) -> None:
         """Test full download flow with mocked yt-dlp."""
         mock_yt_dlp = MagicMock()
 
@@ -320,7 +320,7 @@ class TestYouTubeDownloaderIntegration:
 
         # Create a fake output file to simulate download
         def mock_download(_urls: list) -> None:
-            output_file = temp_dir / ".Test_Video_temp.wav"
+            output_file = tmp_path / ".Test_Video_temp.wav"
             output_file.touch()
 
         mock_ydl.download.side_effect = mock_download
@@ -2,8 +2,6 @@
 # ruff: noqa: DOC201, DOC402
 """Unit tests for the hotkey manager module."""
 
-import tempfile
-from collections.abc import Generator
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -13,12 +11,9 @@ from src.hotkey_manager import HotkeyManager
 
 
 @pytest.fixture
-def temp_config_dir() -> Generator[Path]:
+def temp_config_dir(muc_home: Path) -> Path:
     """Create a temporary config directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config_dir = Path(tmpdir) / ".muc"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        yield config_dir
+    return muc_home / ".muc"
 
 
 @pytest.fixture
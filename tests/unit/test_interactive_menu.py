@@ -168,6 +168,27 @@ class TestInteractiveMenu:
         menu._list_devices()
         mock_audio_manager.print_devices.assert_called_once()
 
+    @patch("src.interactive_menu.ProfileManager")
+    @patch("src.interactive_menu.click")
+    def test_adjust_volume_reuses_profile_manager(
+        self,
+        mock_click: MagicMock,
+        mock_pm_class: MagicMock,
+        mock_console: MagicMock,
+        mock_soundboard: MagicMock,
+        mock_audio_manager: MagicMock,
+    ) -> None:
+        """Test that volume changes are saved through the injected profile manager."""
+        pm = MagicMock()
+        menu = InteractiveMenu(mock_console, mock_soundboard, mock_audio_manager, profile_manager=pm)
+        mock_click.prompt.return_value = 50
+
+        menu._adjust_volume()
+
+        mock_audio_manager.set_volume.assert_called_once_with(0.5)
+        pm.save_profile.assert_called_once_with(pm.get_active_profile.return_value)
+        mock_pm_class.assert_not_called()
+
 
 class TestInteractiveMenuSearch:
     """Tests for search functionality in InteractiveMenu."""
@@ -1,7 +1,6 @@
 # Copyright (c) 2025. All rights reserved.
 """Unit tests for logging_config module."""
 
-import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
@@ -32,44 +31,41 @@ class TestLoggingConstants:
 class TestSetupLogging:
     """Tests for setup_logging function."""
 
-    def test_creates_log_directory(self) -> None:
+    def test_creates_log_directory(self, tmp_path: Path) -> None:
         """setup_logging should create log directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_log_dir = Path(tmpdir) / ".muc" / "logs"
+        test_log_dir = tmp_path / ".muc" / "logs"
 
-            with patch("src.logging_config.LOG_DIR", test_log_dir):
-                reset_logging()  # Reset any previous state
-                setup_logging(debug=False, log_to_file=False)
+        with patch("src.logging_config.LOG_DIR", test_log_dir):
+            reset_logging()  # Reset any previous state
+            setup_logging(debug=False, log_to_file=False)
 
-                assert test_log_dir.exists()
+            assert test_log_dir.exists()
 
-    def test_idempotent_initialization(self) -> None:
+    def test_idempotent_initialization(self, tmp_path: Path) -> None:
         """setup_logging should be idempotent (safe to call multiple times)."""
         reset_logging()  # Reset state
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_log_dir = Path(tmpdir) / ".muc" / "logs"
+        test_log_dir = tmp_path / ".muc" / "logs"
 
-            with patch("src.logging_config.LOG_DIR", test_log_dir):
-                # Call twice - should not raise
-                setup_logging(debug=False, log_to_file=False)
-                setup_logging(debug=False, log_to_file=False)
+        with patch("src.logging_config.LOG_DIR", test_log_dir):
+            # Call twice - should not raise
+            setup_logging(debug=False, log_to_file=False)
+            setup_logging(debug=False, log_to_file=False)
 
 
 class TestInitLogging:
     """Tests for init_logging function."""
 
-    def test_init_logging_calls_setup(self) -> None:
+    def test_init_logging_calls_setup(self, tmp_path: Path) -> None:
         """init_logging should call setup_logging."""
         reset_logging()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_log_dir = Path(tmpdir) / ".muc" / "logs"
+        test_log_dir = tmp_path / ".muc" / "logs"
 
-            with patch("src.logging_config.LOG_DIR", test_log_dir):
-                init_logging(debug=False)
+        with patch("src.logging_config.LOG_DIR", test_log_dir):
+            init_logging(debug=False)
 
-                assert test_log_dir.exists()
+            assert test_log_dir.exists()
 
 
 class TestGetLogger:
@@ -90,17 +86,16 @@ class TestGetLogger:
 class TestResetLogging:
     """Tests for reset_logging function."""
 
-    def test_reset_allows_reinit(self) -> None:
+    def test_reset_allows_reinit(self, tmp_path: Path) -> None:
         """reset_logging should allow re-initialization."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_log_dir = Path(tmpdir) / ".muc" / "logs"
-
-            with patch("src.logging_config.LOG_DIR", test_log_dir):
-                reset_logging()
-                init_logging(debug=False)
-                reset_logging()
-                # Should be able to init again
-                init_logging(debug=True)
+        test_log_dir = tmp_path / ".muc" / "logs"
+
+        with patch("src.logging_config.LOG_DIR", test_log_dir):
+            reset_logging()
+            init_logging(debug=False)
+            reset_logging()
+            # Should be able to init again
+            init_logging(debug=True)
 
 
 class TestLoggingIntegration:
@@ -2,10 +2,12 @@
 # ruff: noqa: DOC201, DOC402
 """Unit tests for the metadata module."""
 
-import tempfile
+import json
+import time
 from collections.abc import Generator
 from datetime import UTC, datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -13,16 +15,18 @@ from src.metadata import MetadataManager, SoundMetadata
 
 
 @pytest.fixture
-def temp_metadata_file() -> Generator[Path]:
+def temp_metadata_file(tmp_path: Path) -> Path:
     """Create a temporary metadata file path."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir) / ".muc" / "metadata.json"
+    return tmp_path / ".muc" / "metadata.json"
 
 
 @pytest.fixture
-def metadata_manager(temp_metadata_file: Path) -> MetadataManager:
+def metadata_manager(temp_metadata_file: Path) -> Generator[MetadataManager]:
     """Create a MetadataManager with a temporary file."""
-    return MetadataManager(metadata_file=temp_metadata_file)
+    manager = MetadataManager(metadata_file=temp_metadata_file)
+    yield manager
+    # Write deferred changes before the temporary directory goes away
+    manager.flush()
 
 
 class TestSoundMetadata:
@@ -209,6 +213,99 @@ class TestMetadataManager:
         assert meta.play_count == 2
         assert meta.last_played is not None
 
+    def test_record_play_defers_and_coalesces_saves(self, metadata_manager: MetadataManager) -> None:
+        """Test that a burst of plays is written once by the background writer."""
+        metadata_manager.SAVE_DELAY = 0.05
+
+        with patch.object(metadata_manager, "save", wraps=metadata_manager.save) as mock_save:
+            for _ in range(3):
+                metadata_manager.record_play("airhorn")
+            assert not metadata_manager.metadata_file.exists()
+
+            deadline = time.monotonic() + 5
+            while not metadata_manager.metadata_file.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            mock_save.assert_called_once()
+
+        data = json.loads(metadata_manager.metadata_file.read_text(encoding="utf-8"))
+        assert data["sounds"]["airhorn"]["play_count"] == 3
+
+    def test_writer_thread_exits_when_idle(self, metadata_manager: MetadataManager) -> None:
+        """Test that the background writer stops after saving instead of pinning the manager."""
+        metadata_manager.SAVE_DELAY = 0.01
+        metadata_manager.record_play("airhorn")
+        thread = metadata_manager._save_thread
+        assert thread is not None
+
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert metadata_manager._save_thread is None
+        assert metadata_manager.metadata_file.exists()
+
+    def test_writer_survives_concurrent_changes(self, metadata_manager: MetadataManager) -> None:
+        """Test that sounds added while the writer serializes never break the writer."""
+        metadata_manager.SAVE_DELAY = 0
+        for i in range(20):
+            metadata_manager.get_metadata(f"sound{i}")
+        to_dict = SoundMetadata.to_dict
+
+        def slow_to_dict(meta: SoundMetadata) -> dict:
+            time.sleep(0.002)
+            return to_dict(meta)
+
+        with patch.object(SoundMetadata, "to_dict", autospec=True, side_effect=slow_to_dict):
+            metadata_manager.record_play("sound0")
+            thread = metadata_manager._save_thread
+            assert thread is not None
+            for i in range(20, 60):
+                metadata_manager.get_metadata(f"sound{i}")
+                time.sleep(0.001)
+            thread.join(timeout=5)
+
+        assert metadata_manager._save_thread is None
+        metadata_manager.record_play("sound59")
+        metadata_manager.flush()
+        data = json.loads(metadata_manager.metadata_file.read_text(encoding="utf-8"))
+        assert len(data["sounds"]) == 60
+
+    def test_writer_survives_unexpected_save_error(self, metadata_manager: MetadataManager) -> None:
+        """Test that an unexpected failure in a deferred save does not wedge the writer."""
+        metadata_manager.SAVE_DELAY = 0.01
+        with patch("src.metadata._write_json", side_effect=TypeError("not serializable")):
+            metadata_manager.record_play("airhorn")
+            thread = metadata_manager._save_thread
+            assert thread is not None
+            thread.join(timeout=5)
+
+        assert metadata_manager._save_thread is None
+        metadata_manager.record_play("airhorn")
+        thread = metadata_manager._save_thread
+        assert thread is not None
+        thread.join(timeout=5)
+
+        data = json.loads(metadata_manager.metadata_file.read_text(encoding="utf-8"))
+        assert data["sounds"]["airhorn"]["play_count"] == 2
+
+    def test_failed_save_keeps_previous_file(self, metadata_manager: MetadataManager) -> None:
+        """Test that a write failing midway leaves the last saved metadata intact."""
+        metadata_manager.add_tag("airhorn", "meme")
+
+        with patch("pathlib.Path.open", side_effect=OSError("disk full")):
+            metadata_manager.add_tag("airhorn", "loud")
+
+        data = json.loads(metadata_manager.metadata_file.read_text(encoding="utf-8"))
+        assert data["sounds"]["airhorn"]["tags"] == ["meme"]
+
+    def test_flush_writes_pending_plays(self, metadata_manager: MetadataManager) -> None:
+        """Test that flush persists deferred changes immediately."""
+        metadata_manager.record_play("airhorn")
+        metadata_manager.flush()
+
+        reloaded = MetadataManager(metadata_file=metadata_manager.metadata_file)
+        assert reloaded.get_metadata("airhorn").play_count == 1
+
     def test_get_all_tags_with_counts(self, metadata_manager: MetadataManager) -> None:
         """Test getting all tags with their counts."""
         metadata_manager.add_tag("airhorn", "meme")
@@ -227,6 +324,7 @@ class TestMetadataManager:
         manager1.set_favorite("airhorn", is_favorite=True)
         manager1.set_volume("airhorn", 0.8)
         manager1.record_play("airhorn")
+        manager1.flush()
 
         # Create new manager to load from file
         manager2 = MetadataManager(metadata_file=temp_metadata_file)
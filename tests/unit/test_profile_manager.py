@@ -2,14 +2,19 @@
 """Tests for profile manager module."""
 
 import json
-import tempfile
-from collections.abc import Generator
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from src.profile_manager import Profile, ProfileManager
+from src import profile_manager
+from src.profile_manager import Profile, ProfileManager, _read_json, _write_json
+
+
+def assert_settings(profile: Profile, **expected: object) -> None:
+    """Assert several profile settings properties in one comparison."""
+    assert {name: getattr(profile, name) for name in expected} == expected
 
 
 class TestProfile:
@@ -47,11 +52,14 @@ class TestProfile:
                 "hotkey_mode": "custom",
             },
         )
-        assert profile.output_device_id == 5
-        assert profile.volume == 0.8
-        assert profile.sounds_dir == "/path/to/sounds"
-        assert profile.hotkeys == {"<f1>": "sound1"}
-        assert profile.hotkey_mode == "custom"
+        assert_settings(
+            profile,
+            output_device_id=5,
+            volume=0.8,
+            sounds_dir="/path/to/sounds",
+            hotkeys={"<f1>": "sound1"},
+            hotkey_mode="custom",
+        )
 
     def test_profile_settings_setters(self) -> None:
         """Test profile settings setters."""
@@ -62,11 +70,14 @@ class TestProfile:
         profile.hotkeys = {"<f2>": "sound2"}
         profile.hotkey_mode = "merged"
 
-        assert profile.output_device_id == 10
-        assert profile.volume == 0.5
-        assert profile.sounds_dir == "/new/path"
-        assert profile.hotkeys == {"<f2>": "sound2"}
-        assert profile.hotkey_mode == "merged"
+        assert_settings(
+            profile,
+            output_device_id=10,
+            volume=0.5,
+            sounds_dir="/new/path",
+            hotkeys={"<f2>": "sound2"},
+            hotkey_mode="merged",
+        )
 
     def test_profile_sounds_dirs(self) -> None:
         """Test multiple sounds directories."""
@@ -123,15 +134,14 @@ class TestProfileManager:
     """Test the ProfileManager class."""
 
     @pytest.fixture
-    def temp_base_dir(self) -> Generator[Path]:
+    def temp_base_dir(self, tmp_path: Path) -> Path:
         """Create a temporary base directory for testing.
 
-        Yields:
+        Returns:
             Path: Temporary directory path.
 
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
+        return tmp_path
 
     @pytest.fixture
     def manager(self, temp_base_dir: Path) -> ProfileManager:
@@ -180,19 +190,74 @@ class TestProfileManager:
         assert profile is not None
         assert profile.name == "default"
 
-    def test_save_profile(self, manager: ProfileManager) -> None:
-        """Test saving a profile."""
+    @pytest.fixture
+    def saved_profile(self, manager: ProfileManager) -> Profile:
+        """Save a profile with known settings once for the save and reload tests.
+
+        Returns:
+            Profile: The profile as it was saved.
+
+        """
         profile = Profile(
             name="saved",
             display_name="Saved Profile",
-            settings={"volume": 0.5},
+            settings={"output_device_id": 42, "volume": 0.5, "sounds_dir": "/my/sounds"},
         )
         manager.save_profile(profile)
+        return profile
 
-        loaded = manager.get_profile("saved")
+    def test_save_profile(self, manager: ProfileManager, saved_profile: Profile) -> None:
+        """Test saving a profile."""
+        loaded = manager.get_profile(saved_profile.name)
         assert loaded is not None
         assert loaded.display_name == "Saved Profile"
-        assert loaded.volume == 0.5
+        assert_settings(loaded, output_device_id=42, volume=0.5, sounds_dir="/my/sounds")
+
+    def test_saved_profile_survives_reload(self, temp_base_dir: Path, saved_profile: Profile) -> None:
+        """Test that a new manager over the same directory reads the saved profile back."""
+        loaded = ProfileManager(base_dir=temp_base_dir).get_profile(saved_profile.name)
+        assert loaded is not None
+        assert loaded.to_dict() == saved_profile.to_dict()
+
+    def test_save_profile_unchanged_skips_write(self, manager: ProfileManager) -> None:
+        """Test that saving a profile without changes does not rewrite the file."""
+        profile = manager.get_active_profile()
+        profile_file = manager.profiles_dir / "default.json"
+        before = profile_file.read_bytes()
+
+        with patch("src.profile_manager._write_json") as mock_write:
+            manager.save_profile(profile)
+            mock_write.assert_not_called()
+
+        profile.volume = 0.25
+        manager.save_profile(profile)
+
+        assert profile_file.read_bytes() != before
+        reloaded = manager.get_profile("default")
+        assert reloaded is not None
+        assert reloaded.volume == 0.25
+
+    def test_save_global_config_unchanged_skips_write(self, manager: ProfileManager) -> None:
+        """Test that re-setting the same active profile does not rewrite config.json."""
+        manager.active_profile_name = "default"
+
+        with patch("src.profile_manager._write_json") as mock_write:
+            manager.active_profile_name = "default"
+            mock_write.assert_not_called()
+
+    def test_save_leaves_no_temp_file(self, manager: ProfileManager) -> None:
+        """Test that the atomic write does not leave its temp file behind."""
+        manager.create_profile("atomic")
+
+        assert (manager.profiles_dir / "atomic.json").exists()
+        assert not list(manager.profiles_dir.glob("*.tmp"))
+
+    def test_save_syncs_directory_after_rename(self, manager: ProfileManager) -> None:
+        """Test that the profiles directory is synced once per save, after the rename."""
+        with patch("src.profile_manager._fsync_directory") as mock_sync:
+            manager.create_profile("durable")
+
+        mock_sync.assert_called_once_with(manager.profiles_dir)
 
     def test_create_profile(self, manager: ProfileManager) -> None:
         """Test creating a new profile."""
@@ -227,8 +292,7 @@ class TestProfileManager:
 
         # Create copy
         copy = manager.create_profile("copy", copy_from="default")
-        assert copy.volume == 0.7
-        assert copy.output_device_id == 5
+        assert_settings(copy, volume=0.7, output_device_id=5)
 
     def test_create_profile_copy_from_nonexistent(self, manager: ProfileManager) -> None:
         """Test that copying from nonexistent profile raises ValueError."""
@@ -297,19 +361,48 @@ class TestProfileManager:
         assert manager.default_profile_name == "other_value"
 
 
+class TestJsonHelpers:
+    """Test the JSON read/write helpers with and without orjson."""
+
+    @pytest.fixture(params=["orjson", "json"])
+    def json_backend(self, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+        """Run a test with orjson if installed, then with the stdlib json fallback.
+
+        Returns:
+            Name of the backend in use
+
+        """
+        if request.param == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(profile_manager, "orjson", None)
+        return request.param
+
+    def test_round_trip(self, json_backend: str, tmp_path: Path) -> None:
+        """Test that written data reads back unchanged as indented JSON."""
+        data = {"name": "gaming", "volume": 0.5, "hotkeys": {"<f1>": "airhorn"}, "tags": ["é", "🔊"], "none": None}
+        path = tmp_path / "profile.json"
+
+        _write_json(path, data)
+
+        assert _read_json(path) == data
+        assert json.loads(path.read_text(encoding="utf-8")) == data
+        assert '\n  "name"' in path.read_text(encoding="utf-8")
+        assert not path.with_name("profile.json.tmp").exists()
+
+
 class TestLegacyConfigMigration:
     """Test legacy config migration."""
 
     @pytest.fixture
-    def temp_base_dir(self) -> Generator[Path]:
+    def temp_base_dir(self, tmp_path: Path) -> Path:
         """Create a temporary base directory for testing.
 
-        Yields:
+        Returns:
             Path: Temporary directory path.
 
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
+        return tmp_path
 
     def test_migrate_legacy_config(self, temp_base_dir: Path) -> None:
         """Test that legacy config is migrated to profile format."""
@@ -332,10 +425,13 @@ class TestLegacyConfigMigration:
         # Check migration
         profile = manager.get_profile("default")
         assert profile is not None
-        assert profile.output_device_id == 3
-        assert profile.volume == 0.8
-        assert profile.sounds_dir == "/path/to/sounds"
-        assert profile.hotkeys == {"<f1>": "sound1"}
+        assert_settings(
+            profile,
+            output_device_id=3,
+            volume=0.8,
+            sounds_dir="/path/to/sounds",
+            hotkeys={"<f1>": "sound1"},
+        )
 
         # Check backup was created
         backup_file = config_file.with_suffix(".json.legacy_backup")
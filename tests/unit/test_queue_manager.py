@@ -2,8 +2,6 @@
 # ruff: noqa: DOC201, DOC402
 """Unit tests for the queue manager module."""
 
-import tempfile
-from collections.abc import Generator
 from pathlib import Path
 
 import pytest
@@ -12,10 +10,9 @@ from src.queue_manager import QueueManager
 
 
 @pytest.fixture
-def temp_playlists_file() -> Generator[Path]:
+def temp_playlists_file(tmp_path: Path) -> Path:
     """Create a temporary playlists file path."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir) / ".muc" / "playlists.json"
+    return tmp_path / ".muc" / "playlists.json"
 
 
 @pytest.fixture
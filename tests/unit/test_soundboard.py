@@ -1,13 +1,18 @@
 # Copyright (c) 2025. All rights reserved.
 """Unit tests for Soundboard class."""
 
+import os
+import threading
+import time
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from rich.console import Console
 
+from src.cache import SoundIndexCache, ValidationCache
 from src.soundboard import Soundboard
+from src.validators import AudioFileInfo, validate_audio_file_safe
 
 
 @pytest.fixture(autouse=True)
@@ -49,32 +54,32 @@ class TestSoundboardScanning:
     def test_ignores_unsupported_formats(
         self,
         console: Console,
-        temp_sounds_dir: Path,
+        writable_sounds_dir: Path,
         mock_audio_manager: MagicMock,
     ) -> None:
         """Should ignore non-audio files."""
         # Create non-audio files
-        (temp_sounds_dir / "readme.txt").touch()
-        (temp_sounds_dir / "image.png").touch()
-        (temp_sounds_dir / "data.json").touch()
+        (writable_sounds_dir / "readme.txt").touch()
+        (writable_sounds_dir / "image.png").touch()
+        (writable_sounds_dir / "data.json").touch()
 
-        soundboard = Soundboard(mock_audio_manager, temp_sounds_dir, console)
+        soundboard = Soundboard(mock_audio_manager, writable_sounds_dir, console)
 
         assert "readme" not in soundboard.sounds
         assert "image" not in soundboard.sounds
         assert "data" not in soundboard.sounds
 
-    def test_handles_missing_directory(self, console: Console, temp_dir: Path, mock_audio_manager: MagicMock) -> None:
+    def test_handles_missing_directory(self, console: Console, tmp_path: Path, mock_audio_manager: MagicMock) -> None:
         """Should handle non-existent sounds directory gracefully."""
-        missing_dir = temp_dir / "nonexistent"
+        missing_dir = tmp_path / "nonexistent"
 
         soundboard = Soundboard(mock_audio_manager, missing_dir, console)
 
         assert len(soundboard.sounds) == 0
 
-    def test_handles_empty_directory(self, console: Console, temp_dir: Path, mock_audio_manager: MagicMock) -> None:
+    def test_handles_empty_directory(self, console: Console, tmp_path: Path, mock_audio_manager: MagicMock) -> None:
         """Should handle empty sounds directory."""
-        empty_dir = temp_dir / "empty_sounds"
+        empty_dir = tmp_path / "empty_sounds"
         empty_dir.mkdir()
 
         soundboard = Soundboard(mock_audio_manager, empty_dir, console)
@@ -93,14 +98,267 @@ class TestSoundboardScanning:
         assert "sound1" in soundboard.sounds
         assert soundboard.sounds["sound1"] == temp_sounds_dir / "sound1.wav"
 
-    def test_supports_m4a_format(self, console: Console, temp_sounds_dir: Path, mock_audio_manager: MagicMock) -> None:
+    def test_supports_m4a_format(
+        self, console: Console, writable_sounds_dir: Path, mock_audio_manager: MagicMock
+    ) -> None:
         """Should support .m4a audio format."""
-        (temp_sounds_dir / "music.m4a").touch()
+        (writable_sounds_dir / "music.m4a").touch()
 
-        soundboard = Soundboard(mock_audio_manager, temp_sounds_dir, console)
+        soundboard = Soundboard(mock_audio_manager, writable_sounds_dir, console)
 
         assert "music" in soundboard.sounds
 
+    def test_matches_extensions_case_insensitively(
+        self,
+        console: Console,
+        writable_sounds_dir: Path,
+        mock_audio_manager: MagicMock,
+    ) -> None:
+        """Should accept upper-case extensions and skip directories that look like audio."""
+        (writable_sounds_dir / "LOUD.WAV").touch()
+        (writable_sounds_dir / "folder.mp3").mkdir()
+
+        soundboard = Soundboard(mock_audio_manager, writable_sounds_dir, console)
+
+        assert "LOUD" in soundboard.sounds
+        assert "folder" not in soundboard.sounds
+        assert not soundboard.invalid_files
+
+    def test_rescan_validates_only_changed_files(
+        self,
+        console: Console,
+        writable_sounds_dir: Path,
+        tmp_path: Path,
+        mock_audio_manager: MagicMock,
+    ) -> None:
+        """Should reuse cached validation results for unchanged files on rescan."""
+        cache = ValidationCache(tmp_path / "validation_cache.json")
+        soundboard = Soundboard(mock_audio_manager, writable_sounds_dir, console, validation_cache=cache)
+        assert len(soundboard.sounds) == 4
+
+        (writable_sounds_dir / "sound1.wav").write_bytes(b"changed")
+        soundboard.validation_cache = ValidationCache(tmp_path / "validation_cache.json")
+        with patch("src.soundboard.validate_audio_file_safe", side_effect=validate_audio_file_safe) as mock_validate:
+            soundboard._scan_sounds()
+
+        mock_validate.assert_called_once_with(writable_sounds_dir / "sound1.wav")
+        assert "sound1" not in soundboard.sounds
+        assert len(soundboard.sounds) == 3
+
+    def test_scan_reuses_walk_stat(
+        self,
+        console: Console,
+        temp_sounds_dir: Path,
+        tmp_path: Path,
+        mock_audio_manager: MagicMock,
+    ) -> None:
+        """Should take file metadata from the directory walk instead of stat'ing each path again."""
+        cache = ValidationCache(tmp_path / "validation_cache.json")
+
+        with patch.object(Soundboard, "_stat") as mock_stat:
+            soundboard = Soundboard(mock_audio_manager, temp_sounds_dir, console, validation_cache=cache)
+
+        mock_stat.assert_not_called()
+        assert len(soundboard.sounds) == 4
+        assert cache.get(temp_sounds_dir / "sound1.wav", os.stat(temp_sounds_dir / "sound1.wav")) is not None
+
+    def test_uncached_files_are_validated_concurrently(
+        self,
+        console: Console,
+        tmp_path: Path,
+        mock_audio_manager: MagicMock,
+    ) -> None:
+        """Should overlap header reads instead of probing files one at a time."""
+        for i in range(20):
+            (tmp_path / f"sound{i:02d}.wav").write_bytes(b"RIFF")
+
+        def slow_validate(file_path: Path) -> AudioFileInfo:
+            time.sleep(0.05)
+            return AudioFileInfo(file_path, 1.0, 44100, 2, "WAV", is_valid=True)
+
+        start = time.perf_counter()
+        with patch("src.soundboard.validate_audio_file_safe", side_effect=slow_validate):
+            soundboard = Soundboard(mock_audio_manager, tmp_path, console)
+        elapsed = time.perf_counter() - start
+
+        assert len(soundboard.sounds) == 20
+        assert elapsed < 20 * 0.05 / 2
+
+    def test_uncached_files_are_validated_in_inode_order(
+        self,
+        console: Console,
+        temp_sounds_dir: Path,
+        mock_audio_manager: MagicMock,
+    ) -> None:
+        """Should read headers in on-disk order rather than listing order."""
+        inodes = {"sound1": 3, "sound2": 1, "sound3": 4, "sound4": 2}
+        validated: list[str] = []
+
+        def record_validate(file_path: Path) -> AudioFileInfo:
+            validated.append(file_path.stem)
+            return AudioFileInfo(file_path, 1.0, 44100, 2, "WAV", is_valid=True)
+
+        with (
+            patch.object(Soundboard, "VALIDATION_WORKERS", 1),
+            patch.object(
+                Soundboard,
+                "_entry_stat",
+                side_effect=lambda entry: MagicMock(st_dev=0, st_ino=inodes[Path(entry.name).stem]),
+            ),
+            patch("src.soundboard.validate_audio_file_safe", side_effect=record_validate),
+        ):
+            soundboard = Soundboard(mock_audio_manager, temp_sounds_dir, console)
+
+        assert validated == ["sound2", "sound4", "sound1", "sound3"]
+        assert len(soundboard.sounds) == 4
+
+    def test_startup_serves_saved_sound_index(
+        self,
+        console: Console,
+        temp_sounds_dir: Path,
+        tmp_path: Path,
+        mock_audio_manager: MagicMock,
+    ) -> None:
+        """Should list sounds from the saved index without walking the directory."""
+        index = SoundIndexCache(tmp_path / "sound_index.json")
+        cached = {"cached": temp_sounds_dir / "cached.wav"}
+        index.save(SoundIndexCache.key_for([temp_sounds_dir]), cached, {"cached": temp_sounds_dir}, [])
+
+        with (
+            patch.object(Soundboard, "_revalidate_sound_index"),
+            patch("src.soundboard.iter_audio_entries") as mock_walk,
+        ):
+            soundboard = Soundboard(mock_audio_manager, temp_sounds_dir, console, sound_index=index)
+
+        mock_walk.assert_not_called()
+        assert soundboard.sounds == cached
+
+    def test_background_rescan_replaces_stale_index(
+        self,
+        console: Console,
+        writable_sounds_dir: Path,
+        tmp_path: Path,
+        mock_audio_manager: MagicMock,
+    ) -> None:
+        """Should swap in the fresh scan and persist it once the rescan finishes."""
+        index = SoundIndexCache(tmp_path / "sound_index.json")
+        key = SoundIndexCache.key_for([writable_sounds_dir])
+        index.save(key, {"gone": writable_sounds_dir / "gone.wav"}, {"gone": writable_sounds_dir}, [])
+
+        soundboard = Soundboard(mock_audio_manager, writable_sounds_dir, console, sound_index=index)
+        soundboard.wait_for_rescan(timeout=5)
+
+        assert "gone" not in soundboard.sounds
+        assert len(soundboard.sounds) == 4
+        saved = SoundIndexCache(tmp_path / "sound_index.json").load(key)
+        assert saved is not None
+        assert saved[0] == soundboard.sounds
+
+    def test_empty_sound_index_is_a_miss(
+        self,
+        console: Console,
+        temp_sounds_dir: Path,
+        tmp_path: Path,
+        mock_audio_manager: MagicMock,
+    ) -> None:
+        """Should scan instead of serving a saved empty library."""
+        index = SoundIndexCache(tmp_path / "sound_index.json")
+        index.save(SoundIndexCache.key_for([temp_sounds_dir]), {}, {}, [])
+
+        soundboard = Soundboard(mock_audio_manager, temp_sounds_dir, console, sound_index=index)
+
+        assert soundboard._revalidate_thread is None
+        assert len(soundboard.sounds) == 4
+
+    def test_background_rescan_rebinds_hotkeys(
+        self,
+        console: Console,
+        writable_sounds_dir: Path,
+        tmp_path: Path,
+        mock_audio_manager: MagicMock,
+    ) -> None:
+        """Should rebind hotkeys and restart the listener when the library changed."""
+        index = SoundIndexCache(tmp_path / "sound_index.json")
+        index.save(
+            SoundIndexCache.key_for([writable_sounds_dir]),
+            {"gone": writable_sounds_dir / "gone.wav"},
+            {"gone": writable_sounds_dir},
+            [],
+        )
+        with patch.object(Soundboard, "_revalidate_sound_index"):
+            soundboard = Soundboard(mock_audio_manager, writable_sounds_dir, console, sound_index=index)
+        soundboard.setup_hotkeys(mode="default")
+        assert soundboard.hotkeys == {"<f1>": "gone"}
+        soundboard.listener = MagicMock()
+
+        with patch.object(soundboard, "start_listening") as mock_start:
+            soundboard._revalidate_sound_index()
+
+        assert soundboard.hotkeys == {
+            "<f1>": "sound1",
+            "<f2>": "sound2",
+            "<f3>": "sound3",
+            "<f4>": "sound4",
+        }
+        mock_start.assert_called_once()
+
+    def test_background_rescan_keeps_manual_hotkeys(
+        self,
+        console: Console,
+        writable_sounds_dir: Path,
+        tmp_path: Path,
+        mock_audio_manager: MagicMock,
+    ) -> None:
+        """Should keep set_hotkey bindings whose sound is still in the library."""
+        index = SoundIndexCache(tmp_path / "sound_index.json")
+        index.save(
+            SoundIndexCache.key_for([writable_sounds_dir]),
+            {"gone": writable_sounds_dir / "gone.wav", "sound2": writable_sounds_dir / "sound2.wav"},
+            {"gone": writable_sounds_dir, "sound2": writable_sounds_dir},
+            [],
+        )
+        with patch.object(Soundboard, "_revalidate_sound_index"):
+            soundboard = Soundboard(mock_audio_manager, writable_sounds_dir, console, sound_index=index)
+        soundboard.setup_hotkeys(mode="default")
+        soundboard.set_hotkey("<ctrl>+a", "sound2")
+        soundboard.set_hotkey("<ctrl>+b", "gone")
+
+        soundboard._revalidate_sound_index()
+
+        assert soundboard.hotkeys["<ctrl>+a"] == "sound2"
+        assert "<ctrl>+b" not in soundboard.hotkeys
+        assert soundboard.hotkeys["<f1>"] == "sound1"
+
+    def test_background_rescan_waits_for_hotkey_setup(
+        self,
+        console: Console,
+        writable_sounds_dir: Path,
+        tmp_path: Path,
+        mock_audio_manager: MagicMock,
+    ) -> None:
+        """Should not swap the library while the main thread is binding hotkeys."""
+        index = SoundIndexCache(tmp_path / "sound_index.json")
+        index.save(
+            SoundIndexCache.key_for([writable_sounds_dir]),
+            {"gone": writable_sounds_dir / "gone.wav"},
+            {"gone": writable_sounds_dir},
+            [],
+        )
+        with patch.object(Soundboard, "_revalidate_sound_index"):
+            soundboard = Soundboard(mock_audio_manager, writable_sounds_dir, console, sound_index=index)
+        soundboard.setup_hotkeys(mode="default")
+
+        with soundboard._hotkey_lock:
+            rescan = threading.Thread(target=soundboard._revalidate_sound_index)
+            rescan.start()
+            rescan.join(0.2)
+            # Still bound to the cached library while the lock is held
+            assert rescan.is_alive()
+            assert soundboard.hotkeys == {"<f1>": "gone"}
+        rescan.join(5)
+
+        assert soundboard.hotkeys["<f1>"] == "sound1"
+
 
 class TestSoundboardHotkeys:
     """Tests for hotkey functionality."""
@@ -125,11 +383,11 @@ class TestSoundboardHotkeys:
     def test_setup_default_hotkeys_limits_to_10(
         self,
         console: Console,
-        temp_dir: Path,
+        tmp_path: Path,
         mock_audio_manager: MagicMock,
     ) -> None:
         """Should only assign hotkeys to first 10 sounds."""
-        sounds_dir = temp_dir / "many_sounds"
+        sounds_dir = tmp_path / "many_sounds"
         sounds_dir.mkdir()
 
         # Create 15 sound files
@@ -225,6 +483,108 @@ class TestSoundboardPlayback:
         assert result is False
         mock_audio_manager.play_audio.assert_not_called()
 
+    def test_unscanned_play_finds_sound_without_walking(
+        self,
+        console: Console,
+        temp_sounds_dir: Path,
+        mock_audio_manager: MagicMock,
+    ) -> None:
+        """Should probe <name><ext> directly instead of scanning the library."""
+        with patch("src.soundboard.iter_audio_entries") as mock_walk:
+            soundboard = Soundboard(mock_audio_manager, temp_sounds_dir, console, scan=False)
+            result = soundboard.play_sound("sound2")
+
+        assert result is True
+        mock_walk.assert_not_called()
+        mock_audio_manager.play_audio.assert_called_once_with(
+            temp_sounds_dir / "sound2.mp3",
+            blocking=False,
+            sound_volume=1.0,
+        )
+
+    def test_quick_lookup_never_scans_directories(
+        self,
+        console: Console,
+        temp_sounds_dir: Path,
+        mock_audio_manager: MagicMock,
+    ) -> None:
+        """Should find a sound from a single isfile probe, even if listing directories fails."""
+        target = temp_sounds_dir / "x.wav"
+        with (
+            patch("src.soundboard.os.path.isfile", side_effect=lambda path: path == target),
+            patch("os.scandir", side_effect=OSError("no listing")),
+        ):
+            soundboard = Soundboard(mock_audio_manager, temp_sounds_dir, console, scan=False)
+            with patch.object(soundboard, "_validate_file", return_value=MagicMock(is_valid=True)):
+                assert soundboard._quick_lookup("x") == target
+
+    def test_quick_lookup_declines_ambiguous_names(
+        self,
+        console: Console,
+        writable_sounds_dir: Path,
+        mock_audio_manager: MagicMock,
+    ) -> None:
+        """Should leave names with several top-level files to the full scan."""
+        (writable_sounds_dir / "sound1.mp3").touch()
+        soundboard = Soundboard(mock_audio_manager, writable_sounds_dir, console, scan=False)
+
+        assert soundboard._quick_lookup("sound1") is None
+
+    def test_quick_lookup_agrees_with_scan_for_shadowed_names(
+        self,
+        console: Console,
+        writable_sounds_dir: Path,
+        mock_audio_manager: MagicMock,
+    ) -> None:
+        """Should pick the same top-level file the scan keeps over a subdirectory copy."""
+        (writable_sounds_dir / "subdir" / "sound1.flac").touch()
+
+        soundboard = Soundboard(mock_audio_manager, writable_sounds_dir, console, scan=False)
+        quick = soundboard._quick_lookup("sound1")
+        soundboard._scan_sounds()
+
+        assert quick == writable_sounds_dir / "sound1.wav"
+        assert soundboard.sounds["sound1"] == quick
+
+    def test_unscanned_play_scans_on_miss(
+        self,
+        console: Console,
+        temp_sounds_dir: Path,
+        mock_audio_manager: MagicMock,
+    ) -> None:
+        """Should fall back to a full scan for sounds outside the top level."""
+        soundboard = Soundboard(mock_audio_manager, temp_sounds_dir, console, scan=False)
+        assert not soundboard.sounds
+
+        result = soundboard.play_sound("sound4")
+
+        assert result is True
+        assert len(soundboard.sounds) == 4
+
+    def test_concurrent_unscanned_plays_scan_once(
+        self,
+        console: Console,
+        temp_sounds_dir: Path,
+        mock_audio_manager: MagicMock,
+    ) -> None:
+        """Should run a single library scan when two misses arrive at once."""
+        soundboard = Soundboard(mock_audio_manager, temp_sounds_dir, console, scan=False)
+        collect = Soundboard._collect_sounds
+
+        def slow_collect(self: Soundboard) -> object:
+            time.sleep(0.05)
+            return collect(self)
+
+        with patch.object(Soundboard, "_collect_sounds", autospec=True, side_effect=slow_collect) as mock_collect:
+            threads = [threading.Thread(target=soundboard.play_sound, args=("sound4",)) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert mock_collect.call_count == 1
+        assert mock_audio_manager.play_audio.call_count == 2
+
     def test_play_sound_blocking(self, console: Console, temp_sounds_dir: Path, mock_audio_manager: MagicMock) -> None:
         """Should pass blocking parameter to audio manager."""
         soundboard = Soundboard(mock_audio_manager, temp_sounds_dir, console)
@@ -252,52 +612,89 @@ class TestSoundboardListing:
 
     def test_list_sounds_shows_all(
         self,
-        console: Console,
+        recording_console: Console,
         temp_sounds_dir: Path,
         mock_audio_manager: MagicMock,
     ) -> None:
         """Should display all sounds in table."""
-        soundboard = Soundboard(mock_audio_manager, temp_sounds_dir, console)
+        soundboard = Soundboard(mock_audio_manager, temp_sounds_dir, recording_console)
         soundboard.list_sounds()
 
-        output = console.export_text()
+        output = recording_console.export_text()
         assert "sound1" in output
         assert "sound2" in output
         assert "sound3" in output
 
-    def test_list_sounds_empty(self, console: Console, temp_dir: Path, mock_audio_manager: MagicMock) -> None:
+    def test_list_sounds_shows_first_bound_hotkey(
+        self,
+        recording_console: Console,
+        temp_sounds_dir: Path,
+        mock_audio_manager: MagicMock,
+    ) -> None:
+        """Should show the first hotkey bound to each sound."""
+        soundboard = Soundboard(mock_audio_manager, temp_sounds_dir, recording_console)
+        soundboard.hotkeys = {"<f5>": "sound2", "<f1>": "sound1", "<f9>": "sound2"}
+
+        assert soundboard.hotkeys_by_sound() == {"sound1": "<f1>", "sound2": "<f5>"}
+
+        soundboard.list_sounds()
+        output = recording_console.export_text()
+        assert "<F5>" in output
+        assert "<F9>" not in output
+
+    def test_sorted_sound_names_refreshes_on_rescan(
+        self,
+        console: Console,
+        writable_sounds_dir: Path,
+        mock_audio_manager: MagicMock,
+    ) -> None:
+        """Should reuse the sorted names until the sounds are rescanned."""
+        soundboard = Soundboard(mock_audio_manager, writable_sounds_dir, console)
+        names = soundboard.sorted_sound_names
+
+        assert names == ["sound1", "sound2", "sound3", "sound4"]
+        assert soundboard.sorted_sound_names is names
+
+        (writable_sounds_dir / "sound0.wav").touch()
+        soundboard._scan_sounds()
+
+        assert soundboard.sorted_sound_names[0] == "sound0"
+
+    def test_list_sounds_empty(self, recording_console: Console, tmp_path: Path, mock_audio_manager: MagicMock) -> None:
         """Should show message when no sounds available."""
-        empty_dir = temp_dir / "empty"
+        empty_dir = tmp_path / "empty"
         empty_dir.mkdir()
 
-        soundboard = Soundboard(mock_audio_manager, empty_dir, console)
+        soundboard = Soundboard(mock_audio_manager, empty_dir, recording_console)
         soundboard.list_sounds()
 
-        output = console.export_text()
+        output = recording_console.export_text()
         assert "No sounds available" in output
 
     def test_list_hotkeys_shows_bindings(
         self,
-        console: Console,
+        recording_console: Console,
         temp_sounds_dir: Path,
         mock_audio_manager: MagicMock,
     ) -> None:
         """Should display all hotkey bindings."""
-        soundboard = Soundboard(mock_audio_manager, temp_sounds_dir, console)
+        soundboard = Soundboard(mock_audio_manager, temp_sounds_dir, recording_console)
         soundboard.setup_default_hotkeys()
         soundboard.list_hotkeys()
 
-        output = console.export_text()
+        output = recording_console.export_text()
         assert "<F1>" in output.upper()
         assert "sound1" in output
 
-    def test_list_hotkeys_empty(self, console: Console, temp_sounds_dir: Path, mock_audio_manager: MagicMock) -> None:
+    def test_list_hotkeys_empty(
+        self, recording_console: Console, temp_sounds_dir: Path, mock_audio_manager: MagicMock
+    ) -> None:
         """Should show message when no hotkeys configured."""
-        soundboard = Soundboard(mock_audio_manager, temp_sounds_dir, console)
+        soundboard = Soundboard(mock_audio_manager, temp_sounds_dir, recording_console)
         # Don't call setup_default_hotkeys()
         soundboard.list_hotkeys()
 
-        output = console.export_text()
+        output = recording_console.export_text()
         assert "No hotkeys configured" in output
 
 
@@ -306,17 +703,17 @@ class TestSoundboardListener:
 
     def test_start_listening_without_hotkeys(
         self,
-        console: Console,
+        recording_console: Console,
         temp_sounds_dir: Path,
         mock_audio_manager: MagicMock,
     ) -> None:
         """Should warn when starting listener without hotkeys."""
-        soundboard = Soundboard(mock_audio_manager, temp_sounds_dir, console)
+        soundboard = Soundboard(mock_audio_manager, temp_sounds_dir, recording_console)
         # Don't setup hotkeys
 
         soundboard.start_listening()
 
-        output = console.export_text()
+        output = recording_console.export_text()
         assert "No hotkeys configured" in output
 
     def test_start_listening_creates_listener(
@@ -334,6 +731,26 @@ class TestSoundboardListener:
 
         mock_pynput.GlobalHotKeys.assert_called_once()
 
+    def test_hotkey_handler_plays_bound_sound(
+        self,
+        console: Console,
+        temp_sounds_dir: Path,
+        mock_audio_manager: MagicMock,
+        mock_pynput: MagicMock,
+    ) -> None:
+        """Should register handlers that play the bound sound and record the play."""
+        metadata = MagicMock()
+        metadata.get_metadata.return_value.volume = 0.5
+        soundboard = Soundboard(mock_audio_manager, temp_sounds_dir, console, metadata_manager=metadata)
+        soundboard.hotkeys = {"<f1>": "sound2"}
+
+        soundboard.start_listening()
+        handlers = mock_pynput.GlobalHotKeys.call_args.args[0]
+        handlers["<f1>"]()
+
+        mock_audio_manager.play_audio.assert_called_once_with(temp_sounds_dir / "sound2.mp3", sound_volume=0.5)
+        metadata.record_play.assert_called_once_with("sound2")
+
     def test_stop_listening_stops_listener(
         self,
         console: Console,
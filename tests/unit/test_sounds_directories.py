@@ -1,30 +1,18 @@
 # Copyright (c) 2025. All rights reserved.
 """Tests for sounds directories manager module."""
 
-import tempfile
-from collections.abc import Generator
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from rich.console import Console
 
-from src.sounds_directories import SoundsDirectoryManager
+from src.sounds_directories import SoundsDirectoryManager, iter_audio_files
 
 
 class TestSoundsDirectoryManager:
     """Test the SoundsDirectoryManager class."""
 
-    @pytest.fixture
-    def temp_dir(self) -> Generator[Path]:
-        """Create a temporary directory.
-
-        Yields:
-            Path: Temporary directory path.
-
-        """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
-
     @pytest.fixture
     def console(self) -> Console:
         """Create a console for testing.
@@ -40,10 +28,10 @@ class TestSoundsDirectoryManager:
         manager = SoundsDirectoryManager()
         assert manager.directories == []
 
-    def test_initialization_with_directories(self, temp_dir: Path) -> None:
+    def test_initialization_with_directories(self, tmp_path: Path) -> None:
         """Test initialization with directories."""
-        dir1 = temp_dir / "sounds1"
-        dir2 = temp_dir / "sounds2"
+        dir1 = tmp_path / "sounds1"
+        dir2 = tmp_path / "sounds2"
         dir1.mkdir()
         dir2.mkdir()
 
@@ -52,71 +40,63 @@ class TestSoundsDirectoryManager:
         assert dir1.resolve() in manager.directories
         assert dir2.resolve() in manager.directories
 
-    def test_add_directory(self, temp_dir: Path) -> None:
+    def test_add_directory(self, tmp_path: Path) -> None:
         """Test adding a directory."""
         manager = SoundsDirectoryManager()
-        sounds_dir = temp_dir / "sounds"
+        sounds_dir = tmp_path / "sounds"
         sounds_dir.mkdir()
 
         assert manager.add_directory(sounds_dir)
         assert sounds_dir.resolve() in manager.directories
 
-    def test_add_directory_creates_if_not_exists(self, temp_dir: Path) -> None:
+    def test_add_directory_creates_if_not_exists(self, tmp_path: Path) -> None:
         """Test that add_directory creates the directory if it doesn't exist."""
         manager = SoundsDirectoryManager()
-        sounds_dir = temp_dir / "new_sounds"
+        sounds_dir = tmp_path / "new_sounds"
 
         assert not sounds_dir.exists()
         assert manager.add_directory(sounds_dir)
         assert sounds_dir.exists()
 
-    def test_add_directory_duplicate_returns_false(self, temp_dir: Path) -> None:
+    def test_add_directory_duplicate_returns_false(self, tmp_path: Path) -> None:
         """Test that adding a duplicate directory returns False."""
         manager = SoundsDirectoryManager()
-        sounds_dir = temp_dir / "sounds"
+        sounds_dir = tmp_path / "sounds"
         sounds_dir.mkdir()
 
         assert manager.add_directory(sounds_dir)
         assert not manager.add_directory(sounds_dir)
 
-    def test_remove_directory(self, temp_dir: Path) -> None:
+    def test_remove_directory(self, tmp_path: Path) -> None:
         """Test removing a directory."""
-        sounds_dir = temp_dir / "sounds"
+        sounds_dir = tmp_path / "sounds"
         sounds_dir.mkdir()
 
         manager = SoundsDirectoryManager([sounds_dir])
         assert manager.remove_directory(sounds_dir)
         assert sounds_dir.resolve() not in manager.directories
 
-    def test_remove_directory_not_found(self, temp_dir: Path) -> None:
+    def test_remove_directory_not_found(self, tmp_path: Path) -> None:
         """Test removing a directory that's not in the list."""
         manager = SoundsDirectoryManager()
-        sounds_dir = temp_dir / "sounds"
+        sounds_dir = tmp_path / "sounds"
 
         assert not manager.remove_directory(sounds_dir)
 
-    def test_scan_all_single_directory(self, temp_dir: Path) -> None:
+    def test_scan_all_single_directory(self, temp_sounds_dir: Path) -> None:
         """Test scanning a single directory."""
-        sounds_dir = temp_dir / "sounds"
-        sounds_dir.mkdir()
-
-        # Create test files
-        (sounds_dir / "sound1.wav").touch()
-        (sounds_dir / "sound2.mp3").touch()
-        (sounds_dir / "readme.txt").touch()  # Should be ignored
-
-        manager = SoundsDirectoryManager([sounds_dir])
+        manager = SoundsDirectoryManager([temp_sounds_dir])
         sounds = manager.scan_all()
 
         assert "sound1" in sounds
         assert "sound2" in sounds
         assert "readme" not in sounds
-        assert len(sounds) == 2
+        assert len(sounds) == 4
 
-    def test_scan_all_multiple_directories(self, temp_dir: Path) -> None:
+    def test_scan_all_multiple_directories(self, tmp_path: Path) -> None:
         """Test scanning multiple directories."""
-        dir1 = temp_dir / "sounds1"
-        dir2 = temp_dir / "sounds2"
+        dir1 = tmp_path / "sounds1"
+        dir2 = tmp_path / "sounds2"
         dir1.mkdir()
         dir2.mkdir()
 
@@ -130,10 +110,10 @@ class TestSoundsDirectoryManager:
         assert "sound2" in sounds
         assert len(sounds) == 2
 
-    def test_scan_all_later_directory_overrides(self, temp_dir: Path) -> None:
+    def test_scan_all_later_directory_overrides(self, tmp_path: Path) -> None:
         """Test that later directories override earlier ones for same name."""
-        dir1 = temp_dir / "sounds1"
-        dir2 = temp_dir / "sounds2"
+        dir1 = tmp_path / "sounds1"
+        dir2 = tmp_path / "sounds2"
         dir1.mkdir()
         dir2.mkdir()
 
@@ -151,10 +131,27 @@ class TestSoundsDirectoryManager:
         assert source_dir == dir2.resolve()
         assert file_path == file2
 
-    def test_scan_all_ignores_missing_directories(self, temp_dir: Path) -> None:
+    def test_scan_all_matches_find_sound_for_duplicates(self, tmp_path: Path) -> None:
+        """Test that scan_all picks the same winner as find_sound, within and across directories."""
+        dirs = [tmp_path / f"sounds{i}" for i in range(3)]
+        for directory in dirs:
+            (directory / "nested").mkdir(parents=True)
+        (dirs[0] / "shared.wav").touch()
+        (dirs[1] / "shared.wav").touch()
+        (dirs[1] / "nested" / "shared.mp3").touch()
+        (dirs[2] / "only.wav").touch()
+
+        manager = SoundsDirectoryManager(dirs)
+        sounds = manager.scan_all()
+
+        assert set(sounds) == {"shared", "only"}
+        assert sounds["shared"] == manager.find_sound("shared")
+        assert sounds["shared"][0] == dirs[1].resolve()
+
+    def test_scan_all_ignores_missing_directories(self, tmp_path: Path) -> None:
         """Test that scan_all ignores directories that don't exist."""
-        existing = temp_dir / "existing"
-        missing = temp_dir / "missing"
+        existing = tmp_path / "existing"
+        missing = tmp_path / "missing"
         existing.mkdir()
 
         (existing / "sound.wav").touch()
@@ -165,38 +162,26 @@ class TestSoundsDirectoryManager:
         assert "sound" in sounds
         assert len(sounds) == 1
 
-    def test_scan_all_recursive(self, temp_dir: Path) -> None:
+    def test_scan_all_recursive(self, temp_sounds_dir: Path) -> None:
         """Test that scan_all finds files in subdirectories."""
-        sounds_dir = temp_dir / "sounds"
-        subdir = sounds_dir / "subdir"
-        sounds_dir.mkdir()
-        subdir.mkdir()
-
-        (sounds_dir / "sound1.wav").touch()
-        (subdir / "sound2.wav").touch()
-
-        manager = SoundsDirectoryManager([sounds_dir])
+        manager = SoundsDirectoryManager([temp_sounds_dir])
         sounds = manager.scan_all()
 
         assert "sound1" in sounds
-        assert "sound2" in sounds
+        assert sounds["sound4"][1] == temp_sounds_dir.resolve() / "subdir" / "sound4.flac"
 
-    def test_scan_directory(self, temp_dir: Path) -> None:
+    def test_scan_directory(self, temp_sounds_dir: Path) -> None:
         """Test scanning a single directory without adding to manager."""
-        sounds_dir = temp_dir / "sounds"
-        sounds_dir.mkdir()
-        (sounds_dir / "sound.wav").touch()
-
         manager = SoundsDirectoryManager()
-        sounds = manager.scan_directory(sounds_dir)
+        sounds = manager.scan_directory(temp_sounds_dir)
 
-        assert "sound" in sounds
+        assert "sound1" in sounds
         assert len(manager.directories) == 0  # Not added to manager
 
-    def test_get_sound_counts(self, temp_dir: Path) -> None:
+    def test_get_sound_counts(self, tmp_path: Path) -> None:
         """Test getting sound counts per directory."""
-        dir1 = temp_dir / "sounds1"
-        dir2 = temp_dir / "sounds2"
+        dir1 = tmp_path / "sounds1"
+        dir2 = tmp_path / "sounds2"
         dir1.mkdir()
         dir2.mkdir()
 
@@ -210,10 +195,10 @@ class TestSoundsDirectoryManager:
         assert counts[dir1.resolve()] == 2
         assert counts[dir2.resolve()] == 1
 
-    def test_get_directories_as_strings(self, temp_dir: Path) -> None:
+    def test_get_directories_as_strings(self, tmp_path: Path) -> None:
         """Test getting directories as string list."""
-        dir1 = temp_dir / "sounds1"
-        dir2 = temp_dir / "sounds2"
+        dir1 = tmp_path / "sounds1"
+        dir2 = tmp_path / "sounds2"
         dir1.mkdir()
         dir2.mkdir()
 
@@ -223,10 +208,10 @@ class TestSoundsDirectoryManager:
         assert len(strings) == 2
         assert all(isinstance(s, str) for s in strings)
 
-    def test_from_strings(self, temp_dir: Path) -> None:
+    def test_from_strings(self, tmp_path: Path) -> None:
         """Test creating manager from string list."""
-        dir1 = temp_dir / "sounds1"
-        dir2 = temp_dir / "sounds2"
+        dir1 = tmp_path / "sounds1"
+        dir2 = tmp_path / "sounds2"
         dir1.mkdir()
         dir2.mkdir()
 
@@ -234,23 +219,18 @@ class TestSoundsDirectoryManager:
 
         assert len(manager.directories) == 2
 
-    def test_find_sound(self, temp_dir: Path) -> None:
+    def test_find_sound(self, temp_sounds_dir: Path) -> None:
         """Test finding a specific sound."""
-        sounds_dir = temp_dir / "sounds"
-        sounds_dir.mkdir()
-        sound_file = sounds_dir / "target.wav"
-        sound_file.touch()
-
-        manager = SoundsDirectoryManager([sounds_dir])
-        result = manager.find_sound("target")
+        manager = SoundsDirectoryManager([temp_sounds_dir])
+        result = manager.find_sound("sound2")
 
         assert result is not None
         _source_dir, file_path = result
-        assert file_path == sound_file
+        assert file_path == temp_sounds_dir.resolve() / "sound2.mp3"
 
-    def test_find_sound_not_found(self, temp_dir: Path) -> None:
+    def test_find_sound_not_found(self, tmp_path: Path) -> None:
         """Test finding a sound that doesn't exist."""
-        sounds_dir = temp_dir / "sounds"
+        sounds_dir = tmp_path / "sounds"
         sounds_dir.mkdir()
 
         manager = SoundsDirectoryManager([sounds_dir])
@@ -258,10 +238,24 @@ class TestSoundsDirectoryManager:
 
         assert result is None
 
-    def test_find_sound_returns_last_match(self, temp_dir: Path) -> None:
+    def test_top_level_shadows_subdirectories(self, tmp_path: Path) -> None:
+        """Test that a top-level file wins over a same-named file in a subdirectory."""
+        sounds_dir = tmp_path / "sounds"
+        (sounds_dir / "nested").mkdir(parents=True)
+        top = sounds_dir / "sound.wav"
+        top.touch()
+        (sounds_dir / "nested" / "sound.mp3").touch()
+
+        manager = SoundsDirectoryManager([sounds_dir])
+
+        assert manager.scan_directory(sounds_dir)["sound"] == top.resolve()
+        assert manager.scan_all()["sound"] == (sounds_dir.resolve(), top.resolve())
+        assert manager.find_sound("sound") == (sounds_dir.resolve(), top.resolve())
+
+    def test_find_sound_returns_last_match(self, tmp_path: Path) -> None:
         """Test that find_sound returns the last match (override behavior)."""
-        dir1 = temp_dir / "sounds1"
-        dir2 = temp_dir / "sounds2"
+        dir1 = tmp_path / "sounds1"
+        dir2 = tmp_path / "sounds2"
         dir1.mkdir()
         dir2.mkdir()
 
@@ -277,10 +271,10 @@ class TestSoundsDirectoryManager:
         source_dir, _file_path = result
         assert source_dir == dir2.resolve()
 
-    def test_get_conflicts(self, temp_dir: Path) -> None:
+    def test_get_conflicts(self, tmp_path: Path) -> None:
         """Test getting sounds with name conflicts."""
-        dir1 = temp_dir / "sounds1"
-        dir2 = temp_dir / "sounds2"
+        dir1 = tmp_path / "sounds1"
+        dir2 = tmp_path / "sounds2"
         dir1.mkdir()
         dir2.mkdir()
 
@@ -297,10 +291,10 @@ class TestSoundsDirectoryManager:
         assert "unique" not in conflicts
         assert len(conflicts["conflict"]) == 2
 
-    def test_get_conflicts_no_conflicts(self, temp_dir: Path) -> None:
+    def test_get_conflicts_no_conflicts(self, tmp_path: Path) -> None:
         """Test get_conflicts when there are no conflicts."""
-        dir1 = temp_dir / "sounds1"
-        dir2 = temp_dir / "sounds2"
+        dir1 = tmp_path / "sounds1"
+        dir2 = tmp_path / "sounds2"
         dir1.mkdir()
         dir2.mkdir()
 
@@ -312,13 +306,9 @@ class TestSoundsDirectoryManager:
 
         assert len(conflicts) == 0
 
-    def test_list_directories(self, temp_dir: Path, console: Console) -> None:
+    def test_list_directories(self, temp_sounds_dir: Path, console: Console) -> None:
         """Test list_directories outputs a table."""
-        sounds_dir = temp_dir / "sounds"
-        sounds_dir.mkdir()
-        (sounds_dir / "sound.wav").touch()
-
-        manager = SoundsDirectoryManager([sounds_dir])
+        manager = SoundsDirectoryManager([temp_sounds_dir])
         manager.list_directories(console)
 
         output = console.export_text()
@@ -332,10 +322,10 @@ class TestSoundsDirectoryManager:
         output = console.export_text()
         assert "No sounds directories configured" in output
 
-    def test_show_conflicts(self, temp_dir: Path, console: Console) -> None:
+    def test_show_conflicts(self, tmp_path: Path, console: Console) -> None:
         """Test show_conflicts outputs conflict information."""
-        dir1 = temp_dir / "sounds1"
-        dir2 = temp_dir / "sounds2"
+        dir1 = tmp_path / "sounds1"
+        dir2 = tmp_path / "sounds2"
         dir1.mkdir()
         dir2.mkdir()
 
@@ -348,9 +338,9 @@ class TestSoundsDirectoryManager:
         output = console.export_text()
         assert "conflict" in output.lower()
 
-    def test_show_conflicts_no_conflicts(self, temp_dir: Path, console: Console) -> None:
+    def test_show_conflicts_no_conflicts(self, tmp_path: Path, console: Console) -> None:
         """Test show_conflicts when there are no conflicts."""
-        sounds_dir = temp_dir / "sounds"
+        sounds_dir = tmp_path / "sounds"
         sounds_dir.mkdir()
         (sounds_dir / "unique.wav").touch()
 
@@ -360,9 +350,9 @@ class TestSoundsDirectoryManager:
         output = console.export_text()
         assert "No sound name conflicts found" in output
 
-    def test_supported_formats(self, temp_dir: Path) -> None:
+    def test_supported_formats(self, tmp_path: Path) -> None:
         """Test that all supported formats are detected."""
-        sounds_dir = temp_dir / "sounds"
+        sounds_dir = tmp_path / "sounds"
         sounds_dir.mkdir()
 
         # Create files with all supported extensions
@@ -381,3 +371,47 @@ class TestSoundsDirectoryManager:
         assert "c" in sounds
         assert "d" in sounds
         assert "e" in sounds
+
+    def test_scan_matches_extensions_case_insensitively(self, tmp_path: Path) -> None:
+        """Test that scanning matches upper-case extensions and skips non-files."""
+        sounds_dir = tmp_path / "sounds"
+        (sounds_dir / "folder.wav").mkdir(parents=True)
+        (sounds_dir / "LOUD.WAV").touch()
+        (sounds_dir / "multi.part.mp3").touch()
+        (sounds_dir / ".wav").touch()
+        (sounds_dir / "notes.txt").touch()
+
+        sounds = dict(iter_audio_files(sounds_dir))
+
+        assert sounds == {
+            "LOUD": sounds_dir / "LOUD.WAV",
+            "multi.part": sounds_dir / "multi.part.mp3",
+        }
+
+    def test_scan_skips_hidden_directories(self, tmp_path: Path) -> None:
+        """Test that hidden folders such as .git or .Trashes are not walked."""
+        sounds_dir = tmp_path / "sounds"
+        (sounds_dir / ".Trashes").mkdir(parents=True)
+        (sounds_dir / ".Trashes" / "deleted.wav").touch()
+        (sounds_dir / "kept.wav").touch()
+
+        assert dict(iter_audio_files(sounds_dir)) == {"kept": sounds_dir / "kept.wav"}
+
+    def test_queries_share_one_walk_until_refresh(self, tmp_path: Path) -> None:
+        """Test that directory queries reuse the index until it is refreshed."""
+        sounds_dir = tmp_path / "sounds"
+        sounds_dir.mkdir()
+        (sounds_dir / "one.wav").touch()
+        manager = SoundsDirectoryManager([sounds_dir])
+
+        with patch("src.sounds_directories.iter_audio_files", wraps=iter_audio_files) as mock_walk:
+            assert manager.get_sound_counts() == {sounds_dir.resolve(): 1}
+            assert manager.find_sound("one") is not None
+            assert manager.get_conflicts() == {}
+            assert mock_walk.call_count == 1
+
+        (sounds_dir / "two.wav").touch()
+        assert manager.find_sound("two") is None
+
+        manager.refresh()
+        assert manager.find_sound("two") is not None
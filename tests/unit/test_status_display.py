@@ -129,6 +129,14 @@ class TestStatusDisplay:
         mock_live.stop.assert_called_once()
         assert status_display._stop_event.is_set()
 
+    def test_display_state_tracks_shown_values(self, status_display: StatusDisplay) -> None:
+        """Test that the display state reflects a newly played sound."""
+        before = status_display._display_state()
+
+        status_display.update_playing("airhorn", "<f1>")
+
+        assert status_display._display_state() != before
+
 
 class TestStatusDisplayEdgeCases:
     """Edge case tests for StatusDisplay."""
@@ -1,12 +1,12 @@
 # Copyright (c) 2025. All rights reserved.
 """Unit tests for validators module."""
 
-import json
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
+import soundfile as sf
 
 from src.exceptions import (
     AudioFileCorruptedError,
@@ -30,6 +30,19 @@ from src.validators import (
 )
 
 
+@pytest.fixture
+def mock_sf_info(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Make sf.info report a 2.5 s stereo 44.1 kHz WAV for any file.
+
+    Returns:
+        The info object sf.info returns.
+
+    """
+    info = MagicMock(duration=2.5, samplerate=44100, channels=2, format="WAV")
+    monkeypatch.setattr("src.validators.sf.info", lambda _: info)
+    return info
+
+
 class TestSupportedFormats:
     """Tests for supported format constants."""
 
@@ -55,9 +68,9 @@ class TestSupportedFormats:
 class TestValidateAudioFile:
     """Tests for validate_audio_file function."""
 
-    def test_file_not_found(self, temp_dir: Path) -> None:
+    def test_file_not_found(self, tmp_path: Path) -> None:
         """Should raise AudioFileNotFoundError for missing files."""
-        missing_file = temp_dir / "nonexistent.wav"
+        missing_file = tmp_path / "nonexistent.wav"
 
         with pytest.raises(AudioFileNotFoundError) as exc_info:
             validate_audio_file(missing_file)
@@ -65,9 +78,9 @@ class TestValidateAudioFile:
         assert "nonexistent.wav" in exc_info.value.message
         assert exc_info.value.details["path"] == str(missing_file)
 
-    def test_unsupported_format(self, temp_dir: Path) -> None:
+    def test_unsupported_format(self, tmp_path: Path) -> None:
         """Should raise AudioFileUnsupportedError for unsupported formats."""
-        unsupported_file = temp_dir / "test.xyz"
+        unsupported_file = tmp_path / "test.xyz"
         unsupported_file.touch()
 
         with pytest.raises(AudioFileUnsupportedError) as exc_info:
@@ -76,9 +89,9 @@ class TestValidateAudioFile:
         assert ".xyz" in exc_info.value.message
         assert ".wav" in exc_info.value.suggestion  # Suggests valid formats
 
-    def test_corrupted_file(self, temp_dir: Path) -> None:
+    def test_corrupted_file(self, tmp_path: Path) -> None:
         """Should raise AudioFileCorruptedError for unreadable files."""
-        corrupted_file = temp_dir / "corrupted.wav"
+        corrupted_file = tmp_path / "corrupted.wav"
         corrupted_file.write_bytes(b"not a valid wav file")
 
         with pytest.raises(AudioFileCorruptedError) as exc_info:
@@ -86,19 +99,12 @@ class TestValidateAudioFile:
 
         assert "corrupted.wav" in exc_info.value.message
 
-    def test_valid_file_mock(self, temp_dir: Path) -> None:
+    def test_valid_file_mock(self, tmp_path: Path, mock_sf_info: MagicMock) -> None:
         """Should return AudioFileInfo for valid files (mocked)."""
-        valid_file = temp_dir / "test.wav"
+        valid_file = tmp_path / "test.wav"
         valid_file.touch()
 
-        mock_info = MagicMock()
-        mock_info.duration = 2.5
-        mock_info.samplerate = 44100
-        mock_info.channels = 2
-        mock_info.format = "WAV"
-
-        with patch("src.validators.sf.info", return_value=mock_info):
-            result = validate_audio_file(valid_file)
+        result = validate_audio_file(valid_file)
 
         assert isinstance(result, AudioFileInfo)
         assert result.path == valid_file
@@ -107,13 +113,38 @@ class TestValidateAudioFile:
         assert result.channels == 2
         assert result.is_valid is True
 
+    def test_plain_wav_header_skips_soundfile(self, tmp_path: Path) -> None:
+        """Should read PCM WAV details from the header without calling sf.info."""
+        wav_file = tmp_path / "plain.wav"
+        sf.write(wav_file, np.zeros((22050, 2), dtype=np.float32), 44100, subtype="PCM_16")
+
+        with patch("src.validators.sf.info") as mock_info:
+            result = validate_audio_file(wav_file)
+
+        mock_info.assert_not_called()
+        assert result.duration == 0.5
+        assert result.sample_rate == 44100
+        assert result.channels == 2
+        assert result.format == "WAV"
+
+    def test_compressed_wav_falls_back_to_soundfile(self, tmp_path: Path) -> None:
+        """Should hand WAV codecs the header reader does not cover to sf.info."""
+        wav_file = tmp_path / "ulaw.wav"
+        sf.write(wav_file, np.zeros((8000, 1), dtype=np.float32), 8000, subtype="ULAW")
+
+        with patch("src.validators.sf.info", side_effect=sf.info) as mock_info:
+            result = validate_audio_file(wav_file)
+
+        mock_info.assert_called_once_with(str(wav_file))
+        assert result.duration == 1.0
+
 
 class TestValidateAudioFileSafe:
     """Tests for validate_audio_file_safe function."""
 
-    def test_returns_invalid_for_missing_file(self, temp_dir: Path) -> None:
+    def test_returns_invalid_for_missing_file(self, tmp_path: Path) -> None:
         """Should return invalid AudioFileInfo for missing files."""
-        missing_file = temp_dir / "missing.wav"
+        missing_file = tmp_path / "missing.wav"
 
         result = validate_audio_file_safe(missing_file)
 
@@ -121,9 +152,9 @@ class TestValidateAudioFileSafe:
         assert result.error is not None
         assert result.path == missing_file
 
-    def test_returns_invalid_for_corrupted_file(self, temp_dir: Path) -> None:
+    def test_returns_invalid_for_corrupted_file(self, tmp_path: Path) -> None:
         """Should return invalid AudioFileInfo for corrupted files."""
-        corrupted_file = temp_dir / "bad.wav"
+        corrupted_file = tmp_path / "bad.wav"
         corrupted_file.write_bytes(b"invalid")
 
         result = validate_audio_file_safe(corrupted_file)
@@ -131,19 +162,12 @@ class TestValidateAudioFileSafe:
         assert result.is_valid is False
         assert result.error is not None
 
-    def test_returns_valid_for_good_file_mock(self, temp_dir: Path) -> None:
+    def test_returns_valid_for_good_file_mock(self, tmp_path: Path, mock_sf_info: MagicMock) -> None:
         """Should return valid AudioFileInfo for good files (mocked)."""
-        valid_file = temp_dir / "good.wav"
+        valid_file = tmp_path / "good.wav"
         valid_file.touch()
 
-        mock_info = MagicMock()
-        mock_info.duration = 1.0
-        mock_info.samplerate = 48000
-        mock_info.channels = 1
-        mock_info.format = "WAV"
-
-        with patch("src.validators.sf.info", return_value=mock_info):
-            result = validate_audio_file_safe(valid_file)
+        result = validate_audio_file_safe(valid_file)
 
         assert result.is_valid is True
         assert result.error is None
@@ -206,6 +230,16 @@ class TestValidateDevice:
         assert result.output_channels == 2
         assert result.is_valid_output is True
 
+    def test_uses_given_device_list(self) -> None:
+        """Should validate against a provided device list without querying PortAudio."""
+        devices = [{"name": "Speakers", "max_input_channels": 0, "max_output_channels": 2}]
+
+        with patch("src.validators.sd.query_devices") as mock_query:
+            result = validate_device(0, devices)
+
+        mock_query.assert_not_called()
+        assert result.name == "Speakers"
+
 
 class TestValidateDeviceSafe:
     """Tests for validate_device_safe function."""
@@ -251,21 +285,12 @@ class TestValidateConfigData:
         assert result["volume"] == 0.75
         assert result["sounds_dir"] == "/path/to/sounds"
 
-    def test_clamps_volume_above_1(self) -> None:
-        """Should clamp volume above 1.0."""
-        data = {"volume": 1.5}
+    @pytest.mark.parametrize(("volume", "expected"), [(1.5, 1.0), (-0.5, 0.0)])
+    def test_clamps_out_of_range_volume(self, volume: float, expected: float) -> None:
+        """Should clamp volume into [0.0, 1.0]."""
+        result = validate_config_data({"volume": volume})
 
-        result = validate_config_data(data)
-
-        assert result["volume"] == 1.0
-
-    def test_clamps_volume_below_0(self) -> None:
-        """Should clamp volume below 0.0."""
-        data = {"volume": -0.5}
-
-        result = validate_config_data(data)
-
-        assert result["volume"] == 0.0
+        assert result["volume"] == expected
 
     def test_rejects_invalid_device_id(self) -> None:
         """Should reject non-integer device ID."""
@@ -276,24 +301,13 @@ class TestValidateConfigData:
 
         assert "output_device_id" in str(exc_info.value.details)
 
-    def test_rejects_negative_device_id(self) -> None:
-        """Should reject negative device ID."""
-        data = {"output_device_id": -5}
-
-        with pytest.raises(ConfigInvalidFieldError):
-            validate_config_data(data)
-
-    def test_rejects_invalid_volume_type(self) -> None:
-        """Should reject non-numeric volume."""
-        data = {"volume": "loud"}
-
-        with pytest.raises(ConfigInvalidFieldError):
-            validate_config_data(data)
-
-    def test_rejects_invalid_sounds_dir_type(self) -> None:
-        """Should reject non-string sounds_dir."""
-        data = {"sounds_dir": 12345}
-
+    @pytest.mark.parametrize(
+        "data",
+        [{"output_device_id": -5}, {"volume": "loud"}, {"sounds_dir": 12345}],
+        ids=["negative_device_id", "volume_type", "sounds_dir_type"],
+    )
+    def test_rejects_invalid_field(self, data: dict) -> None:
+        """Should reject fields with the wrong type or range."""
         with pytest.raises(ConfigInvalidFieldError):
             validate_config_data(data)
 
@@ -317,41 +331,52 @@ class TestValidateConfigData:
 class TestValidateConfigFile:
     """Tests for validate_config_file function."""
 
-    def test_missing_file_returns_empty(self) -> None:
+    def test_missing_file_returns_empty(self, tmp_path: Path) -> None:
         """Should return empty dict for missing file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            missing_file = Path(tmpdir) / "missing.json"
+        missing_file = tmp_path / "missing.json"
 
-            result = validate_config_file(missing_file)
+        result = validate_config_file(missing_file)
 
-            assert result == {}
+        assert result == {}
 
-    def test_corrupted_json(self) -> None:
-        """Should raise ConfigCorruptedError for invalid JSON."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_file = Path(tmpdir) / "config.json"
-            config_file.write_text("{ invalid json }", encoding="utf-8")
+    @pytest.mark.parametrize("contents", ["{ invalid json }", ""], ids=["invalid_json", "empty"])
+    def test_unparseable_file_is_corrupted(self, temp_config_file: Path, contents: str) -> None:
+        """Should raise ConfigCorruptedError for invalid or empty JSON."""
+        temp_config_file.write_text(contents, encoding="utf-8")
 
-            with pytest.raises(ConfigCorruptedError):
-                validate_config_file(config_file)
+        with pytest.raises(ConfigCorruptedError):
+            validate_config_file(temp_config_file)
 
-    def test_valid_file(self) -> None:
+    def test_valid_file(self, temp_config_file: Path, sample_config_json: str) -> None:
         """Should return validated data for valid file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_file = Path(tmpdir) / "config.json"
-            data = {"output_device_id": 3, "volume": 0.5}
-            config_file.write_text(json.dumps(data), encoding="utf-8")
-
-            result = validate_config_file(config_file)
+        temp_config_file.write_text(sample_config_json, encoding="utf-8")
 
-            assert result["output_device_id"] == 3
-            assert result["volume"] == 0.5
+        result = validate_config_file(temp_config_file)
 
-    def test_empty_file_is_corrupted(self) -> None:
-        """Should treat empty file as corrupted."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_file = Path(tmpdir) / "config.json"
-            config_file.write_text("", encoding="utf-8")
+        assert result["output_device_id"] == 5
+        assert result["volume"] == 0.75
 
-            with pytest.raises(ConfigCorruptedError):
-                validate_config_file(config_file)
+    @pytest.mark.parametrize(
+        ("contents", "expected_device", "expected_volume"),
+        [
+            ('{"output_device_id": 5}', 5, 1.0),
+            ('{"output_device_id": 3, "volume": 0.8, "unknown_field": "x"}', 3, 0.8),
+            ('{"output_device_id": null, "volume": 0.5}', None, 0.5),
+        ],
+        ids=["missing_fields", "extra_fields", "null_values"],
+    )
+    def test_load_variants(
+        self,
+        temp_config_file: Path,
+        contents: str,
+        expected_device: int | None,
+        expected_volume: float,
+    ) -> None:
+        """Should fill defaults, ignore unknown keys and drop null values."""
+        temp_config_file.write_text(contents, encoding="utf-8")
+
+        result = validate_config_file(temp_config_file)
+
+        assert result.get("output_device_id") == expected_device
+        assert result["volume"] == expected_volume
+        assert "unknown_field" not in result